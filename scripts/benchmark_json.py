@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Per-path benchmark of the JSON codec backends.
+
+Times core.json_codec.loads()/dumps() on payloads shaped like the app's hot
+paths, once per installed backend (orjson, msgspec, json), and reports the
+time per operation and the speedup over the standard library:
+
+- kick_frame: a Pusher chat event, decoded twice (frame, then its data string)
+- chaturbate_frame: a SockJS "a[...]" frame of JSON strings, decoded twice
+- chat_log_write / chat_log_read: one JSONL chat log line
+- gql_response: a Twitch GraphQL batch of 100 channels
+- emote_set: a 7TV channel emote set with 1000 emotes
+- channel_store_write / channel_store_read: 1000 channel records
+
+Usage:
+    python scripts/benchmark_json.py
+    python scripts/benchmark_json.py --seconds 0.5 --backends json,orjson
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add src to path so we can import the app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def build_payloads(json_codec: Any) -> dict[str, tuple[str, Any]]:
+    """Return path name -> (operation kind for make_op(), input)."""
+    dumps = json_codec.dumps
+    message = {
+        "id": "3f1c9a2e-8d4b-4c1e-9f6a-2b7d5e8c1a90",
+        "chatroom_id": 123456,
+        "content": "that play was insane [emote:37226:KEKW] 🔥🔥",
+        "type": "message",
+        "created_at": "2025-01-20T18:32:11+00:00",
+        "sender": {
+            "id": 987654,
+            "username": "viewer_123",
+            "slug": "viewer-123",
+            "identity": {
+                "color": "#75FD46",
+                "badges": [{"type": "subscriber", "text": "Subscriber", "count": 6}],
+            },
+        },
+    }
+    kick_frame = dumps(
+        {
+            "event": "App\\Events\\ChatMessageEvent",
+            "data": dumps(message),
+            "channel": "chatrooms.123456.v2",
+        }
+    )
+    cb_message = {
+        "method": "onRoomMsg",
+        "args": [
+            "somebody",
+            dumps(
+                {"m": "hello there :smile", "c": "#494949", "f": "default", "X-Successful": True}
+            ),
+        ],
+    }
+    chaturbate_frame = "a" + dumps([dumps(cb_message) for _ in range(5)])
+    log_entry = {
+        "id": message["id"],
+        "user": {"id": "987654", "name": "viewer_123", "display_name": "Viewer_123"},
+        "text": message["content"],
+        "timestamp": message["created_at"],
+        "platform": "kick",
+        "badges": [{"id": "subscriber/6", "name": "Subscriber"}],
+        "emote_positions": [[30, 48, "37226"]],
+    }
+    gql = {
+        "data": {
+            "users": [
+                {
+                    "id": str(1000 + i),
+                    "login": f"channel_{i}",
+                    "displayName": f"Channel_{i}",
+                    "profileImageURL": f"https://static-cdn.jtvnw.net/u/{i}-70x70.png",
+                    "stream": {
+                        "id": str(5000 + i),
+                        "title": f"Stream number {i} — playing something fun",
+                        "viewersCount": i * 17,
+                        "createdAt": "2025-01-20T16:00:00Z",
+                        "game": {"id": "509658", "name": "Just Chatting"},
+                        "language": "en",
+                    }
+                    if i % 3 == 0
+                    else None,
+                }
+                for i in range(100)
+            ]
+        }
+    }
+    emote_set = {
+        "emote_set": {
+            "id": "01F6ME9FRG0005TFYTWP1H8R42",
+            "emotes": [
+                {
+                    "id": f"60ae{i:020x}",
+                    "name": f"emote{i}",
+                    "flags": i % 2,
+                    "data": {
+                        "id": f"60ae{i:020x}",
+                        "name": f"emote{i}",
+                        "animated": bool(i % 5 == 0),
+                        "host": {
+                            "url": f"//cdn.7tv.app/emote/60ae{i:020x}",
+                            "files": [
+                                {"name": f"{s}x.webp", "width": 32 * s, "height": 32 * s}
+                                for s in (1, 2, 3, 4)
+                            ],
+                        },
+                    },
+                }
+                for i in range(1000)
+            ],
+        }
+    }
+    records = [
+        {
+            "channel_id": f"channel_{i}",
+            "platform": ("twitch", "youtube", "kick", "chaturbate")[i % 4],
+            "display_name": f"Channel {i}",
+            "favorite": i % 10 == 0,
+            "notifications": True,
+            "added_at": "2024-06-01T12:00:00+00:00",
+            "last_live_time": "2025-01-19T22:15:00+00:00",
+        }
+        for i in range(1000)
+    ]
+    return {
+        "kick_frame": ("loads2", kick_frame),
+        "chaturbate_frame": ("sockjs", chaturbate_frame),
+        "chat_log_write": ("dumps", log_entry),
+        "chat_log_read": ("loads", dumps(log_entry)),
+        "gql_response": ("loads", dumps(gql)),
+        "emote_set": ("loads", dumps(emote_set)),
+        "channel_store_write": ("dumps_each", records),
+        "channel_store_read": ("loads_each", [dumps(r) for r in records]),
+    }
+
+
+def make_op(json_codec: Any, kind: str, value: Any) -> Callable[[], object]:
+    """Build the operation a path performs on its input."""
+    loads = json_codec.loads
+    dumps = json_codec.dumps
+    if kind == "loads":
+        return lambda: loads(value)
+    if kind == "dumps":
+        return lambda: dumps(value)
+    if kind == "loads2":
+        return lambda: loads(loads(value)["data"])
+    if kind == "sockjs":
+        return lambda: [loads(p) for p in loads(value[1:])]
+    if kind == "dumps_each":
+        return lambda: [dumps(r) for r in value]
+    if kind == "loads_each":
+        return lambda: [loads(r) for r in value]
+    raise ValueError(kind)
+
+
+def time_op(op: Callable[[], object], seconds: float) -> float:
+    """Seconds per call, from the best of three timed batches."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds / 10:
+            break
+        calls *= 2
+    best = elapsed / calls
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            op()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=0.3, help="Rough time per measurement")
+    parser.add_argument("--backends", default="", help="Comma-separated (default: all installed)")
+    args = parser.parse_args()
+
+    from livestream_list.core import json_codec
+
+    wanted = [b for b in args.backends.split(",") if b] or list(json_codec.BACKENDS)
+    backends = []
+    for name in wanted:
+        try:
+            json_codec.use_backend(name)
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+            continue
+        backends.append(name)
+
+    json_codec.use_backend("json")
+    payloads = build_payloads(json_codec)
+    results: dict[str, dict[str, float]] = {}
+    for name in backends:
+        json_codec.use_backend(name)
+        for path, (kind, value) in payloads.items():
+            results.setdefault(path, {})[name] = time_op(
+                make_op(json_codec, kind, value), args.seconds
+            )
+    json_codec.use_backend()
+
+    header = f"{'path':<22}" + "".join(f"{b + ' µs':>14}" for b in backends)
+    if "json" in backends:
+        header += "".join(f"{b + ' speedup':>18}" for b in backends if b != "json")
+    print(header)
+    for path, timings in results.items():
+        line = f"{path:<22}" + "".join(f"{timings[b] * 1e6:>14.2f}" for b in backends)
+        if "json" in backends:
+            line += "".join(
+                f"{timings['json'] / timings[b]:>17.1f}x" for b in backends if b != "json"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
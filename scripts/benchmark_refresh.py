@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""Offline benchmark for StreamMonitor.refresh() against local fake platform servers.
+
+Starts aiohttp stand-ins for the Twitch GQL/Helix, YouTube, Kick and
+Chaturbate endpoints in a separate process, then drives
+StreamMonitor.refresh() for each platform (and for all platforms together)
+at several channel counts. No network access is needed.
+
+Each scenario runs in a fresh process so its numbers are not skewed by the
+fake servers or by earlier scenarios. Reported per scenario and round:
+wall time, HTTP requests issued, CPU time of the client process (and of
+child processes such as yt-dlp), peak RSS, the number of live streams
+found versus expected, and the adaptive concurrency limits after the round.
+
+Usage:
+    python scripts/benchmark_refresh.py
+    python scripts/benchmark_refresh.py --sizes 100,1000 --platforms twitch,kick
+    python scripts/benchmark_refresh.py --latency-ms 80 --error-rate 0.01 --live-ratio 0.1
+    python scripts/benchmark_refresh.py --ytdlp-latency-ms 400   # fake yt-dlp second pass
+    python scripts/benchmark_refresh.py --ytdlp-latency-ms 400 --no-ytdlp-pool
+    python scripts/benchmark_refresh.py --json results.json      # machine-readable output
+
+The real yt-dlp cannot be pointed at a local server, so the YouTube
+second pass is disabled unless --ytdlp-latency-ms is given, in which case a
+stand-in yt-dlp script that sleeps and prints canned JSON is used (run
+through a pool of equally slow stand-in workers unless --no-ytdlp-pool is
+given). Pool workers outlive the rounds, so their CPU time is not reported.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import random
+import re
+import resource
+import stat
+import sys
+import tempfile
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+# Add src to path so we can import the app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+PLATFORMS = ("twitch", "youtube", "kick", "chaturbate")
+DEFAULT_SIZES = "100,1000,10000"
+
+# Hosts the API clients talk to; the fake server serves each under /<host>/...
+HOST_PLATFORMS = {
+    "gql.twitch.tv": "twitch",
+    "api.twitch.tv": "twitch",
+    "id.twitch.tv": "twitch",
+    "www.youtube.com": "youtube",
+    "kick.com": "kick",
+    "chaturbate.com": "chaturbate",
+}
+
+
+# ── Channel naming and live state (shared by server and client) ─────
+
+
+def channel_ids(platform: str, count: int) -> list[str]:
+    """Deterministic channel ids for a platform."""
+    if platform == "youtube":
+        return [f"UCbench{i:016d}" for i in range(count)]
+    prefix = {"twitch": "benchtw", "kick": "benchkick", "chaturbate": "benchcb"}[platform]
+    return [f"{prefix}_{i}" for i in range(count)]
+
+
+def is_live(channel_id: str, live_ratio: float) -> bool:
+    """Stable pseudo-random live state for a channel."""
+    return zlib.crc32(channel_id.lower().encode()) % 10_000 < live_ratio * 10_000
+
+
+def video_id_for(channel_id: str) -> str:
+    """Video id of a YouTube channel's fake live stream."""
+    return f"v{zlib.crc32(channel_id.encode()):010d}"
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# ── Fake platform servers ───────────────────────────────────────────
+
+
+_FILLER_CHUNK = (
+    '<script nonce="bench">(function(){var a={"k":"v","n":[1,2,3]};'
+    "window.ytcfg=window.ytcfg||{};ytcfg.set(a);})();</script>\n"
+)
+
+
+def _filler(kb: int) -> str:
+    """Page padding approximating the bulk of a real YouTube page."""
+    size = kb * 1024
+    return (_FILLER_CHUNK * (size // len(_FILLER_CHUNK) + 1))[:size]
+
+
+@web.middleware
+async def _chaos_middleware(request: web.Request, handler: Any) -> web.StreamResponse:
+    """Apply configured latency and error rate to platform endpoints."""
+    if request.path.startswith("/__bench/"):
+        return await handler(request)
+    config = request.app["config"]
+    rng: random.Random = request.app["rng"]
+    latency = config["latency_ms"] / 1000
+    if latency:
+        await asyncio.sleep(latency * rng.uniform(0.5, 1.5))
+    if rng.random() < config["error_rate"]:
+        return web.Response(status=503, text="benchmark injected error")
+    return await handler(request)
+
+
+async def _bench_config(request: web.Request) -> web.Response:
+    request.app["config"].update(await request.json())
+    request.app["pages"].clear()
+    return web.json_response(request.app["config"])
+
+
+async def _twitch_gql(request: web.Request) -> web.Response:
+    body = await request.json()
+    ratio = request.app["config"]["live_ratio"]
+    now = datetime.now(timezone.utc)
+    data: dict[str, Any] = {}
+    # Split into per-alias selections so each user gets only the fields it asked for
+    parts = re.split(r'(u\d+): user\(login: "([^"]*)"\)', body.get("query", ""))
+    for alias, login, selection in zip(parts[1::3], parts[2::3], parts[3::3]):
+        live = is_live(login, ratio)
+        user: dict[str, Any] = {"id": str(zlib.crc32(login.encode()))}
+        stream: dict[str, Any] | None = None
+        if live:
+            stream = {"id": f"s{zlib.crc32(login.encode())}", "type": "live"}
+            if "title" in selection:
+                stream.update(
+                    {
+                        "title": f"{login} benchmark stream",
+                        "viewersCount": zlib.crc32(login.encode()) % 5000,
+                        "createdAt": _iso(now - timedelta(hours=2)),
+                        "game": {"name": "Just Chatting", "slug": "just-chatting"},
+                    }
+                )
+        user["stream"] = stream
+        if "displayName" in selection:
+            user.update({"login": login, "displayName": login})
+        if "lastBroadcast" in selection:
+            user["lastBroadcast"] = {"startedAt": _iso(now - timedelta(days=3))}
+        data[alias] = user
+    return web.json_response({"data": data})
+
+
+async def _twitch_validate(request: web.Request) -> web.Response:
+    return web.json_response({"status": 401, "message": "invalid access token"}, status=401)
+
+
+async def _twitch_helix(request: web.Request) -> web.Response:
+    return web.json_response({"data": []})
+
+
+def _youtube_player_response(channel_id: str, video_id: str) -> dict[str, Any]:
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    return {
+        "videoDetails": {
+            "videoId": video_id,
+            "title": f"{channel_id} benchmark stream",
+            "author": channel_id,
+            "isLive": True,
+            "isLiveContent": True,
+            "viewCount": str(zlib.crc32(channel_id.encode()) % 5000),
+            "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{video_id}/hq.jpg"}]},
+        },
+        "microformat": {
+            "playerMicroformatRenderer": {
+                "liveBroadcastDetails": {"startTimestamp": start.isoformat()}
+            }
+        },
+        "streamingData": {"adaptiveFormats": [{"width": 1920, "height": 1080}]},
+    }
+
+
+def _youtube_page(request: web.Request, body: str) -> web.Response:
+    filler = request.app["pages"].get("filler")
+    if filler is None:
+        filler = _filler(request.app["config"]["page_kb"])
+        request.app["pages"]["filler"] = filler
+    half = len(filler) // 2
+    html = f"<!DOCTYPE html><html><head>{filler[:half]}</head><body>{body}{filler[half:]}</body>"
+    return web.Response(text=html, content_type="text/html")
+
+
+async def _youtube_live(request: web.Request) -> web.Response:
+    channel_id = request.match_info["channel_id"]
+    if is_live(channel_id, request.app["config"]["live_ratio"]):
+        player = _youtube_player_response(channel_id, video_id_for(channel_id))
+        body = f"<script>var ytInitialPlayerResponse = {json.dumps(player)};</script>"
+    else:
+        initial = {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": []}}}
+        body = f"<script>var ytInitialData = {json.dumps(initial)};</script>"
+    return _youtube_page(request, body)
+
+
+async def _youtube_streams(request: web.Request) -> web.Response:
+    channel_id = request.match_info["channel_id"]
+    items = []
+    if is_live(channel_id, request.app["config"]["live_ratio"]):
+        items.append(
+            {
+                "richItemRenderer": {
+                    "content": {
+                        "videoRenderer": {
+                            "videoId": video_id_for(channel_id),
+                            "badges": [
+                                {"metadataBadgeRenderer": {"style": "BADGE_STYLE_TYPE_LIVE_NOW"}}
+                            ],
+                        }
+                    }
+                }
+            }
+        )
+    initial = {
+        "contents": {
+            "twoColumnBrowseResultsRenderer": {
+                "tabs": [{"tabRenderer": {"content": {"richGridRenderer": {"contents": items}}}}]
+            }
+        }
+    }
+    return _youtube_page(request, f"<script>var ytInitialData = {json.dumps(initial)};</script>")
+
+
+async def _youtube_watch(request: web.Request) -> web.Response:
+    video_id = request.query.get("v", "")
+    player = _youtube_player_response(video_id, video_id)
+    body = f"<script>var ytInitialPlayerResponse = {json.dumps(player)};</script>"
+    return _youtube_page(request, body)
+
+
+async def _kick_channel(request: web.Request) -> web.Response:
+    slug = request.match_info["slug"]
+    if not is_live(slug, request.app["config"]["live_ratio"]):
+        return web.json_response({"slug": slug, "livestream": None, "chatroom": {"id": 1}})
+    start = datetime.now(timezone.utc) - timedelta(minutes=45)
+    return web.json_response(
+        {
+            "slug": slug,
+            "chatroom": {"id": zlib.crc32(slug.encode())},
+            "livestream": {
+                "is_live": True,
+                "session_title": f"{slug} benchmark stream",
+                "viewer_count": zlib.crc32(slug.encode()) % 5000,
+                "start_time": start.strftime("%Y-%m-%d %H:%M:%S"),
+                "categories": [{"name": "Just Chatting", "slug": "just-chatting"}],
+                "thumbnail": {"url": f"https://images.kick.com/{slug}.webp"},
+                "language": "English",
+                "is_mature": False,
+            },
+        }
+    )
+
+
+async def _kick_videos(request: web.Request) -> web.Response:
+    start = datetime.now(timezone.utc) - timedelta(days=2)
+    return web.json_response([{"start_time": start.strftime("%Y-%m-%d %H:%M:%S")}])
+
+
+async def _chaturbate_room_list(request: web.Request) -> web.Response:
+    config = request.app["config"]
+    live = [
+        name
+        for name in channel_ids("chaturbate", config["chaturbate_follows"])
+        if is_live(name, config["live_ratio"])
+    ]
+    offset = int(request.query.get("offset", "0"))
+    limit = int(request.query.get("limit", "90"))
+    rooms = [
+        {
+            "username": name,
+            "room_subject": f"{name} benchmark room",
+            "num_users": zlib.crc32(name.encode()) % 5000,
+            "img": f"https://thumb.live.mmcdn.com/{name}.jpg",
+        }
+        for name in live[offset : offset + limit]
+    ]
+    return web.json_response({"rooms": rooms, "total_count": len(live)})
+
+
+async def _chaturbate_context(request: web.Request) -> web.Response:
+    name = request.match_info["name"]
+    live = is_live(name, request.app["config"]["live_ratio"])
+    return web.json_response(
+        {
+            "broadcaster_username": name,
+            "room_status": "public" if live else "offline",
+            "num_viewers": zlib.crc32(name.encode()) % 5000,
+            "room_title": f"{name} benchmark room",
+        }
+    )
+
+
+def build_fake_app(config: dict[str, Any]) -> web.Application:
+    """Build the aiohttp application serving every fake platform endpoint."""
+    app = web.Application(middlewares=[_chaos_middleware], client_max_size=16 * 1024**2)
+    app["config"] = dict(config)
+    app["rng"] = random.Random(config.get("seed", 0))
+    app["pages"] = {}
+    app.router.add_post("/__bench/config", _bench_config)
+    app.router.add_post("/gql.twitch.tv/gql", _twitch_gql)
+    app.router.add_get("/id.twitch.tv/oauth2/validate", _twitch_validate)
+    app.router.add_get("/api.twitch.tv/helix/{tail:.*}", _twitch_helix)
+    app.router.add_get("/www.youtube.com/channel/{channel_id}/live", _youtube_live)
+    app.router.add_get("/www.youtube.com/channel/{channel_id}/streams", _youtube_streams)
+    app.router.add_get("/www.youtube.com/watch", _youtube_watch)
+    app.router.add_get("/kick.com/api/v2/channels/{slug}", _kick_channel)
+    app.router.add_get("/kick.com/api/v2/channels/{slug}/videos", _kick_videos)
+    app.router.add_get("/chaturbate.com/api/ts/roomlist/room-list/", _chaturbate_room_list)
+    app.router.add_get("/chaturbate.com/api/chatvideocontext/{name}/", _chaturbate_context)
+    return app
+
+
+def _serve(config: dict[str, Any], port_queue: Any) -> None:
+    """Server process entry point."""
+
+    async def main() -> None:
+        runner = web.AppRunner(build_fake_app(config), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=4096)
+        await site.start()
+        port_queue.put(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+# ── Client side ─────────────────────────────────────────────────────
+
+
+class RedirectingSession:
+    """Wraps an aiohttp session, sending platform hosts to the fake server.
+
+    https://kick.com/api/v2/... becomes http://127.0.0.1:<port>/kick.com/api/v2/...
+    Requests are counted per host.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str, hits: Counter) -> None:
+        self._session = session
+        self._base_url = base_url
+        self.hits = hits
+
+    def _rewrite(self, url: str | URL) -> str:
+        parsed = URL(url)
+        self.hits[parsed.host] += 1
+        return f"{self._base_url}/{parsed.host}{parsed.raw_path_qs}"
+
+    def get(self, url: str | URL, **kwargs: Any) -> Any:
+        return self._session.get(self._rewrite(url), **kwargs)
+
+    def post(self, url: str | URL, **kwargs: Any) -> Any:
+        return self._session.post(self._rewrite(url), **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+FAKE_YTDLP = """#!{python}
+import json, sys, time, zlib
+time.sleep({latency})
+url = sys.argv[-1]
+vid = url.rsplit("v=", 1)[-1]
+print(json.dumps({{
+    "id": vid, "is_live": True, "title": "benchmark stream", "channel": "bench",
+    "release_timestamp": int(time.time()) - 3600,
+    "concurrent_view_count": zlib.crc32(vid.encode()) % 5000,
+    "categories": ["Gaming"],
+}}))
+"""
+
+
+FAKE_YTDLP_WORKER = """
+import json, sys, time, zlib
+for line in sys.stdin:
+    time.sleep({latency})
+    vid = json.loads(line)["url"].rsplit("v=", 1)[-1]
+    print(json.dumps({{"data": {{
+        "id": vid, "is_live": True, "title": "benchmark stream", "channel": "bench",
+        "release_timestamp": int(time.time()) - 3600,
+        "concurrent_view_count": zlib.crc32(vid.encode()) % 5000,
+        "categories": ["Gaming"],
+    }}}}), flush=True)
+"""
+
+
+def write_fake_ytdlp(directory: Path, latency_ms: int) -> str:
+    """Write a stand-in yt-dlp executable that sleeps and prints canned JSON."""
+    path = directory / "yt-dlp"
+    path.write_text(FAKE_YTDLP.format(python=sys.executable, latency=latency_ms / 1000))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def write_fake_ytdlp_worker(directory: Path, latency_ms: int) -> str:
+    """Write a stand-in yt-dlp pool worker speaking the ytdlp_worker.py protocol."""
+    path = directory / "ytdlp_worker.py"
+    path.write_text(FAKE_YTDLP_WORKER.format(latency=latency_ms / 1000))
+    return str(path)
+
+
+async def _always_true() -> bool:
+    return True
+
+
+def _run_scenario(scenario: dict[str, Any], result_queue: Any) -> None:
+    """Scenario process entry point: build a monitor and time refreshes."""
+    from livestream_list.core.channel_store import ChannelStore
+    from livestream_list.core.models import Channel, StreamPlatform
+    from livestream_list.core.monitor import StreamMonitor
+    from livestream_list.core.settings import Settings
+
+    # Injected errors make clients log retry warnings; keep the table readable
+    logging.basicConfig(level=logging.ERROR)
+    baseline_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    async def main() -> list[dict[str, Any]]:
+        from livestream_list.api.ytdlp_pool import YtDlpPool
+
+        settings = Settings()
+        monitor = StreamMonitor(settings)
+        tmp = tempfile.mkdtemp(prefix="llbench-")
+        monitor._store = ChannelStore(Path(tmp) / "channels.db")
+
+        expected_live = 0
+        for platform_name in scenario["platforms"]:
+            platform = StreamPlatform(platform_name)
+            for cid in channel_ids(platform_name, scenario["per_platform"]):
+                monitor.add_channel_direct(Channel(channel_id=cid, platform=platform))
+                expected_live += is_live(cid, scenario["live_ratio"])
+
+        hits: Counter = Counter()
+        for platform, client in monitor._clients.items():
+            client._session = RedirectingSession(client.session, scenario["base_url"], hits)
+            if platform == StreamPlatform.YOUTUBE:
+                # The client reports itself unauthorized without yt-dlp on PATH,
+                # but the scraping path being measured doesn't need it
+                client._ytdlp_path = scenario["ytdlp_path"]  # type: ignore[attr-defined]
+                worker = scenario["ytdlp_worker"]
+                client._ytdlp_pool = (  # type: ignore[attr-defined]
+                    YtDlpPool(command=[sys.executable, worker]) if worker else None
+                )
+                client.is_authorized = _always_true  # type: ignore[method-assign]
+            elif platform == StreamPlatform.CHATURBATE:
+                client._get_cookie_string = lambda: "sessionid=benchmark"  # type: ignore[method-assign]
+
+        rounds = []
+        for round_no in range(scenario["rounds"]):
+            hits.clear()
+            self_before = resource.getrusage(resource.RUSAGE_SELF)
+            child_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+            started = time.perf_counter()
+            await monitor.refresh(force=True)
+            wall = time.perf_counter() - started
+            self_after = resource.getrusage(resource.RUSAGE_SELF)
+            child_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+            by_platform: Counter = Counter()
+            for host, count in hits.items():
+                by_platform[HOST_PLATFORMS.get(host, host)] += count
+            rounds.append(
+                {
+                    "round": round_no + 1,
+                    "wall_s": wall,
+                    "requests": sum(hits.values()),
+                    "requests_by_platform": dict(by_platform),
+                    "cpu_s": (self_after.ru_utime + self_after.ru_stime)
+                    - (self_before.ru_utime + self_before.ru_stime),
+                    "child_cpu_s": (child_after.ru_utime + child_after.ru_stime)
+                    - (child_before.ru_utime + child_before.ru_stime),
+                    "live_found": len({ls.channel.unique_key for ls in monitor.live_streams}),
+                    "live_expected": expected_live,
+                    "client_metrics": {
+                        platform.value: metrics
+                        for platform, client in monitor._clients.items()
+                        if platform.value in scenario["platforms"]
+                        and (metrics := client.get_metrics())
+                    },
+                }
+            )
+        await monitor.close_all_sessions()
+        return rounds
+
+    rounds = asyncio.run(main())
+    result_queue.put(
+        {
+            "rounds": rounds,
+            "baseline_rss_mb": baseline_rss_kb / 1024,
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        }
+    )
+
+
+async def _configure_server(base_url: str, config: dict[str, Any]) -> None:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"{base_url}/__bench/config", json=config) as resp:
+            resp.raise_for_status()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Channel counts per scenario")
+    parser.add_argument(
+        "--platforms",
+        default=",".join(PLATFORMS),
+        help="Platforms to benchmark individually (comma separated)",
+    )
+    parser.add_argument(
+        "--no-combined",
+        action="store_true",
+        help="Skip the scenario refreshing all selected platforms together",
+    )
+    parser.add_argument("--rounds", type=int, default=2, help="Refreshes per scenario")
+    parser.add_argument("--latency-ms", type=int, default=50, help="Mean fake server latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 replies")
+    parser.add_argument("--live-ratio", type=float, default=0.05, help="Fraction of live channels")
+    parser.add_argument("--page-kb", type=int, default=300, help="YouTube page size")
+    parser.add_argument(
+        "--ytdlp-latency-ms",
+        type=int,
+        default=0,
+        help="Enable the YouTube second pass with a fake yt-dlp taking this long (0 = off)",
+    )
+    parser.add_argument(
+        "--no-ytdlp-pool",
+        action="store_true",
+        help="Run the fake yt-dlp once per lookup instead of through the worker pool",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency/error jitter")
+    parser.add_argument("--json", type=Path, help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    platforms = [p for p in args.platforms.split(",") if p]
+    unknown = set(platforms) - set(PLATFORMS)
+    if unknown:
+        parser.error(f"unknown platforms: {', '.join(sorted(unknown))}")
+
+    ctx = multiprocessing.get_context("spawn")
+    server_config = {
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "live_ratio": args.live_ratio,
+        "page_kb": args.page_kb,
+        "chaturbate_follows": 0,
+        "seed": args.seed,
+    }
+    port_queue = ctx.Queue()
+    server = ctx.Process(target=_serve, args=(server_config, port_queue), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="llbench-bin-"))
+    ytdlp_path = write_fake_ytdlp(tmp_dir, args.ytdlp_latency_ms) if args.ytdlp_latency_ms else None
+    ytdlp_worker = (
+        write_fake_ytdlp_worker(tmp_dir, args.ytdlp_latency_ms)
+        if ytdlp_path and not args.no_ytdlp_pool
+        else None
+    )
+
+    scenarios: list[tuple[str, list[str], int]] = []
+    for size in sizes:
+        for platform in platforms:
+            scenarios.append((platform, [platform], size))
+        if len(platforms) > 1 and not args.no_combined:
+            # Same total channel count, split evenly across platforms
+            scenarios.append(("all", platforms, max(1, size // len(platforms))))
+
+    header = (
+        f"{'scenario':<11} {'channels':>8} {'round':>5} {'wall s':>8} {'requests':>8} "
+        f"{'cpu s':>7} {'child s':>7} {'peak MB':>8} {'live':>11}  concurrency"
+    )
+    print(
+        f"latency={args.latency_ms}ms error_rate={args.error_rate} "
+        f"live_ratio={args.live_ratio} page_kb={args.page_kb} "
+        f"ytdlp={f'{args.ytdlp_latency_ms}ms' if ytdlp_path else 'off'}"
+        f"{' (pool)' if ytdlp_worker else ''}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    results: list[dict[str, Any]] = []
+    try:
+        for name, scenario_platforms, per_platform in scenarios:
+            total = per_platform * len(scenario_platforms)
+            config = dict(server_config, chaturbate_follows=per_platform)
+            asyncio.run(_configure_server(base_url, config))
+            scenario = {
+                "platforms": scenario_platforms,
+                "per_platform": per_platform,
+                "base_url": base_url,
+                "live_ratio": args.live_ratio,
+                "rounds": args.rounds,
+                "ytdlp_path": ytdlp_path,
+                "ytdlp_worker": ytdlp_worker,
+            }
+            result_queue = ctx.Queue()
+            proc = ctx.Process(target=_run_scenario, args=(scenario, result_queue))
+            proc.start()
+            outcome = result_queue.get()
+            proc.join()
+
+            for rnd in outcome["rounds"]:
+                print(
+                    f"{name:<11} {total:>8} {rnd['round']:>5} {rnd['wall_s']:>8.2f} "
+                    f"{rnd['requests']:>8} {rnd['cpu_s']:>7.2f} {rnd['child_cpu_s']:>7.2f} "
+                    f"{outcome['peak_rss_mb']:>8.1f} "
+                    f"{rnd['live_found']:>5}/{rnd['live_expected']:<5}  "
+                    + " ".join(
+                        f"{platform}={metrics['concurrency_limit']}"
+                        for platform, metrics in rnd["client_metrics"].items()
+                        if "concurrency_limit" in metrics
+                    )
+                )
+            results.append(
+                {
+                    "scenario": name,
+                    "platforms": scenario_platforms,
+                    "channels": total,
+                    **outcome,
+                }
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "config": {k: v for k, v in server_config.items() if k != "chaturbate_follows"}
+                    | {"ytdlp_latency_ms": args.ytdlp_latency_ms, "rounds": args.rounds},
+                    "python": sys.version.split()[0],
+                    "cpus": os.cpu_count(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"\nWrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
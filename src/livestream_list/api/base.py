@@ -1,7 +1,6 @@
 """Base API client interface."""
 
 import asyncio
-import json
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
@@ -9,7 +8,9 @@ from typing import Any, TypeVar
 
 import aiohttp
 
+from ..core import json_codec
 from ..core.models import Channel, Livestream, StreamPlatform
+from .host_limits import HostUnavailableError, create_trace_config, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,9 @@ async def safe_json(resp: aiohttp.ClientResponse) -> dict[str, Any] | list[Any]
         Parsed JSON data or None if parsing failed
     """
     try:
-        result: dict[str, Any] | list[Any] = await resp.json()
+        result: dict[str, Any] | list[Any] = await resp.json(loads=json_codec.loads)
         return result
-    except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
+    except (aiohttp.ContentTypeError, json_codec.JSONDecodeError) as e:
         logger.warning(f"Failed to parse JSON response: {e}")
         return None
 
@@ -49,6 +50,8 @@ class BaseApiClient(ABC):
 
     def __init__(self) -> None:
         self._session: aiohttp.ClientSession | None = None
+        # Returns a connector owned elsewhere to open sessions on (see share_connector())
+        self._shared_connector: Callable[[], aiohttp.BaseConnector] | None = None
 
     @property
     @abstractmethod
@@ -65,12 +68,40 @@ class BaseApiClient(ABC):
     @property
     def session(self) -> aiohttp.ClientSession:
         """Get or create the HTTP session."""
-        if self._session is None or self._session.closed:
+        session = self._session
+        # A shared connector may have been closed by its owner since
+        if (
+            session is None
+            or session.closed
+            or session.connector is None
+            or session.connector.closed
+        ):
             # Use explicit timeout to avoid Python 3.11 compatibility issues
             timeout = aiohttp.ClientTimeout(total=30)
-            connector = aiohttp.TCPConnector(limit=50)
-            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
-        return self._session
+            if self._shared_connector is not None:
+                connector, owner = self._shared_connector(), False
+            else:
+                connector, owner = aiohttp.TCPConnector(limit=50), True
+            session = self._session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                connector_owner=owner,
+                # Shared per-host rate limits and circuit breakers
+                trace_configs=[create_trace_config(), *self._trace_configs()],
+            )
+        return session
+
+    def share_connector(self, connector: Callable[[], aiohttp.BaseConnector]) -> None:
+        """Open sessions on a connector owned elsewhere (e.g. SharedHttpPool.connector).
+
+        The session then reuses that connector's warm connections, and
+        close() leaves the connector open. Takes effect for the next session.
+        """
+        self._shared_connector = connector
+
+    def _trace_configs(self) -> list[aiohttp.TraceConfig]:
+        """Extra request hooks for this client's session (none by default)."""
+        return []
 
     async def close(self) -> None:
         """Close the HTTP session."""
@@ -91,6 +122,25 @@ class BaseApiClient(ABC):
             finally:
                 self._session = None
 
+    def get_persistent_state(self) -> dict[str, Any] | None:
+        """Return learned state worth keeping between runs (None if none).
+
+        StreamMonitor stores it in the channel database after each refresh
+        and hands it back to restore_persistent_state() on the next start.
+        Must be JSON-serializable.
+        """
+        return None
+
+    def restore_persistent_state(self, state: dict[str, Any]) -> None:
+        """Restore state returned by get_persistent_state() in an earlier run."""
+
+    def forget_channel(self, channel_id: str) -> None:
+        """Drop per-channel state kept between refreshes when a channel is removed."""
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return current tuning values (e.g. concurrency limits) for diagnostics."""
+        return {}
+
     def reset_session(self) -> None:
         """Reset the HTTP session.
 
@@ -116,6 +166,10 @@ class BaseApiClient(ABC):
     ) -> T:
         """Execute an operation with exponential backoff retry.
 
+        Requests refused by the host registry (open circuit, exhausted
+        rate limit) are not retried; a Retry-After from a 429 is enforced by
+        the registry when the next attempt is sent.
+
         Args:
             operation: Async callable to execute.
             max_retries: Maximum number of retry attempts.
@@ -134,6 +188,8 @@ class BaseApiClient(ABC):
         for attempt in range(max_retries + 1):
             try:
                 return await operation()
+            except HostUnavailableError:
+                raise
             except retryable_exceptions as e:
                 last_exception = e
 
@@ -175,27 +231,7 @@ class BaseApiClient(ABC):
         Returns:
             Delay in seconds to wait before retrying.
         """
-        retry_after = headers.get("Retry-After")
-        if not retry_after:
-            return default
-
-        try:
-            # Retry-After can be seconds or HTTP-date
-            # Most APIs use seconds
-            return float(retry_after)
-        except ValueError:
-            # Try parsing as HTTP-date (RFC 7231)
-            from email.utils import parsedate_to_datetime
-
-            try:
-                retry_dt = parsedate_to_datetime(retry_after)
-                from datetime import datetime, timezone
-
-                now = datetime.now(timezone.utc)
-                delta = (retry_dt - now).total_seconds()
-                return max(delta, 0.0)
-            except (TypeError, ValueError):
-                return default
+        return parse_retry_after(headers, default)
 
     @abstractmethod
     async def is_authorized(self) -> bool:
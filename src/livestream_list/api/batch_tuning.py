@@ -0,0 +1,140 @@
+"""Self-tuning batch size and parallelism for batched API queries.
+
+An AdaptiveBatchSizer splits a refresh's items into batches, limits how many
+run at once, and adjusts both from what each refresh observed:
+
+- A round where some full-size batch came back healthy and fast grows the
+  batch size additively (and parallelism by one if it was the bottleneck).
+- Slow batches shrink the size a little; timeouts and partial GraphQL
+  errors halve it; 429s halve parallelism and shrink the size.
+
+Adjustments happen once per round, so one refresh with dozens of parallel
+batches moves the values by a single step instead of collapsing them.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Error kinds accepted by AdaptiveBatchSizer.record()
+TIMEOUT = "timeout"
+THROTTLED = "throttled"
+PARTIAL = "partial"
+
+# Batch size added after a healthy round
+GROW_STEP = 5
+# Multiplier applied after a round with slow (but successful) batches
+SLOW_SHRINK = 0.8
+
+
+class AdaptiveBatchSizer:
+    """Learns a batch size and parallelism limit for one kind of batched query.
+
+    Not thread-safe; use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_size: int,
+        parallelism: int,
+        min_batch_size: int = 5,
+        max_batch_size: int = 100,
+        max_parallelism: int = 32,
+        target_latency: float = 2.0,
+    ) -> None:
+        self.name = name
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_parallelism = max_parallelism
+        self.target_latency = target_latency
+        self.batch_size = self._clamp_size(batch_size)
+        self.parallelism = self._clamp_parallelism(parallelism)
+        # True between split() and end_round()
+        self.in_round = False
+        self._reset_round()
+
+    def _clamp_size(self, size: int) -> int:
+        return max(self.min_batch_size, min(self.max_batch_size, int(size)))
+
+    def _clamp_parallelism(self, parallelism: int) -> int:
+        return max(1, min(self.max_parallelism, int(parallelism)))
+
+    def _reset_round(self) -> None:
+        self._batches = 0
+        self._full_batches = 0
+        self._slow = False
+        self._errors: set[str] = set()
+
+    def chunk(self, items: Sequence[T]) -> list[list[T]]:
+        """Split items into batches of the current size without starting a round."""
+        size = self.batch_size
+        return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+    def split(self, items: Sequence[T]) -> list[list[T]]:
+        """Split items into batches of the current size and start a new round."""
+        self._reset_round()
+        self.in_round = True
+        return self.chunk(items)
+
+    def record(self, size: int, latency: float | None = None, error: str | None = None) -> None:
+        """Record the outcome of one request attempt.
+
+        Args:
+            size: Number of items in the batch.
+            latency: Seconds the request took, if it got a response.
+            error: TIMEOUT, THROTTLED or PARTIAL, or None if healthy.
+        """
+        if error is not None:
+            self._errors.add(error)
+            return
+        self._batches += 1
+        if size >= self.batch_size:
+            self._full_batches += 1
+        if latency is not None and latency > self.target_latency:
+            self._slow = True
+
+    def end_round(self) -> bool:
+        """Apply the round's observations.
+
+        Returns:
+            True if the batch size or parallelism changed.
+        """
+        size, parallelism = self.batch_size, self.parallelism
+        if THROTTLED in self._errors:
+            self.parallelism = self._clamp_parallelism(parallelism // 2)
+            self.batch_size = self._clamp_size(size * 3 // 4)
+        elif TIMEOUT in self._errors or PARTIAL in self._errors:
+            self.batch_size = self._clamp_size(size // 2)
+        elif self._slow:
+            self.batch_size = self._clamp_size(int(size * SLOW_SHRINK))
+        elif self._full_batches:
+            self.batch_size = self._clamp_size(size + GROW_STEP)
+            if self._batches > parallelism:
+                self.parallelism = self._clamp_parallelism(parallelism + 1)
+        self._reset_round()
+        self.in_round = False
+
+        changed = (self.batch_size, self.parallelism) != (size, parallelism)
+        if changed:
+            logger.debug(
+                f"{self.name}: batch size {size} -> {self.batch_size}, "
+                f"parallelism {parallelism} -> {self.parallelism}"
+            )
+        return changed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the learned values."""
+        return {"batch_size": self.batch_size, "parallelism": self.parallelism}
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Restore values saved by to_dict(), clamped to the current limits."""
+        try:
+            self.batch_size = self._clamp_size(data.get("batch_size", self.batch_size))
+            self.parallelism = self._clamp_parallelism(data.get("parallelism", self.parallelism))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"{self.name}: ignoring invalid saved batch tuning: {e}")
@@ -7,6 +7,7 @@ session cookies are unavailable.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
@@ -21,6 +22,19 @@ logger = logging.getLogger(__name__)
 # Public API (no auth required)
 BASE_URL = "https://chaturbate.com"
 
+# Rooms per room-list page
+ROOM_LIST_PAGE_SIZE = 90
+# How long a room_status looked up with chatvideocontext is reused
+ROOM_STATUS_TTL = 60.0
+# Concurrent chatvideocontext lookups for rooms the room list has no status for
+ROOM_STATUS_CONCURRENCY = 4
+# Room-list fields that carry the show type (public/private/hidden/away)
+_ROOM_STATUS_FIELDS = ("current_show", "room_status")
+
+
+class _RoomListError(Exception):
+    """The room list could not be fetched (bad cookies, unexpected response)."""
+
 
 class ChaturbateApiClient(BaseApiClient):
     """Client for Chaturbate API.
@@ -33,6 +47,10 @@ class ChaturbateApiClient(BaseApiClient):
     def __init__(self, settings: ChaturbateSettings) -> None:
         super().__init__()
         self.settings = settings
+        # username -> (room_status, monotonic time fetched)
+        self._room_status_cache: dict[str, tuple[str, float]] = {}
+        # Rooms seen online by the last refresh
+        self._online: set[str] = set()
 
     @property
     def platform(self) -> StreamPlatform:
@@ -103,6 +121,7 @@ class ChaturbateApiClient(BaseApiClient):
 
                 room_status = data.get("room_status", "offline")
                 is_live = room_status == "public"
+                self._cache_room_status(channel.channel_id, str(room_status))
 
                 if not is_live:
                     return Livestream(channel=channel, live=False, room_status=room_status)
@@ -154,88 +173,96 @@ class ChaturbateApiClient(BaseApiClient):
             logger.warning(f"Chaturbate: bulk API failed, using individual: {e}")
 
         # Fallback: individual requests with throttling
-        return await self._get_livestreams_individual(channels)
+        results = await self._get_livestreams_individual(channels)
+        self._update_online(results)
+        return results
 
     async def _get_livestreams_bulk(self, channels: list[Channel]) -> list[Livestream] | None:
         """Use room-list/?follow=true bulk API to check all channels.
 
-        Returns None if session cookies are unavailable (triggers fallback).
+        A page that fails is retried with backoff, keeping the pages already
+        fetched. If it still fails, channels that may be on the missing pages
+        and were online last refresh are checked individually; the rest are
+        reported offline until the next refresh.
+
+        Returns None if session cookies are unavailable or the first page
+        can't be fetched (triggers fallback).
         """
         cookie_str = self._get_cookie_string()
         if not cookie_str:
             logger.debug("Chaturbate bulk: no cookies available, skipping")
             return None
 
-        # Fetch all online followed rooms (paginated, typically 1-2 requests)
-        online_rooms: dict[str, dict[str, Any]] = {}
-        offset = 0
         headers = {**self._get_headers(), "Cookie": cookie_str}
 
         # Log cookie names (not values) for debugging
         cookie_names = [c.split("=")[0] for c in cookie_str.split("; ")]
         logger.debug(f"Chaturbate bulk: using cookies: {cookie_names}")
 
+        # Fetch all online followed rooms (paginated, typically 1-2 requests)
+        online_rooms: dict[str, dict[str, Any]] = {}
+        offset = 0
+        complete = False
         try:
             while True:
-                url = f"{BASE_URL}/api/ts/roomlist/room-list/?follow=true&limit=90&offset={offset}"
-                async with self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status != 200:
-                        logger.warning(f"Chaturbate bulk API: HTTP {resp.status}")
-                        return None
-                    data = await safe_json(resp)
-                    if not data or not isinstance(data, dict):
-                        logger.warning("Chaturbate bulk API: invalid response")
-                        return None
-
-                    rooms = data.get("rooms", [])
-                    total = data.get("total_count", 0)
-                    logger.debug(
-                        f"Chaturbate bulk page: {len(rooms)} rooms, "
-                        f"total_count={total}, offset={offset}"
-                    )
-                    if not rooms:
-                        break
-
-                    if offset == 0:
-                        logger.debug(f"Chaturbate room-list sample keys: {list(rooms[0].keys())}")
-
-                    for room in rooms:
-                        username = self._extract_username(room)
-                        if username:
-                            online_rooms[username] = room
-
-                    total = data.get("total_count", 0)
-                    offset += 90
-                    if offset >= total:
-                        break
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            logger.warning(f"Chaturbate bulk API error: {e}")
-            return None
+                rooms, total = await self._retry_with_backoff(
+                    lambda: self._get_room_list_page(offset, headers)
+                )
+                if not rooms:
+                    complete = True
+                    break
+                if offset == 0:
+                    logger.debug(f"Chaturbate room-list sample keys: {list(rooms[0].keys())}")
+                for room in rooms:
+                    username = self._extract_username(room)
+                    if username:
+                        online_rooms[username] = room
+                offset += ROOM_LIST_PAGE_SIZE
+                if offset >= total:
+                    complete = True
+                    break
+        except (_RoomListError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if offset == 0:
+                logger.warning(f"Chaturbate bulk API error: {e}")
+                return None
+            logger.warning(f"Chaturbate bulk API error at offset {offset}, using partial list: {e}")
 
         # Build results
         results: list[Livestream] = []
         live_indices: list[int] = []
+        recheck: list[int] = []
         for channel in channels:
             cid = channel.channel_id.lower()
-            room = online_rooms.get(cid)
-            if room:
+            bulk_room = online_rooms.get(cid)
+            if bulk_room:
                 live_indices.append(len(results))
-                results.append(self._room_to_livestream(channel, room))
+                results.append(self._room_to_livestream(channel, bulk_room))
             else:
+                if not complete and cid in self._online:
+                    recheck.append(len(results))
                 results.append(Livestream(channel=channel, live=False))
 
-        # Check room_status for live channels (small set, fast)
-        # to detect private/hidden shows reported as online by bulk API
+        # Rooms possibly on the pages that failed: check individually
+        if recheck:
+            rechecked = await self._get_livestreams_individual(
+                [results[i].channel for i in recheck]
+            )
+            for idx, livestream in zip(recheck, rechecked):
+                results[idx] = livestream
+
+        # Check room_status for live channels to detect private/hidden shows
+        # reported as online by the bulk API (the room list's own show type
+        # is used when present, lookups only for rooms without one)
         if live_indices:
-            live_channels = [results[i].channel for i in live_indices]
-            statuses = await asyncio.gather(*[self._get_room_status(ch) for ch in live_channels])
+            live_rooms = [
+                (results[i].channel, online_rooms[results[i].channel.channel_id.lower()])
+                for i in live_indices
+            ]
+            statuses = await self._get_room_statuses(live_rooms)
             for idx, status in zip(live_indices, statuses):
                 results[idx].room_status = status
 
+        self._update_online(results)
         live_count = sum(1 for r in results if r.live)
         private_count = sum(
             1 for r in results if r.room_status and r.room_status not in ("public", "offline")
@@ -248,8 +275,83 @@ class ChaturbateApiClient(BaseApiClient):
         )
         return results
 
+    async def _get_room_list_page(
+        self, offset: int, headers: dict[str, str]
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Fetch one room-list page.
+
+        Returns:
+            The page's rooms and the total number of online followed rooms.
+
+        Raises:
+            aiohttp.ClientResponseError: On a retryable HTTP status.
+            _RoomListError: On any other failure.
+        """
+        url = (
+            f"{BASE_URL}/api/ts/roomlist/room-list/"
+            f"?follow=true&limit={ROOM_LIST_PAGE_SIZE}&offset={offset}"
+        )
+        async with self.session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as resp:
+            if self._is_retryable_status(resp.status):
+                raise aiohttp.ClientResponseError(
+                    resp.request_info, resp.history, status=resp.status
+                )
+            if resp.status != 200:
+                raise _RoomListError(f"HTTP {resp.status}")
+            data = await safe_json(resp)
+            if not data or not isinstance(data, dict):
+                raise _RoomListError("invalid response")
+
+        rooms = data.get("rooms", [])
+        total = data.get("total_count", 0)
+        logger.debug(
+            f"Chaturbate bulk page: {len(rooms)} rooms, total_count={total}, offset={offset}"
+        )
+        return rooms, total
+
+    @staticmethod
+    def _room_list_status(room: dict[str, Any]) -> str | None:
+        """Show type from a room-list item, if the item has one."""
+        for field in _ROOM_STATUS_FIELDS:
+            value = room.get(field)
+            if isinstance(value, str) and value:
+                return value.lower()
+        return None
+
+    async def _get_room_statuses(self, rooms: list[tuple[Channel, dict[str, Any]]]) -> list[str]:
+        """room_status for online rooms: from the room list, the cache, or a lookup."""
+        semaphore = asyncio.Semaphore(ROOM_STATUS_CONCURRENCY)
+
+        async def status(channel: Channel, room: dict[str, Any]) -> str:
+            from_list = self._room_list_status(room)
+            if from_list is not None:
+                return from_list
+            async with semaphore:
+                return await self._get_room_status(channel)
+
+        return await asyncio.gather(*[status(channel, room) for channel, room in rooms])
+
+    def _update_online(self, results: list[Livestream]) -> None:
+        """Record which of the just-polled channels are online.
+
+        Only the polled channels are touched: with adaptive polling a refresh
+        covers a subset, and rooms not polled this round keep their state.
+        """
+        self._online.difference_update(r.channel.channel_id.lower() for r in results)
+        self._online.update(r.channel.channel_id.lower() for r in results if r.live)
+
+    def _cache_room_status(self, channel_id: str, status: str) -> None:
+        self._room_status_cache[channel_id.lower()] = (status, time.monotonic())
+
     async def _get_room_status(self, channel: Channel) -> str:
-        """Get room_status for a single channel via individual API."""
+        """Get room_status for a single channel via individual API (cached for ROOM_STATUS_TTL)."""
+        cached = self._room_status_cache.get(channel.channel_id.lower())
+        if cached is not None and time.monotonic() - cached[1] < ROOM_STATUS_TTL:
+            return cached[0]
         try:
             url = f"{BASE_URL}/api/chatvideocontext/{channel.channel_id}/"
             async with self.session.get(
@@ -260,7 +362,9 @@ class ChaturbateApiClient(BaseApiClient):
                 data = await safe_json(resp)
                 if not data or not isinstance(data, dict):
                     return "offline"
-                return str(data.get("room_status", "offline"))
+                status = str(data.get("room_status", "offline"))
+                self._cache_room_status(channel.channel_id, status)
+                return status
         except (aiohttp.ClientError, asyncio.TimeoutError):
             return "offline"
 
@@ -0,0 +1,219 @@
+"""Self-tuning concurrency limit for per-channel platform queries.
+
+Platforms without a batch endpoint (Kick, YouTube) are queried one channel
+at a time, many at once. An AdaptiveConcurrencyLimiter replaces a fixed
+semaphore there and adjusts its window with AIMD (additive increase,
+multiplicative decrease) from the requests it sees through its session's
+TraceConfig:
+
+- A completed request while the window was full grows it by 1/window, so
+  by about one slot per window's worth of requests.
+- 429 responses and request timeouts halve it. Other errors (e.g. a
+  sporadic 503) say nothing about load and are ignored.
+- Latency inflation (the smoothed latency rising to LATENCY_TOLERANCE times
+  the lowest seen) shrinks it by SLOW_BACKOFF.
+
+Decreases happen at most once per window's worth of completed requests, so a
+burst of parallel failures from one overload shrinks the window once.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from types import SimpleNamespace, TracebackType
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Multiplier applied after a throttled or timed-out request
+OVERLOAD_BACKOFF = 0.5
+# Multiplier applied when latency is inflated
+SLOW_BACKOFF = 0.9
+# Smoothed latency over this multiple of the baseline counts as inflated
+LATENCY_TOLERANCE = 2.0
+# Weight of each new sample in the smoothed latency
+LATENCY_SMOOTHING = 0.1
+# Per-request upward drift of the baseline, so it follows a slower network
+BASELINE_DRIFT = 1.001
+# Response status that means the server wants fewer requests
+THROTTLED_STATUS = 429
+
+
+class AdaptiveConcurrencyLimiter:
+    """An async semaphore whose size tunes itself from request outcomes.
+
+    Not thread-safe; use from one event loop at a time.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter("kick", initial=10)
+        session = aiohttp.ClientSession(trace_configs=[limiter.trace_config()])
+        async with limiter:
+            await session.get(...)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 50,
+    ) -> None:
+        self.name = name
+        self.initial = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(self._clamp(initial))
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latency: float | None = None
+        self._baseline: float | None = None
+        self._since_decrease = 0
+
+    def _clamp(self, limit: float) -> float:
+        return max(float(self.min_limit), min(float(self.max_limit), limit))
+
+    @property
+    def window(self) -> int:
+        """Number of queries currently allowed to run at once."""
+        return int(self.limit)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot in the window."""
+        if not self._waiters and self.in_flight < self.window:
+            self._take()
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # Slot was handed over just before the cancel
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        self.in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.window:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def record_latency(self, latency: float) -> None:
+        """Record a request that got a (non-overload) response."""
+        self._since_decrease += 1
+        if self._latency is None or self._baseline is None:
+            self._latency = self._baseline = latency
+        else:
+            self._latency += (latency - self._latency) * LATENCY_SMOOTHING
+            self._baseline = min(self._latency, self._baseline * BASELINE_DRIFT)
+
+        if self._latency > self._baseline * LATENCY_TOLERANCE:
+            self._decrease(SLOW_BACKOFF, "latency inflated")
+        elif self._waiters or self.in_flight >= self.window:
+            # Only grow while the window is actually the bottleneck
+            self._set_limit(self.limit + 1 / self.limit)
+
+    def record_overload(self, reason: str) -> None:
+        """Record a request that was throttled or timed out."""
+        self._since_decrease += 1
+        self._decrease(OVERLOAD_BACKOFF, reason)
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        if self._since_decrease < self.window:
+            return  # Already backed off for this window's requests
+        self._since_decrease = 0
+        old = self.window
+        self._set_limit(self.limit * factor)
+        if self.window != old:
+            logger.debug(f"{self.name}: concurrency {old} -> {self.window} ({reason})")
+
+    def _set_limit(self, limit: float) -> None:
+        self.limit = self._clamp(limit)
+        self._wake()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Create a TraceConfig feeding a session's request outcomes to this limiter."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(
+            session: aiohttp.ClientSession,
+            ctx: SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            ctx.limiter_started = time.monotonic()
+
+        async def on_request_end(
+            session: aiohttp.ClientSession,
+            ctx: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            status = params.response.status
+            if status == THROTTLED_STATUS:
+                self.record_overload(f"HTTP {status}")
+            elif status < 500:
+                self.record_latency(time.monotonic() - ctx.limiter_started)
+
+        async def on_request_exception(
+            session: aiohttp.ClientSession,
+            ctx: SimpleNamespace,
+            params: aiohttp.TraceRequestExceptionParams,
+        ) -> None:
+            if isinstance(params.exception, asyncio.TimeoutError):
+                self.record_overload("timeout")
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def metrics(self) -> dict[str, Any]:
+        """Current window and usage, for diagnostics."""
+        return {
+            "concurrency_limit": self.window,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "latency": self._latency,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the learned limit."""
+        return {"limit": round(self.limit, 2), "initial": self.initial}
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Restore a limit saved by to_dict().
+
+        Ignored if it was learned from a different configured initial value,
+        so changing the setting starts tuning over from the new value.
+        """
+        if data.get("initial") != self.initial:
+            return
+        try:
+            self.limit = self._clamp(float(data.get("limit", self.limit)))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"{self.name}: ignoring invalid saved concurrency limit: {e}")
@@ -0,0 +1,370 @@
+"""Per-host rate limiting and circuit breaking for API client sessions.
+
+Every BaseApiClient session reports its requests to one shared HostRegistry
+through an aiohttp TraceConfig, so all clients and workers hitting the same
+host share a view of it:
+
+- A token bucket per host, learned from ``Retry-After`` and
+  ``Ratelimit-Limit``/``Ratelimit-Remaining``/``Ratelimit-Reset`` response
+  headers. Hosts that never send them are not throttled.
+- A circuit breaker per host. After CIRCUIT_FAILURE_THRESHOLD consecutive
+  failures (5xx, connection errors, timeouts) requests fail fast with
+  CircuitOpenError until a cooldown passes; then a single probe request is
+  let through and its outcome closes or re-opens the circuit.
+
+Errors raised here subclass aiohttp.ClientError, so callers that already
+handle network failures treat a throttled or broken host the same way.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures before a host's circuit opens
+CIRCUIT_FAILURE_THRESHOLD = 5
+# Cooldown before the first probe; doubles on each failed probe up to the max
+CIRCUIT_OPEN_SECONDS = 30.0
+CIRCUIT_MAX_OPEN_SECONDS = 300.0
+
+# Longest a request waits for a rate-limit budget before failing fast. Waits
+# count against the request's own timeout, so keep this well below it.
+MAX_RATE_LIMIT_WAIT = 5.0
+# Block applied after a 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 2.0
+
+# Ratelimit-Reset values above this are Unix timestamps (Twitch); smaller
+# values are seconds from now (IETF RateLimit header draft)
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class HostUnavailableError(aiohttp.ClientError):
+    """A request was refused locally because its host is throttled or failing."""
+
+    def __init__(self, host: str, retry_in: float, reason: str) -> None:
+        super().__init__(f"{host} {reason}, retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitOpenError(HostUnavailableError):
+    """The host's circuit breaker is open."""
+
+
+class RateLimitedError(HostUnavailableError):
+    """The host's rate-limit budget won't recover within MAX_RATE_LIMIT_WAIT."""
+
+
+def parse_retry_after(headers: Mapping[str, str], default: float = 1.0) -> float:
+    """Parse a Retry-After header value.
+
+    Args:
+        headers: Response headers.
+        default: Default delay if header is missing or unparseable.
+
+    Returns:
+        Delay in seconds to wait before retrying.
+    """
+    retry_after = headers.get("Retry-After")
+    if not retry_after:
+        return default
+
+    try:
+        # Retry-After can be seconds or HTTP-date; most APIs use seconds
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_dt = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return default
+    return max((retry_dt - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass
+class HostState:
+    """Rate-limit and circuit state for one host (guarded by HostRegistry._lock)."""
+
+    # Token bucket; tokens is None until the host reports a limit
+    tokens: float | None = None
+    capacity: float = 0.0
+    refill_rate: float = 0.0  # tokens per second
+    refilled_at: float = 0.0
+    blocked_until: float = 0.0
+
+    # Circuit breaker
+    failures: int = 0
+    open_until: float = 0.0
+    open_seconds: float = CIRCUIT_OPEN_SECONDS
+    probing: bool = False
+
+    in_flight: int = 0
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.failures >= CIRCUIT_FAILURE_THRESHOLD
+
+    def refill(self, now: float) -> None:
+        if self.tokens is not None and self.refill_rate > 0:
+            elapsed = max(now - self.refilled_at, 0.0)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.refilled_at = now
+
+
+class HostRegistry:
+    """Shared per-host rate-limit buckets and circuit breakers.
+
+    Thread-safe and not bound to an event loop, so sessions on any loop can
+    share it.
+    """
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(refilled_at=time.monotonic())
+        return state
+
+    def _reserve(self, host: str, now: float) -> tuple[float, bool]:
+        """Try to take a slot for a request.
+
+        Returns:
+            (wait, probe): wait is 0 when the request may proceed now,
+            otherwise the seconds until it should try again. probe is True
+            if this request is the half-open circuit's probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or already probing.
+        """
+        state = self._state(host)
+        probe = False
+        if state.circuit_open:
+            if now < state.open_until or state.probing:
+                raise CircuitOpenError(host, max(state.open_until - now, 0.0), "circuit open")
+            probe = True
+
+        if now < state.blocked_until:
+            return state.blocked_until - now, False
+
+        state.refill(now)
+        if state.tokens is not None:
+            if state.tokens < 1:
+                if state.refill_rate <= 0:
+                    return MAX_RATE_LIMIT_WAIT + 1, False
+                return (1 - state.tokens) / state.refill_rate, False
+            state.tokens -= 1
+
+        if probe:
+            state.probing = True
+            logger.info(f"{host}: circuit half-open, sending probe request")
+        state.in_flight += 1
+        return 0.0, probe
+
+    async def acquire(self, host: str) -> bool:
+        """Wait until a request to host may be sent.
+
+        Returns:
+            True if the request is the circuit's half-open probe.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+            RateLimitedError: If the host's budget won't recover within
+                MAX_RATE_LIMIT_WAIT.
+        """
+        deadline = time.monotonic() + MAX_RATE_LIMIT_WAIT
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                wait, probe = self._reserve(host, now)
+            if wait <= 0:
+                return probe
+            if now + wait > deadline:
+                raise RateLimitedError(host, wait, "rate limited")
+            await asyncio.sleep(wait)
+
+    def release(
+        self,
+        host: str,
+        probe: bool,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record the outcome of a request started with acquire().
+
+        Args:
+            host: Request host.
+            probe: Value returned by acquire().
+            status: HTTP status, or None if the request failed without a response.
+            headers: Response headers, if any.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host)
+            state.in_flight = max(state.in_flight - 1, 0)
+            if probe:
+                state.probing = False
+
+            if headers is not None:
+                self._apply_rate_headers(host, state, status, headers, now)
+
+            failed = status is None or status >= 500
+            if failed:
+                self._record_failure(host, state, probe, now)
+            elif state.failures:
+                if state.circuit_open:
+                    logger.info(f"{host}: circuit closed")
+                state.failures = 0
+                state.open_seconds = CIRCUIT_OPEN_SECONDS
+
+    def release_unsent(self, host: str, probe: bool) -> None:
+        """Return a slot for a request that was cancelled before any outcome."""
+        with self._lock:
+            state = self._state(host)
+            state.in_flight = max(state.in_flight - 1, 0)
+            if probe:
+                state.probing = False
+
+    def _apply_rate_headers(
+        self,
+        host: str,
+        state: HostState,
+        status: int | None,
+        headers: Mapping[str, str],
+        now: float,
+    ) -> None:
+        if status == 429 or "Retry-After" in headers:
+            delay = parse_retry_after(headers, DEFAULT_RETRY_AFTER)
+            if delay > 0:
+                state.blocked_until = max(state.blocked_until, now + delay)
+                logger.info(f"{host}: rate limited for {delay:.1f}s")
+
+        remaining = _header_float(headers, "Ratelimit-Remaining")
+        if remaining is None:
+            return
+        limit = _header_float(headers, "Ratelimit-Limit")
+        reset = _header_float(headers, "Ratelimit-Reset")
+        reset_in = 0.0
+        if reset is not None:
+            reset_in = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+            reset_in = max(reset_in, 0.0)
+
+        state.capacity = max(limit or 0.0, remaining, 1.0)
+        state.tokens = remaining
+        state.refilled_at = now
+        if reset_in > 0:
+            # Refill fast enough to be full again at the reset time
+            state.refill_rate = max(state.capacity - remaining, 1.0) / reset_in
+        elif limit:
+            state.refill_rate = limit / 60.0
+        if remaining < 1 and reset_in > 0:
+            state.blocked_until = max(state.blocked_until, now + reset_in)
+
+    def _record_failure(self, host: str, state: HostState, probe: bool, now: float) -> None:
+        state.failures += 1
+        if probe:
+            state.open_seconds = min(state.open_seconds * 2, CIRCUIT_MAX_OPEN_SECONDS)
+        if state.circuit_open:
+            state.open_until = now + state.open_seconds
+            if probe or state.failures == CIRCUIT_FAILURE_THRESHOLD:
+                logger.warning(
+                    f"{host}: circuit open after {state.failures} failures, "
+                    f"retrying in {state.open_seconds:.0f}s"
+                )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-host state for logging and debugging."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "in_flight": state.in_flight,
+                    "tokens": state.tokens,
+                    "blocked_for": max(state.blocked_until - now, 0.0),
+                    "failures": state.failures,
+                    "circuit_open": state.circuit_open,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def reset(self) -> None:
+        """Forget all host state."""
+        with self._lock:
+            self._hosts.clear()
+
+
+_registry = HostRegistry()
+
+
+def get_host_registry() -> HostRegistry:
+    """Return the process-wide host registry."""
+    return _registry
+
+
+def create_trace_config(registry: HostRegistry | None = None) -> aiohttp.TraceConfig:
+    """Create a TraceConfig that routes a session's requests through the registry.
+
+    Args:
+        registry: Registry to use (defaults to the process-wide one).
+    """
+    reg = registry or _registry
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        ctx.host = params.url.host or ""
+        ctx.acquired = False
+        ctx.probe = await reg.acquire(ctx.host)
+        ctx.acquired = True
+
+    async def on_request_end(
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        if getattr(ctx, "acquired", False):
+            ctx.acquired = False
+            reg.release(ctx.host, ctx.probe, params.response.status, params.response.headers)
+
+    async def on_request_exception(
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestExceptionParams,
+    ) -> None:
+        if not getattr(ctx, "acquired", False):
+            return  # Refused by the registry itself, or never started
+        ctx.acquired = False
+        if isinstance(params.exception, asyncio.CancelledError):
+            reg.release_unsent(ctx.host, ctx.probe)
+        else:
+            reg.release(ctx.host, ctx.probe)
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
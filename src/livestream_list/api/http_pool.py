@@ -0,0 +1,451 @@
+"""Application-wide HTTP connection pool for ad-hoc requests.
+
+One-off fetches (channel socials, user cards, emote ID lookups, chat
+history, link previews, ...) run on short-lived worker loops, and a
+ClientSession per call rebuilt DNS, TCP and TLS state every time. The
+shared pool keeps one aiohttp session with keep-alive connections, a DNS
+cache and per-host connection limits on the app's service loop (see
+get_service_loop()). Coroutines on any loop or thread send requests through
+it and get the whole response back:
+
+    resp = await get_http_pool().get(url, headers=headers, timeout=10)
+    if resp.status == 200:
+        data = resp.json()
+
+Identical requests in flight at the same time share one round trip: when
+several chat tabs open together they all ask for the same global emote and
+badge sets, and only the first caller's request goes out. GETs are
+coalesced by default; POSTs only with coalesce=True (e.g. GraphQL reads).
+
+get_cached() serves payloads that rarely change (emote and badge sets)
+from the on-disk ResponseCache straight away and revalidates them with a
+conditional request in the background, so a chat opening with a warm cache
+does not wait for the network.
+
+API clients living on the service loop can open their sessions on the
+pool's connector (see connector()) to share its warm connections.
+
+Requests carry no cookies between call sites: the session has no cookie jar.
+Responses are read fully (or up to max_bytes) on the pool loop, so the
+pool suits API calls and small pages, not streaming downloads.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from collections.abc import Coroutine, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+from ..core import json_codec
+from ..core.event_loop import BackgroundLoop, get_service_loop
+from .host_limits import create_trace_config
+from .response_cache import CachedResponse, ResponseCache, cache_key, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open in total and per host
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 8
+# Seconds a resolved address is reused
+DNS_CACHE_TTL = 300
+# Seconds an idle connection is kept open
+KEEPALIVE_TIMEOUT = 60.0
+DEFAULT_TIMEOUT = 10.0
+# get_cached(): cached bodies younger than this are served without revalidating
+REVALIDATE_AFTER = 10 * 60.0
+# get_cached(): cached bodies older than this are revalidated before use
+MAX_STALE = 7 * 24 * 3600.0
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fully read response from the shared pool.
+
+    Coalesced callers receive the same instance; treat it as read-only.
+    """
+
+    status: int
+    url: str
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    charset: str | None = None
+    # Served from the response cache (possibly revalidated with a 304)
+    from_cache: bool = False
+
+    def header(self, name: str, default: str = "") -> str:
+        """Value of a response header, matched case-insensitively."""
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return default
+
+    def text(self, errors: str = "replace") -> str:
+        """Body decoded with the response charset (UTF-8 if none)."""
+        return self.body.decode(self.charset or "utf-8", errors=errors)
+
+    def json(self) -> Any:
+        """Body parsed as JSON.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json_codec.loads(self.body)
+
+
+class SharedHttpPool:
+    """A long-lived ClientSession on the service loop, usable from any loop.
+
+    The loop (if not already running) and session start on the first request.
+    """
+
+    def __init__(
+        self, cache: ResponseCache | None = None, loop: BackgroundLoop | None = None
+    ) -> None:
+        self._loop = loop or get_service_loop()
+        self._cache = cache
+        self._connector: aiohttp.TCPConnector | None = None
+        self._session: aiohttp.ClientSession | None = None
+        # Request key -> in-flight request (pool loop only)
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[HttpResponse]] = {}
+        # Cache keys with a background revalidation running (pool loop only)
+        self._revalidating: set[str] = set()
+        self.requests = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.not_modified = 0
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Response store used by get_cached()."""
+        if self._cache is None:
+            self._cache = get_response_cache()
+        return self._cache
+
+    @property
+    def loop(self) -> BackgroundLoop:
+        """The loop the pool's session and connector live on."""
+        return self._loop
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """The pool's connector (call on the pool loop).
+
+        Sessions opened on it with connector_owner=False share the pool's
+        keep-alive connections and DNS cache; closing them leaves it open.
+        """
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+        return self._connector
+
+    def _session_for_loop(self) -> aiohttp.ClientSession:
+        """The pool's session (call on the pool loop)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self.connector(),
+                connector_owner=False,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                # Shared per-host rate limits and circuit breakers
+                trace_configs=[create_trace_config()],
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_bytes: int | None = None,
+        coalesce: bool | None = None,
+    ) -> HttpResponse:
+        """Send a request through the pool and read its response.
+
+        If an identical request (method, URL, params, headers, body and
+        max_bytes) is already in flight, wait for its response instead.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            headers: Request headers.
+            params: Query parameters.
+            json: JSON request body.
+            data: Form or raw request body.
+            timeout: Total seconds for the request and reading the body.
+            max_bytes: Read at most this much of the body (the rest is dropped).
+            coalesce: Share identical in-flight requests (default: GET only).
+
+        Raises:
+            aiohttp.ClientError: On network errors.
+            asyncio.TimeoutError: If the request takes longer than timeout.
+        """
+        method = method.upper()
+        if coalesce is None:
+            coalesce = method == "GET"
+        key = None
+        if coalesce and data is None:
+            key = _request_key(method, url, headers, params, json, max_bytes)
+        coro = self._single_flight(
+            key, self._request(method, url, headers, params, json, data, timeout, max_bytes)
+        )
+        if asyncio.get_running_loop() is self._loop.loop:
+            return await coro
+        return await asyncio.wrap_future(self._submit(coro))
+
+    def _submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future[Any]:
+        """Run coro on the pool loop, starting it if needed."""
+        self._loop.start()
+        return self._loop.submit(coro)
+
+    async def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        """Send a GET request (see request())."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> HttpResponse:
+        """Send a POST request (see request())."""
+        return await self.request("POST", url, **kwargs)
+
+    async def get_cached(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> HttpResponse:
+        """GET a rarely changing payload through the response cache.
+
+        A cached 200 body up to MAX_STALE old is returned at once; if it is
+        older than REVALIDATE_AFTER, a conditional request refreshes the
+        cache in the background for later callers. Without a usable entry
+        the request (conditional if there is an old entry) is made now.
+        Only use this for responses that do not depend on who asks: the
+        cache key is the URL and params, not the headers.
+
+        Raises:
+            aiohttp.ClientError: On network errors when nothing is cached.
+            asyncio.TimeoutError: On timeouts when nothing is cached.
+        """
+        key = cache_key(url, params)
+        entry = self.cache.get(key)
+        now = time.time()
+        if entry is not None and entry.age(now) < MAX_STALE:
+            self.cache_hits += 1
+            if entry.age(now) >= REVALIDATE_AFTER:
+                future = self._submit(self._revalidate_in_background(key, url, headers, params))
+                future.add_done_callback(_log_background_error)
+            return _from_cache(entry)
+        return await self._revalidate(key, url, headers, params, timeout, entry)
+
+    async def _revalidate(
+        self,
+        key: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        params: Mapping[str, str] | None,
+        timeout: float,
+        entry: CachedResponse | None,
+    ) -> HttpResponse:
+        """Fetch url (conditionally if there is an entry) and update the cache."""
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+        resp = await self.request(
+            "GET", url, headers=request_headers, params=params, timeout=timeout
+        )
+        now = time.time()
+        if resp.status == 304 and entry is not None:
+            self.not_modified += 1
+            self.cache.touch(key, now)
+            return _from_cache(entry)
+        if resp.status == 200:
+            self.cache.put(
+                CachedResponse(
+                    key=key,
+                    url=url,
+                    body=resp.body,
+                    etag=resp.header("ETag"),
+                    last_modified=resp.header("Last-Modified"),
+                    fetched_at=now,
+                )
+            )
+        return resp
+
+    async def _revalidate_in_background(
+        self,
+        key: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        params: Mapping[str, str] | None,
+    ) -> None:
+        """Refresh a cached entry unless another caller already is (on the pool loop)."""
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        try:
+            entry = self.cache.get(key)
+            if entry is not None and entry.age() < REVALIDATE_AFTER:
+                return  # Refreshed since the caller looked
+            await self._revalidate(key, url, headers, params, DEFAULT_TIMEOUT, entry)
+        finally:
+            self._revalidating.discard(key)
+
+    async def _single_flight(
+        self, key: tuple[Any, ...] | None, coro: Coroutine[Any, Any, HttpResponse]
+    ) -> HttpResponse:
+        """Run coro, or join the in-flight request with the same key (on the pool loop)."""
+        self.requests += 1
+        shared = self._inflight.get(key) if key is not None else None
+        if shared is not None:
+            coro.close()
+            self.coalesced += 1
+            return await asyncio.shield(shared)
+
+        task = asyncio.ensure_future(coro)
+        if key is not None:
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def metrics(self) -> dict[str, int]:
+        """Request and coalescing counts, for diagnostics."""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+        }
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        params: Mapping[str, str] | None,
+        json: Any,
+        data: Any,
+        timeout: float,
+        max_bytes: int | None,
+    ) -> HttpResponse:
+        session = self._session_for_loop()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            if max_bytes is None:
+                body = await resp.read()
+            else:
+                body = b""
+                while len(body) < max_bytes:
+                    chunk = await resp.content.read(max_bytes - len(body))
+                    if not chunk:
+                        break
+                    body += chunk
+            return HttpResponse(
+                status=resp.status,
+                url=str(resp.url),
+                body=body,
+                headers=dict(resp.headers),
+                charset=resp.charset,
+            )
+
+    async def close(self) -> None:
+        """Close the session, connector and response cache (call on the pool loop).
+
+        They are reopened on the next request. Sessions sharing the
+        connector should be closed first.
+        """
+        if self.requests:
+            logger.debug(
+                f"HTTP pool: {self.requests} requests, {self.coalesced} served by "
+                f"an identical in-flight request, {self.cache_hits} cache hits, "
+                f"{self.not_modified} revalidated unchanged"
+            )
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        if self._cache is not None:
+            self._cache.close()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Run close() on the pool loop from another thread and wait for it.
+
+        The loop itself keeps running; its owner stops it.
+        """
+        if not self._loop.is_running:
+            self._session = self._connector = None
+            if self._cache is not None:
+                self._cache.close()
+            return
+        try:
+            self._loop.submit(self.close()).result(timeout)
+        except Exception as e:
+            logger.warning(f"HTTP pool shutdown error: {e}")
+
+
+def _from_cache(entry: CachedResponse) -> HttpResponse:
+    return HttpResponse(
+        status=200,
+        url=entry.url,
+        body=entry.body,
+        headers={"ETag": entry.etag, "Last-Modified": entry.last_modified},
+        from_cache=True,
+    )
+
+
+def _log_background_error(future: concurrent.futures.Future[None]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug(f"Background revalidation failed: {future.exception()}")
+
+
+def _request_key(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None,
+    params: Mapping[str, str] | None,
+    json: Any,
+    max_bytes: int | None,
+) -> tuple[Any, ...] | None:
+    """Normalized identity of a request, or None if it cannot be keyed."""
+    try:
+        body = json_codec.dumps(json, sort_keys=True) if json is not None else None
+    except (TypeError, ValueError):
+        return None
+    return (
+        method,
+        url,
+        tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        tuple(sorted((k.lower(), v) for k, v in (headers or {}).items())),
+        body,
+        max_bytes,
+    )
+
+
+_pool = SharedHttpPool()
+
+
+def get_http_pool() -> SharedHttpPool:
+    """Return the process-wide HTTP pool."""
+    return _pool
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,9 +11,15 @@ import aiohttp
 from ..core.models import Channel, Livestream, StreamPlatform
 from ..core.settings import KickSettings
 from .base import BaseApiClient, safe_json
+from .concurrency import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
+# How long an offline channel's last video date is trusted before the
+# /videos endpoint is asked again. It only changes after the channel streams,
+# which drops the entry anyway.
+LAST_VIDEO_TTL = 12 * 3600.0
+
 
 class KickApiClient(BaseApiClient):
     """Client for Kick API.
@@ -28,7 +35,12 @@ class KickApiClient(BaseApiClient):
     def __init__(self, settings: KickSettings, concurrency: int = 10) -> None:
         super().__init__()
         self.settings = settings
-        self.concurrency = concurrency
+        # Channel queries in flight; starts at the configured concurrency
+        self._limiter = AdaptiveConcurrencyLimiter("Kick", initial=concurrency)
+        # channel_id -> (last video date, Unix time it was fetched). Live
+        # channels get their stream start with a fetch time of 0, so the next
+        # offline refresh looks the VOD up again.
+        self._last_video_dates: dict[str, tuple[datetime | None, float]] = {}
 
     @property
     def platform(self) -> StreamPlatform:
@@ -38,6 +50,32 @@ class KickApiClient(BaseApiClient):
     def name(self) -> str:
         return "Kick"
 
+    def _trace_configs(self) -> list[aiohttp.TraceConfig]:
+        return [self._limiter.trace_config()]
+
+    def get_metrics(self) -> dict[str, Any]:
+        return self._limiter.metrics()
+
+    def get_persistent_state(self) -> dict[str, Any] | None:
+        now = time.time()
+        return {
+            "concurrency": self._limiter.to_dict(),
+            "last_video_dates": {
+                channel_id: [date.isoformat() if date else None, fetched_at]
+                for channel_id, (date, fetched_at) in self._last_video_dates.items()
+                # Expired entries would be refetched anyway; live markers are kept
+                if now - fetched_at < LAST_VIDEO_TTL or fetched_at == 0.0
+            },
+        }
+
+    def restore_persistent_state(self, state: dict[str, Any]) -> None:
+        self._limiter.load_dict(state.get("concurrency") or {})
+        for channel_id, (date, fetched_at) in (state.get("last_video_dates") or {}).items():
+            self._last_video_dates[channel_id] = (
+                datetime.fromisoformat(date) if date else None,
+                float(fetched_at),
+            )
+
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
         return {
@@ -87,18 +125,38 @@ class KickApiClient(BaseApiClient):
             return None
 
     async def _get_last_video_date(self, channel: Channel) -> datetime | None:
-        """Get the start time of the most recent video/VOD."""
+        """Get the start time of the most recent video/VOD (cached, see LAST_VIDEO_TTL)."""
+        cached = self._last_video_dates.get(channel.channel_id)
+        if cached is not None and time.time() - cached[1] < LAST_VIDEO_TTL:
+            return cached[0]
+
+        ok, date = await self._fetch_last_video_date(channel)
+        if cached is not None and cached[0] is not None and (date is None or date < cached[0]):
+            # The VOD of a stream that just ended may not be listed yet
+            date = cached[0]
+        if ok:
+            self._last_video_dates[channel.channel_id] = (date, time.time())
+        return date
+
+    async def _fetch_last_video_date(self, channel: Channel) -> tuple[bool, datetime | None]:
+        """Request the start time of the most recent video/VOD.
+
+        Returns:
+            (whether Kick answered, the date or None if there is no video).
+        """
         try:
             async with self.session.get(
                 f"{self.BASE_URL}/channels/{channel.channel_id}/videos",
                 headers=self._get_headers(),
             ) as resp:
                 if resp.status != 200:
-                    return None
+                    return False, None
 
                 data = await safe_json(resp)
-                if not data or not isinstance(data, list) or len(data) == 0:
-                    return None
+                if data is None:
+                    return False, None
+                if not isinstance(data, list) or len(data) == 0:
+                    return True, None
 
                 # Get the first (most recent) video
                 video = data[0]
@@ -110,14 +168,15 @@ class KickApiClient(BaseApiClient):
                         # Add UTC timezone if not present
                         if dt.tzinfo is None:
                             dt = dt.replace(tzinfo=timezone.utc)
-                        return dt
+                        return True, dt
                     except ValueError:
                         pass
+                return True, None
 
         except aiohttp.ClientError:
             pass
 
-        return None
+        return False, None
 
     async def get_livestream(self, channel: Channel) -> Livestream:
         """Get livestream status for a channel."""
@@ -177,6 +236,9 @@ class KickApiClient(BaseApiClient):
                 thumbnail = livestream_data.get("thumbnail")
                 thumbnail_url = thumbnail.get("url") if thumbnail else None
 
+                # Remember the stream start and refetch the VOD date once it ends
+                self._last_video_dates[channel.channel_id] = (start_time, 0.0)
+
                 # Extract chatroom ID for built-in chat
                 chatroom_id = None
                 chatroom_data = data.get("chatroom", {})
@@ -212,11 +274,9 @@ class KickApiClient(BaseApiClient):
             return []
 
         # Kick doesn't have a batch endpoint, so we query individually
-        # but run them concurrently with a semaphore to limit parallel requests
-        semaphore = asyncio.Semaphore(self.concurrency)
-
+        # but run them concurrently under the adaptive concurrency limit
         async def fetch_with_semaphore(channel: Channel) -> Livestream:
-            async with semaphore:
+            async with self._limiter:
                 return await self.get_livestream(channel)
 
         tasks = [fetch_with_semaphore(channel) for channel in channels]
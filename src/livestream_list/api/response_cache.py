@@ -0,0 +1,158 @@
+"""Persistent cache of HTTP response bodies for conditional revalidation.
+
+Emote and badge payloads (7TV, BTTV, FFZ and Twitch global and channel
+sets) rarely change but are fetched whenever a chat opens. This store keeps
+the last 200 response for each URL with its ETag/Last-Modified validators
+and fetch time in one SQLite database shared by every thread, so
+SharedHttpPool.get_cached() can answer from disk at once and revalidate
+with a conditional request in the background.
+
+Entries not refreshed for EXPIRE_AFTER are dropped when the database is
+opened, so channels that are no longer watched do not accumulate.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlencode
+
+from ..core.settings import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Entries not revalidated for this long are deleted
+EXPIRE_AFTER = 30 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT NOT NULL,
+    last_modified TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored 200 response body, last confirmed current at fetched_at (Unix time)."""
+
+    key: str
+    url: str
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+    fetched_at: float = 0.0
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the body was fetched or last revalidated."""
+        if now is None:
+            now = time.time()
+        return now - self.fetched_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers asking the server to answer 304 if unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(url: str, params: Mapping[str, str] | None = None) -> str:
+    """Cache key for a GET of url with params."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+
+class ResponseCache:
+    """SQLite-backed response store. Thread-safe."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Database file path."""
+        if self._path is None:
+            self._path = get_data_dir() / "http_cache.db"
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and drop expired entries on first use (call with _lock held)."""
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        expired = conn.execute(
+            "DELETE FROM responses WHERE fetched_at < ?", (time.time() - EXPIRE_AFTER,)
+        ).rowcount
+        if expired:
+            logger.debug(f"Dropped {expired} expired cached responses")
+        self._conn = conn
+        return conn
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for key, however old."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT key, url, body, etag, last_modified, fetched_at "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        return CachedResponse(*row) if row is not None else None
+
+    def put(self, entry: CachedResponse) -> None:
+        """Insert or replace an entry."""
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.url,
+                    entry.body,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.fetched_at,
+                ),
+            )
+
+    def touch(self, key: str, fetched_at: float) -> None:
+        """Mark an entry as confirmed current (after a 304)."""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (fetched_at, key)
+            )
+
+    def close(self) -> None:
+        """Close the database (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    return _cache
@@ -2,17 +2,24 @@
 
 import asyncio
 import logging
+import time
 import webbrowser
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
 
+from ..core import json_codec
 from ..core.models import Channel, Livestream, StreamPlatform
 from ..core.settings import TwitchSettings
 from .base import BaseApiClient, safe_json
+from .batch_tuning import PARTIAL, THROTTLED, TIMEOUT, AdaptiveBatchSizer
+from .host_limits import RateLimitedError
 from .oauth_server import OAuthServer
+from .twitch_users import TwitchUser, TwitchUserStore, get_user_store
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,113 @@ OAUTH_SCOPES = (
 )
 
 
+# Twitch asks apps to validate user tokens hourly. A validation result is
+# trusted until then (or the token's expiry, if sooner) and renewed in the
+# background during the last TOKEN_REVALIDATE_MARGIN seconds.
+TOKEN_VALIDATE_INTERVAL = 3600.0
+TOKEN_REVALIDATE_MARGIN = 300.0
+
+# Starting channels per aliased GraphQL query and batches in flight. The
+# batch sizers tune both from observed latency and errors: Twitch GraphQL has
+# undocumented query complexity limits, so the right size depends on the
+# selection and on how Twitch is doing today. Parallelism starts below the
+# session's connection limit, grows by one after rounds it held back, and
+# halves after 429s.
+GQL_BATCH_SIZE = 35
+GQL_PARALLELISM = 16
+GQL_MAX_PARALLELISM = 50
+
+# Cold user lookups: users per GraphQL query, queries in flight, and users
+# per Helix /users request (the documented maximum)
+USER_BATCH_SIZE = 50
+USER_PARALLELISM = 8
+HELIX_USERS_MAX = 100
+
+# Per-user selections for the two-tier refresh: a liveness sweep over every
+# channel, then the full payload for live channels only
+_LIVENESS_FIELDS = "id stream { id type }"
+_FIRST_SWEEP_FIELDS = "id stream { id type } lastBroadcast { startedAt }"
+_FULL_USER_FIELDS = """
+    id
+    login
+    displayName
+    stream {
+        id
+        title
+        viewersCount
+        createdAt
+        game {
+            name
+            slug
+        }
+    }
+    lastBroadcast {
+        startedAt
+    }
+"""
+# Selection for identity lookups
+_USER_FIELDS = "id login displayName profileImageURL(width: 70)"
+
+# (kind, batch) -> key -> user, or None if the request failed
+_UserFetcher = Callable[[str, list[str]], Awaitable[dict[str, TwitchUser] | None]]
+
+
+def _parse_gql_time(value: str | None) -> datetime | None:
+    """Parse a GraphQL ISO timestamp (with trailing Z)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _livestream_from_gql(channel: Channel, user_data: dict[str, Any]) -> Livestream:
+    """Build a Livestream from a GraphQL user payload."""
+    stream = user_data.get("stream")
+    if stream:
+        game_data = stream.get("game") or {}
+        return Livestream(
+            channel=channel,
+            live=True,
+            title=stream.get("title"),
+            game=game_data.get("name") if game_data else None,
+            game_slug=game_data.get("slug") if game_data else None,
+            viewers=stream.get("viewersCount", 0),
+            start_time=_parse_gql_time(stream.get("createdAt")),
+        )
+
+    # Get last broadcast time for offline channels
+    last_broadcast = user_data.get("lastBroadcast") or {}
+    return Livestream(
+        channel=channel,
+        live=False,
+        last_live_time=_parse_gql_time(last_broadcast.get("startedAt")),
+    )
+
+
+def _user_from_gql(user_data: dict[str, Any]) -> TwitchUser:
+    """Build a TwitchUser from a GraphQL user payload."""
+    return TwitchUser(
+        id=str(user_data["id"]),
+        login=user_data["login"],
+        display_name=user_data.get("displayName") or user_data["login"],
+        profile_image_url=user_data.get("profileImageURL") or "",
+        verified_at=time.time(),
+    )
+
+
+def _user_from_helix(user_data: dict[str, Any]) -> TwitchUser:
+    """Build a TwitchUser from a Helix /users entry."""
+    return TwitchUser(
+        id=str(user_data["id"]),
+        login=user_data["login"],
+        display_name=user_data.get("display_name") or user_data["login"],
+        profile_image_url=user_data.get("profile_image_url") or "",
+        verified_at=time.time(),
+    )
+
+
 class TwitchApiClient(BaseApiClient):
     """Client for Twitch Helix API."""
 
@@ -37,12 +151,38 @@ class TwitchApiClient(BaseApiClient):
     AUTH_URL = "https://id.twitch.tv/oauth2"
     GQL_URL = "https://gql.twitch.tv/gql"
 
-    def __init__(self, settings: TwitchSettings) -> None:
+    def __init__(self, settings: TwitchSettings, user_store: TwitchUserStore | None = None) -> None:
         super().__init__()
         self.settings = settings
-        self._user_cache: dict[str, dict[str, Any]] = {}
+        # Persistent identity cache shared with other clients and threads
+        self._users = user_store or get_user_store()
         self._current_user_id: str | None = None
         self._display_name_resolved: bool = False
+        # Last /validate result: the token it was for, whether it was valid,
+        # and until when (monotonic) it can be reused
+        self._validated_token: str | None = None
+        self._token_valid = False
+        self._token_valid_until = 0.0
+        self._revalidate_task: asyncio.Task[bool] | None = None
+        # Lowercased logins already swept once (lastBroadcast fetched)
+        self._swept_logins: set[str] = set()
+        # Lowercased login -> detail payload of its current stream
+        self._stream_details: dict[str, dict[str, Any]] = {}
+        # Learned batch size/parallelism per refresh tier (persisted)
+        self._sweep_sizer = AdaptiveBatchSizer(
+            "twitch-sweep",
+            GQL_BATCH_SIZE,
+            GQL_PARALLELISM,
+            max_batch_size=100,
+            max_parallelism=GQL_MAX_PARALLELISM,
+        )
+        self._detail_sizer = AdaptiveBatchSizer(
+            "twitch-detail",
+            GQL_BATCH_SIZE,
+            GQL_PARALLELISM,
+            max_batch_size=50,
+            max_parallelism=GQL_MAX_PARALLELISM,
+        )
 
     @property
     def platform(self) -> StreamPlatform:
@@ -64,6 +204,10 @@ class TwitchApiClient(BaseApiClient):
             "Authorization": f"Bearer {self.settings.access_token}",
         }
 
+    def helix_headers(self) -> dict[str, str]:
+        """Headers for authenticated Helix API requests made outside this client."""
+        return self._get_headers()
+
     def _get_gql_headers(self) -> dict[str, str]:
         """Get headers for GraphQL requests (no auth required for public data)."""
         return {
@@ -71,58 +215,112 @@ class TwitchApiClient(BaseApiClient):
             "Content-Type": "application/json",
         }
 
+    def get_persistent_state(self) -> dict[str, Any] | None:
+        return {
+            "gql_sweep": self._sweep_sizer.to_dict(),
+            "gql_detail": self._detail_sizer.to_dict(),
+        }
+
+    def restore_persistent_state(self, state: dict[str, Any]) -> None:
+        self._sweep_sizer.load_dict(state.get("gql_sweep") or {})
+        self._detail_sizer.load_dict(state.get("gql_detail") or {})
+
+    def forget_channel(self, channel_id: str) -> None:
+        # A re-added channel gets its lastBroadcast first sweep again
+        key = channel_id.lower()
+        self._swept_logins.discard(key)
+        self._stream_details.pop(key, None)
+
     async def is_authorized(self) -> bool:
         """Check if we have a valid access token.
 
         Note: Returns True even without token since GraphQL works unauthenticated.
         The token is only needed for importing follows.
+
+        Validation results are cached per token (see TOKEN_VALIDATE_INTERVAL)
+        and dropped on any 401 from Twitch, so this only hits the network
+        about once an hour.
         """
         # GraphQL API works without authentication, so always return True
         # for basic stream status checking
-        if not self.settings.access_token:
+        token = self.settings.access_token
+        if not token:
             return True  # GraphQL doesn't need auth
 
+        if token == self._validated_token:
+            remaining = self._token_valid_until - time.monotonic()
+            if not self._token_valid:
+                return False
+            if remaining > TOKEN_REVALIDATE_MARGIN:
+                return True
+            if remaining > 0:
+                if self._revalidate_task is None or self._revalidate_task.done():
+                    self._revalidate_task = asyncio.create_task(self._validate_token(token))
+                return True
+        return await self._validate_token(token)
+
+    async def _validate_token(self, token: str) -> bool:
+        """Validate a token with Twitch and cache the result.
+
+        Only definite answers are cached: a 200, or a 401 for a rejected token.
+        """
         try:
             async with self.session.get(
                 f"{self.AUTH_URL}/validate",
-                headers={"Authorization": f"OAuth {self.settings.access_token}"},
+                headers={"Authorization": f"OAuth {token}"},
             ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    self._current_user_id = data.get("user_id")
-                    login = data.get("login", "")
-                    if login:
-                        current = self.settings.login_name
-                        if (
-                            not self._display_name_resolved
-                            or not current
-                            or current.lower() != login.lower()
-                        ):
-                            display = await self._fetch_display_name(self._current_user_id)
-                            self.settings.login_name = display or login
-                            self._display_name_resolved = True
-                    return True
-                return False
+                if resp.status == 401:
+                    self._cache_validation(token, False, TOKEN_VALIDATE_INTERVAL)
+                    return False
+                if resp.status != 200:
+                    return False
+                data = await resp.json(loads=json_codec.loads)
         except aiohttp.ClientError:
             return False
 
+        if token != self.settings.access_token:
+            return False  # Logged out or replaced meanwhile
+        expires_in = data.get("expires_in") or TOKEN_VALIDATE_INTERVAL
+        self._cache_validation(token, True, min(float(expires_in), TOKEN_VALIDATE_INTERVAL))
+        self._current_user_id = data.get("user_id")
+        login = data.get("login", "")
+        if login:
+            current = self.settings.login_name
+            if not self._display_name_resolved or not current or current.lower() != login.lower():
+                display = await self._fetch_display_name(self._current_user_id)
+                self.settings.login_name = display or login
+                self._display_name_resolved = True
+        return True
+
+    def _cache_validation(self, token: str, valid: bool, ttl: float) -> None:
+        self._validated_token = token
+        self._token_valid = valid
+        self._token_valid_until = time.monotonic() + ttl
+
+    def invalidate_authorization(self) -> None:
+        """Forget the cached token validation so the next check revalidates."""
+        self._validated_token = None
+        self._token_valid_until = 0.0
+
+    def _trace_configs(self) -> list[aiohttp.TraceConfig]:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_end(
+            session: aiohttp.ClientSession,
+            ctx: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            # A user token rejected anywhere means the cached validation is stale
+            if params.response.status == 401 and "Authorization" in params.headers:
+                self.invalidate_authorization()
+
+        trace_config.on_request_end.append(on_request_end)
+        return [trace_config]
+
     async def _fetch_display_name(self, user_id: str) -> str | None:
-        """Fetch the properly-cased display_name for a user from /helix/users."""
-        try:
-            async with self.session.get(
-                f"{self.BASE_URL}/users",
-                headers=self._get_headers(),
-                params={"id": user_id},
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    users = data.get("data", [])
-                    if users:
-                        name: str | None = users[0].get("display_name")
-                        return name
-        except aiohttp.ClientError:
-            pass
-        return None
+        """Get the properly-cased display_name for a user id."""
+        user = (await self.get_users_by_id([user_id])).get(user_id)
+        return user.display_name if user else None
 
     async def authorize(self) -> bool:
         """
@@ -144,7 +342,7 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return False
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
                 self.settings.access_token = data["access_token"]
                 return True
         except (aiohttp.ClientError, KeyError):
@@ -235,89 +433,39 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return None
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
                 users = data.get("data", [])
                 if users:
                     user: dict[str, Any] = users[0]
                     self._current_user_id = user["id"]
+                    self._users.put([_user_from_helix(user)])
                     return user
         except aiohttp.ClientError:
             pass
         return None
 
-    async def _get_user(self, login: str) -> dict[str, Any] | None:
-        """Get user info by login name."""
-        if login.lower() in self._user_cache:
-            return self._user_cache[login.lower()]
+    async def get_authenticated_user(self) -> TwitchUser | None:
+        """Return the user the access token belongs to.
 
-        # Try GraphQL first (no auth required)
-        user = await self._get_user_gql(login)
-        if user:
-            return user
+        Uses the cached token validation and the identity cache, so repeated
+        calls rarely hit the network.
 
-        # Fall back to Helix API if authorized
-        if not await self.is_authorized():
-            return None
-
-        try:
-            async with self.session.get(
-                f"{self.BASE_URL}/users",
-                headers=self._get_headers(),
-                params={"login": login},
-            ) as resp:
-                if resp.status != 200:
-                    return None
-
-                data = await resp.json()
-                users = data.get("data", [])
-                if not users:
-                    return None
-
-                helix_user: dict[str, Any] = users[0]
-                self._user_cache[login.lower()] = helix_user
-                return helix_user
-        except aiohttp.ClientError:
-            return None
-
-    async def _get_user_gql(self, login: str) -> dict[str, Any] | None:
-        """Get user info via GraphQL (no auth required)."""
-        query = """
-        query GetUser($login: String!) {
-            user(login: $login) {
-                id
-                login
-                displayName
-            }
-        }
+        Returns:
+            The user, or None if the token is missing or invalid.
         """
-
-        try:
-            async with self.session.post(
-                self.GQL_URL,
-                headers=self._get_gql_headers(),
-                json={
-                    "query": query,
-                    "variables": {"login": login},
-                },
-            ) as resp:
-                if resp.status != 200:
-                    return None
-
-                data = await resp.json()
-                user_data = data.get("data", {}).get("user")
-                if not user_data:
-                    return None
-
-                # Convert to Helix format
-                user = {
-                    "id": user_data["id"],
-                    "login": user_data["login"],
-                    "display_name": user_data["displayName"],
-                }
-                self._user_cache[login.lower()] = user
-                return user
-        except aiohttp.ClientError:
+        if not await self.is_authorized() or not self._current_user_id:
             return None
+        user_id = self._current_user_id
+        user = (await self.get_users_by_id([user_id])).get(user_id)
+        if user is None:
+            # Lookup failed; the validation still named the account
+            login = self.settings.login_name
+            user = TwitchUser(id=user_id, login=login.lower(), display_name=login)
+        return user
+
+    async def _get_user(self, login: str) -> TwitchUser | None:
+        """Get user info by login name."""
+        return (await self.get_users_by_login([login])).get(login.lower())
 
     async def _get_stream_gql(self, login: str) -> dict[str, Any] | None:
         """Get stream info via GraphQL (no auth required)."""
@@ -356,72 +504,91 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return None
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
                 user_data: dict[str, Any] | None = data.get("data", {}).get("user")
                 return user_data
         except aiohttp.ClientError:
             return None
 
-    async def _get_streams_gql_batch(self, logins: list[str]) -> dict[str, dict[str, Any] | None]:
-        """Get stream info for multiple channels via GraphQL in a single request."""
-        if not logins:
-            return {}
+    async def _get_streams_gql_batch(
+        self,
+        logins: list[str],
+        fields: str | None = None,
+        fields_by_login: dict[str, str] | None = None,
+        sizer: AdaptiveBatchSizer | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Get user/stream info for multiple channels via GraphQL in a single request.
 
-        # Build query with aliases for each user
-        # Example: u0: user(login: "channel1") { ... } u1: user(login: "channel2") { ... }
-        user_fragment = """
-            id
-            login
-            displayName
-            stream {
-                id
-                title
-                viewersCount
-                createdAt
-                game {
-                    name
-                    slug
-                }
-            }
-            lastBroadcast {
-                startedAt
-            }
+        Args:
+            logins: Channel logins to query.
+            fields: GraphQL selection requested for each user (defaults to
+                the full stream payload).
+            fields_by_login: Lowercased login -> selection overriding fields.
+            sizer: Batch sizer to report each attempt's latency and errors to.
+
+        Returns:
+            Lowercased login -> user payload (None if the user doesn't exist).
+            Empty if the request failed.
         """
+        if not logins:
+            return {}
 
         # Build aliased queries
+        # Example: u0: user(login: "channel1") { ... } u1: user(login: "channel2") { ... }
         queries = []
         for i, login in enumerate(logins):
             # Escape quotes in login name
             escaped_login = login.replace('"', '\\"')
-            queries.append(f'u{i}: user(login: "{escaped_login}") {{ {user_fragment} }}')
+            selection = (fields_by_login or {}).get(login.lower(), fields or _FULL_USER_FIELDS)
+            queries.append(f'u{i}: user(login: "{escaped_login}") {{ {selection} }}')
 
         query = "query GetStreamsBatch { " + " ".join(queries) + " }"
 
-        async def do_request() -> dict[str, dict[str, Any] | None]:
-            async with self.session.post(
-                self.GQL_URL,
-                headers=self._get_gql_headers(),
-                json={"query": query},
-            ) as resp:
-                if self._is_retryable_status(resp.status):
-                    raise aiohttp.ClientResponseError(
-                        resp.request_info, resp.history, status=resp.status
-                    )
-                if resp.status != 200:
-                    logger.warning(f"GraphQL batch query failed with status {resp.status}")
-                    return {}
+        def report(latency: float | None = None, error: str | None = None) -> None:
+            if sizer is not None:
+                sizer.record(len(logins), latency, error)
 
-                data = await safe_json(resp)
-                if not data or not isinstance(data, dict):
-                    return {}
-                result_data = data.get("data", {})
+        async def do_request() -> dict[str, dict[str, Any] | None]:
+            started = time.monotonic()
+            try:
+                async with self.session.post(
+                    self.GQL_URL,
+                    headers=self._get_gql_headers(),
+                    json={"query": query},
+                ) as resp:
+                    if resp.status == 429:
+                        report(error=THROTTLED)
+                    if self._is_retryable_status(resp.status):
+                        raise aiohttp.ClientResponseError(
+                            resp.request_info, resp.history, status=resp.status
+                        )
+                    if resp.status != 200:
+                        logger.warning(f"GraphQL batch query failed with status {resp.status}")
+                        return {}
+
+                    data = await safe_json(resp)
+            except asyncio.TimeoutError:
+                report(error=TIMEOUT)
+                raise
+            except RateLimitedError:
+                report(error=THROTTLED)
+                raise
+
+            if not data or not isinstance(data, dict):
+                return {}
+            if data.get("errors"):
+                # Usually query complexity or upstream timeouts for some aliases
+                report(error=PARTIAL)
+            else:
+                report(time.monotonic() - started)
+            result_data = data.get("data") or {}
 
-                # Map results back to login names
-                result: dict[str, dict[str, Any] | None] = {}
-                for i, login in enumerate(logins):
-                    result[login.lower()] = result_data.get(f"u{i}")
+            # Map results back to login names
+            result: dict[str, dict[str, Any] | None] = {}
+            for i, login in enumerate(logins):
+                result[login.lower()] = result_data.get(f"u{i}")
 
-                return result
+            return result
 
         try:
             return await self._retry_with_backoff(do_request)
@@ -429,31 +596,194 @@ class TwitchApiClient(BaseApiClient):
             logger.warning(f"GraphQL batch query error after retries: {e}")
             return {}
 
-    async def _get_users_by_ids(self, user_ids: list[str]) -> dict[str, dict[str, Any]]:
-        """Get multiple users by their IDs."""
-        result: dict[str, dict[str, Any]] = {}
+    async def _query_gql_batches(
+        self,
+        logins: list[str],
+        fields: str,
+        sizer: AdaptiveBatchSizer,
+        fields_by_login: dict[str, str] | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Run _get_streams_gql_batch over logins with the sizer's batch size and parallelism.
+
+        Only lookups that can fill a batch, made while no other round is in
+        progress, are reported to the sizer. Small ad-hoc lookups (such as
+        confirming a pushed event) use the learned values untuned, so they
+        neither reset a concurrent refresh's round nor skew the tuning.
 
-        if not await self.is_authorized():
-            return result
+        Returns:
+            Merged results; logins from failed batches are missing.
+        """
+        tune = not sizer.in_round and len(logins) >= sizer.min_batch_size
+        batches = sizer.split(logins) if tune else sizer.chunk(logins)
+        semaphore = asyncio.Semaphore(sizer.parallelism)
+        reporter = sizer if tune else None
 
-        # Twitch allows up to 100 users per request
-        for i in range(0, len(user_ids), 100):
-            batch = user_ids[i : i + 100]
+        async def run_batch(batch: list[str]) -> dict[str, dict[str, Any] | None]:
+            async with semaphore:
+                return await self._get_streams_gql_batch(batch, fields, fields_by_login, reporter)
 
-            try:
-                params = "&".join(f"id={uid}" for uid in batch)
-                async with self.session.get(
-                    f"{self.BASE_URL}/users?{params}",
-                    headers=self._get_headers(),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for user in data.get("data", []):
-                            result[user["id"]] = user
-                            self._user_cache[user["login"].lower()] = user
-            except aiohttp.ClientError:
+        try:
+            batch_results = await asyncio.gather(
+                *[run_batch(batch) for batch in batches], return_exceptions=True
+            )
+        finally:
+            if tune:
+                sizer.end_round()
+
+        merged: dict[str, dict[str, Any] | None] = {}
+        for batch_idx, results in enumerate(batch_results):
+            if isinstance(results, BaseException):
+                logger.error(f"Twitch batch {batch_idx} failed: {results}")
                 continue
+            merged.update(results)
+        return merged
 
+    async def get_users_by_login(self, logins: Sequence[str]) -> dict[str, TwitchUser]:
+        """Resolve logins to users through the persistent identity cache.
+
+        Returns:
+            Lowercased login -> user. Unknown logins are missing.
+        """
+        keys = list(dict.fromkeys(login.lower() for login in logins if login))
+        return await self._resolve_users("login", keys, self._users.get_by_logins(keys))
+
+    async def get_users_by_id(self, user_ids: Sequence[str]) -> dict[str, TwitchUser]:
+        """Resolve user ids to users through the persistent identity cache.
+
+        Returns:
+            User id -> user. Unknown ids are missing.
+        """
+        keys = list(dict.fromkeys(uid for uid in user_ids if uid.isdigit()))
+        return await self._resolve_users("id", keys, self._users.get_by_ids(keys))
+
+    async def _resolve_users(
+        self, kind: str, keys: list[str], cached: dict[str, TwitchUser]
+    ) -> dict[str, TwitchUser]:
+        """Fetch missing and expired users, falling back to cached records.
+
+        Args:
+            kind: "login" or "id".
+            keys: Lowercased logins or user ids.
+            cached: Records already in the store, by key.
+        """
+        now = time.time()
+        stale = [key for key in keys if key not in cached or not cached[key].is_fresh(now)]
+        if not stale:
+            return cached
+
+        fetched, failed = await self._fetch_users(kind, stale)
+        self._users.put(fetched.values())
+        result = {key: user for key, user in cached.items() if key not in stale}
+        for key in stale:
+            if key in fetched:
+                result[key] = fetched[key]
+            elif key in failed and key in cached:
+                # Lookup failed; an expired record beats none
+                result[key] = cached[key]
+        return result
+
+    async def _fetch_users(
+        self, kind: str, keys: list[str]
+    ) -> tuple[dict[str, TwitchUser], set[str]]:
+        """Look up users via concurrent GraphQL batches, then Helix for failed batches.
+
+        Returns:
+            (key -> user for users that exist, keys whose lookup failed).
+        """
+        batches = [keys[i : i + USER_BATCH_SIZE] for i in range(0, len(keys), USER_BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(USER_PARALLELISM)
+
+        async def run_batch(batch: list[str], fetch: _UserFetcher) -> dict[str, TwitchUser] | None:
+            async with semaphore:
+                return await fetch(kind, batch)
+
+        fetched: dict[str, TwitchUser] = {}
+        failed: list[str] = []
+        results = await asyncio.gather(*[run_batch(b, self._fetch_users_gql) for b in batches])
+        for batch, found in zip(batches, results):
+            if found is None:
+                failed.extend(batch)
+            else:
+                fetched.update(found)
+
+        if failed and self.settings.access_token:
+            batches = [
+                failed[i : i + HELIX_USERS_MAX] for i in range(0, len(failed), HELIX_USERS_MAX)
+            ]
+            results = await asyncio.gather(
+                *[run_batch(b, self._fetch_users_helix) for b in batches]
+            )
+            failed = []
+            for batch, found in zip(batches, results):
+                if found is None:
+                    failed.extend(batch)
+                else:
+                    fetched.update(found)
+
+        if failed:
+            logger.warning(f"Could not resolve {len(failed)} Twitch users by {kind}")
+        return fetched, set(failed)
+
+    async def _fetch_users_gql(self, kind: str, keys: list[str]) -> dict[str, TwitchUser] | None:
+        """Look up one batch of users via aliased GraphQL (no auth required).
+
+        Returns:
+            Key -> user for users that exist, or None if the request failed.
+        """
+        queries = []
+        for i, key in enumerate(keys):
+            escaped = key.replace('"', '\\"')
+            queries.append(f'u{i}: user({kind}: "{escaped}") {{ {_USER_FIELDS} }}')
+        query = "query GetUsers { " + " ".join(queries) + " }"
+
+        try:
+            async with self.session.post(
+                self.GQL_URL,
+                headers=self._get_gql_headers(),
+                json={"query": query},
+            ) as resp:
+                if resp.status != 200:
+                    logger.warning(f"GraphQL user lookup failed with status {resp.status}")
+                    return None
+                data = await safe_json(resp)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"GraphQL user lookup error: {e}")
+            return None
+
+        if not isinstance(data, dict) or not isinstance(data.get("data"), dict):
+            return None
+        result: dict[str, TwitchUser] = {}
+        for i, key in enumerate(keys):
+            user_data = data["data"].get(f"u{i}")
+            if user_data and user_data.get("id") and user_data.get("login"):
+                result[key] = _user_from_gql(user_data)
+        return result
+
+    async def _fetch_users_helix(self, kind: str, keys: list[str]) -> dict[str, TwitchUser] | None:
+        """Look up up to 100 users via Helix /users (requires a token).
+
+        Returns:
+            Key -> user for users that exist, or None if the request failed.
+        """
+        try:
+            async with self.session.get(
+                f"{self.BASE_URL}/users",
+                headers=self._get_headers(),
+                params=[(kind, key) for key in keys],
+            ) as resp:
+                if resp.status != 200:
+                    return None
+                data = await safe_json(resp)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Helix user lookup error: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        result: dict[str, TwitchUser] = {}
+        for user_data in data.get("data", []):
+            user = _user_from_helix(user_data)
+            result[user.id if kind == "id" else user.login.lower()] = user
         return result
 
     async def get_channel_info(self, channel_id: str) -> Channel | None:
@@ -463,9 +793,9 @@ class TwitchApiClient(BaseApiClient):
             return None
 
         return Channel(
-            channel_id=user["login"],
+            channel_id=user.login,
             platform=StreamPlatform.TWITCH,
-            display_name=user["display_name"],
+            display_name=user.display_name,
         )
 
     async def get_livestream(self, channel: Channel) -> Livestream:
@@ -474,39 +804,7 @@ class TwitchApiClient(BaseApiClient):
         user_data = await self._get_stream_gql(channel.channel_id)
 
         if user_data:
-            stream = user_data.get("stream")
-            if stream:
-                start_time = None
-                if stream.get("createdAt"):
-                    try:
-                        start_time = datetime.fromisoformat(
-                            stream["createdAt"].replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        pass
-
-                game_data = stream.get("game") or {}
-                return Livestream(
-                    channel=channel,
-                    live=True,
-                    title=stream.get("title"),
-                    game=game_data.get("name") if game_data else None,
-                    game_slug=game_data.get("slug") if game_data else None,
-                    viewers=stream.get("viewersCount", 0),
-                    start_time=start_time,
-                )
-
-            # Get last broadcast time for offline channels
-            last_live_time = None
-            last_broadcast = user_data.get("lastBroadcast")
-            if last_broadcast and last_broadcast.get("startedAt"):
-                try:
-                    last_live_time = datetime.fromisoformat(
-                        last_broadcast["startedAt"].replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    pass
-            return Livestream(channel=channel, live=False, last_live_time=last_live_time)
+            return _livestream_from_gql(channel, user_data)
 
         # Fall back to Helix API
         streams = await self.get_livestreams([channel])
@@ -516,98 +814,81 @@ class TwitchApiClient(BaseApiClient):
         return Livestream(channel=channel, live=False)
 
     async def get_livestreams(self, channels: list[Channel]) -> list[Livestream]:
-        """Get livestream status for multiple channels using batched GraphQL queries."""
+        """Get livestream status for multiple channels using batched GraphQL queries.
+
+        Runs in two tiers: a liveness sweep asking only for each channel's
+        stream id, then a detail query (title, game, viewers, start time) for
+        the channels that are live. lastBroadcast is only requested the first
+        time a channel is swept; afterwards Livestream.update_from() keeps
+        last_live_time current.
+
+        A live channel whose details could not be fetched (and has none
+        cached for its current stream) is left out of the result, so the
+        caller keeps its previous state instead of a blank title and game
+        and polls it again on the next refresh.
+        """
         if not channels:
             return []
 
         channel_map = {c.channel_id.lower(): c for c in channels}
-
-        # Batch channels into groups for parallel requests. 35 balances GraphQL
-        # query complexity limits with efficient parallelism (fewer large batches
-        # vs. many small ones). Twitch GraphQL has undocumented query size limits.
-        batch_size = 35
         all_logins = [c.channel_id for c in channels]
 
-        # Create all batch requests
-        batches = [all_logins[i : i + batch_size] for i in range(0, len(all_logins), batch_size)]
-
-        # Execute all batches in parallel
-        batch_results_list = await asyncio.gather(
-            *[self._get_streams_gql_batch(batch) for batch in batches],
-            return_exceptions=True,
+        first_sweep = {
+            login.lower(): _FIRST_SWEEP_FIELDS
+            for login in all_logins
+            if login.lower() not in self._swept_logins
+        }
+        sweep = await self._query_gql_batches(
+            all_logins, _LIVENESS_FIELDS, self._sweep_sizer, first_sweep
         )
 
-        # Process results
+        live_logins = [
+            login for login in all_logins if (sweep.get(login.lower()) or {}).get("stream")
+        ]
+        details = await self._query_gql_batches(live_logins, _FULL_USER_FIELDS, self._detail_sizer)
+
         result: list[Livestream] = []
-        for batch_idx, batch_logins in enumerate(batches):
-            batch_results = batch_results_list[batch_idx]
-
-            # Handle exceptions from gather
-            if isinstance(batch_results, BaseException):
-                logger.error(f"Twitch batch {batch_idx} failed: {batch_results}")
-                # Mark all channels in this batch as offline with error
-                for login in batch_logins:
-                    channel = channel_map[login.lower()]
-                    result.append(
-                        Livestream(
-                            channel=channel,
-                            live=False,
-                            error_message=str(batch_results),
-                        )
-                    )
+        for login in all_logins:
+            key = login.lower()
+            channel = channel_map[key]
+            if key not in sweep:
+                # Batch failed; report offline as before
+                result.append(Livestream(channel=channel, live=False))
                 continue
-
-            for login in batch_logins:
-                channel = channel_map[login.lower()]
-                user_data = batch_results.get(login.lower())
-
-                if user_data:
-                    stream = user_data.get("stream")
-                    if stream:
-                        start_time = None
-                        if stream.get("createdAt"):
-                            try:
-                                start_time = datetime.fromisoformat(
-                                    stream["createdAt"].replace("Z", "+00:00")
-                                )
-                            except ValueError:
-                                pass
-
-                        game_data = stream.get("game") or {}
-                        result.append(
-                            Livestream(
-                                channel=channel,
-                                live=True,
-                                title=stream.get("title"),
-                                game=game_data.get("name") if game_data else None,
-                                game_slug=game_data.get("slug") if game_data else None,
-                                viewers=stream.get("viewersCount", 0),
-                                start_time=start_time,
-                            )
-                        )
-                    else:
-                        # Get last broadcast time for offline channels
-                        last_live_time = None
-                        last_broadcast = user_data.get("lastBroadcast")
-                        if last_broadcast and last_broadcast.get("startedAt"):
-                            try:
-                                last_live_time = datetime.fromisoformat(
-                                    last_broadcast["startedAt"].replace("Z", "+00:00")
-                                )
-                            except ValueError:
-                                pass
-                        result.append(
-                            Livestream(
-                                channel=channel,
-                                live=False,
-                                last_live_time=last_live_time,
-                            )
-                        )
+            self._swept_logins.add(key)
+            user_data = sweep[key]
+            if user_data and user_data.get("stream"):
+                detail = details.get(key)
+                if detail and detail.get("stream"):
+                    self._stream_details[key] = detail
+                    user_data = detail
                 else:
-                    result.append(Livestream(channel=channel, live=False))
+                    # Detail query failed; reuse the last details for this stream
+                    cached = self._stream_details.get(key)
+                    stream_id = user_data["stream"].get("id")
+                    if not cached or cached["stream"].get("id") != stream_id:
+                        logger.debug(f"No stream details for {login}; keeping previous state")
+                        continue
+                    user_data = cached
+            else:
+                self._stream_details.pop(key, None)
+
+            if user_data:
+                result.append(_livestream_from_gql(channel, user_data))
+            else:
+                result.append(Livestream(channel=channel, live=False))
 
         return result
 
+    async def get_user_ids(self, logins: list[str]) -> dict[str, str]:
+        """Resolve channel logins to Twitch user ids.
+
+        Returns:
+            Lowercased login -> user id. Unknown logins are missing.
+        """
+        users = await self.get_users_by_login(logins)
+        return {login: user.id for login, user in users.items()}
+
     async def get_followed_channels(self, user_id: str | None = None) -> list[Channel]:
         """Get channels followed by a user. Uses current user if user_id is None."""
         if not await self.is_authorized():
@@ -618,7 +899,7 @@ class TwitchApiClient(BaseApiClient):
             user = await self._get_user(user_id)
             if not user:
                 return []
-            twitch_user_id = user["id"]
+            twitch_user_id = user.id
         elif self._current_user_id:
             twitch_user_id = self._current_user_id
         else:
@@ -628,6 +909,7 @@ class TwitchApiClient(BaseApiClient):
             twitch_user_id = current_user["id"]
 
         channels: list[Channel] = []
+        broadcasters: list[TwitchUser] = []
         cursor: str | None = None
 
         while True:
@@ -649,7 +931,7 @@ class TwitchApiClient(BaseApiClient):
                     if resp.status != 200:
                         break
 
-                    data = await resp.json()
+                    data = await resp.json(loads=json_codec.loads)
                     follows = data.get("data", [])
 
                     for follow in follows:
@@ -661,6 +943,14 @@ class TwitchApiClient(BaseApiClient):
                                 imported_by=user_id or "self",
                             )
                         )
+                        broadcasters.append(
+                            TwitchUser(
+                                id=follow["broadcaster_id"],
+                                login=follow["broadcaster_login"],
+                                display_name=follow["broadcaster_name"],
+                                verified_at=time.time(),
+                            )
+                        )
 
                     # Check for pagination
                     pagination = data.get("pagination", {})
@@ -671,6 +961,8 @@ class TwitchApiClient(BaseApiClient):
             except aiohttp.ClientError:
                 break
 
+        # Seed the identity cache so chats and push updates need no lookups
+        self._users.put(broadcasters)
         return channels
 
     async def get_top_streams(
@@ -697,7 +989,7 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return []
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
 
                 for stream_data in data.get("data", []):
                     start_time = None
@@ -758,7 +1050,7 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return []
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
 
                 for ch in data.get("data", []):
                     channels.append(
@@ -790,7 +1082,7 @@ class TwitchApiClient(BaseApiClient):
                 if resp.status != 200:
                     return []
 
-                data = await resp.json()
+                data = await resp.json(loads=json_codec.loads)
 
                 for game in data.get("data", []):
                     games.append(
@@ -811,3 +1103,4 @@ class TwitchApiClient(BaseApiClient):
         self.settings.access_token = ""
         self.settings.refresh_token = ""
         self._current_user_id = None
+        self.invalidate_authorization()
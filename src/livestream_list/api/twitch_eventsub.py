@@ -0,0 +1,330 @@
+"""Push-based Twitch go-live detection over EventSub WebSocket.
+
+Subscribes to stream.online (and, budget permitting, stream.offline) for a
+prioritized list of channels and reports each event, so StreamMonitor can
+refresh that channel within seconds instead of waiting for its next poll.
+
+Twitch caps the total cost of a WebSocket session's subscriptions (10 for
+user tokens; each stream.online/offline subscription costs 1 unless the
+broadcaster authorized the app). Channels are subscribed in the given order
+until Twitch refuses more, online first: offline changes of live channels
+are picked up quickly by regular polling anyway.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from .twitch import TwitchApiClient
+
+logger = logging.getLogger(__name__)
+
+EVENTSUB_WS_URL = "wss://eventsub.wss.twitch.tv/ws"
+SUBSCRIPTIONS_URL = "https://api.twitch.tv/helix/eventsub/subscriptions"
+
+# Reconnect backoff after connection errors (seconds)
+RECONNECT_MIN_DELAY = 5.0
+RECONNECT_MAX_DELAY = 300.0
+# How often the listen loop wakes to check for channel list changes (seconds)
+POLL_CHANGES_INTERVAL = 5.0
+
+
+class TwitchStreamEventSub:
+    """Maintains an EventSub WebSocket session with stream.online/offline subscriptions.
+
+    Runs as a task on the caller's event loop. Callbacks run on that loop.
+
+    Usage:
+        push = TwitchStreamEventSub(client, on_event, on_coverage)
+        push.set_channels(["favorite1", "other"])
+        push.start()
+        ...
+        await push.stop()
+    """
+
+    def __init__(
+        self,
+        client: TwitchApiClient,
+        on_event: Callable[[str, bool], None],
+        on_coverage: Callable[[set[str]], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            client: Twitch client whose session, token and user-id cache are used.
+            on_event: Called with (login, online) for each stream event. The
+                login is as passed to set_channels().
+            on_coverage: Called with the logins that have an active
+                stream.online subscription whenever that set changes.
+        """
+        self._client = client
+        self._on_event = on_event
+        self._on_coverage = on_coverage
+        self._logins: list[str] = []
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._covered: set[str] = set()
+        # Broadcaster user id -> login, for the current session
+        self._login_by_id: dict[str, str] = {}
+        # URL from a pending session_reconnect message
+        self._reconnect_url: str | None = None
+        # Logins ahead of the first stream.online subscription Twitch refused
+        # for the session's cost limit (None if the limit was not reached)
+        self._within_budget: list[str] | None = None
+
+    @property
+    def covered(self) -> set[str]:
+        """Logins with an active stream.online subscription."""
+        return set(self._covered)
+
+    def set_channels(self, logins: list[str]) -> None:
+        """Set the channels to subscribe to, highest priority first.
+
+        A change that could alter the subscriptions reconnects so they match
+        the list. Once the session has reached its cost limit, changes past
+        the channels that fit in it are only recorded.
+        """
+        if logins == self._logins:
+            return
+        self._logins = list(logins)
+        within = self._within_budget
+        if within is not None and self._logins[: len(within)] == within:
+            return
+        self._changed.set()
+
+    def start(self) -> None:
+        """Start the session task on the running loop (no-op if running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the session and wait for the task to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._set_covered(set())
+
+    def _set_covered(self, covered: set[str]) -> None:
+        if covered == self._covered:
+            return
+        self._covered = covered
+        if self._on_coverage is not None:
+            try:
+                self._on_coverage(set(covered))
+            except Exception as e:
+                logger.error(f"EventSub coverage callback error: {e}")
+
+    async def _run(self) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            self._changed.clear()
+            if not self._logins:
+                self._set_covered(set())
+                await self._changed.wait()
+                continue
+            try:
+                if await self._connect_and_listen():
+                    delay = RECONNECT_MIN_DELAY
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Stream EventSub connection error: {e}")
+            self._set_covered(set())
+            logger.info(f"Stream EventSub reconnecting in {delay:.0f}s")
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _connect_and_listen(self) -> bool:
+        """Run one session.
+
+        A session_reconnect moves the session to the URL Twitch sends, where
+        the subscriptions carry over, before the old socket is closed.
+
+        Returns:
+            True if the session ended in a way that warrants reconnecting
+            immediately (channel list changed).
+        """
+        self._reconnect_url = None
+        self._within_budget = None
+        logins = list(self._logins)
+        ids = await self._client.get_user_ids(logins)
+        self._login_by_id = {ids[login.lower()]: login for login in logins if login.lower() in ids}
+        if not self._login_by_id:
+            logger.warning("Stream EventSub: no channel ids resolved")
+            return False
+
+        ws = await self._client.session.ws_connect(EVENTSUB_WS_URL)
+        try:
+            session = await self._receive_welcome(ws)
+            if session is None:
+                return False
+            logger.info(f"Stream EventSub connected, session={session['id']}")
+            if not await self._subscribe_all(session["id"]):
+                return False
+
+            while True:
+                keepalive = float(session.get("keepalive_timeout_seconds") or 30) + 10
+                if not await self._listen(ws, keepalive):
+                    return False
+                if self._reconnect_url is None:
+                    return True
+
+                url, self._reconnect_url = self._reconnect_url, None
+                new_ws = await self._client.session.ws_connect(url)
+                try:
+                    session = await self._receive_welcome(new_ws)
+                except BaseException:
+                    await new_ws.close()
+                    raise
+                if session is None:
+                    await new_ws.close()
+                    return False
+                logger.info(f"Stream EventSub moved to session={session['id']}")
+                await ws.close()
+                ws = new_ws
+        finally:
+            await ws.close()
+
+    async def _receive_welcome(
+        self, ws: "aiohttp.ClientWebSocketResponse[bool]"
+    ) -> dict[str, Any] | None:
+        """Wait for the session_welcome message; returns its session (None if unexpected)."""
+        welcome = await asyncio.wait_for(ws.receive_json(), timeout=15)
+        if welcome.get("metadata", {}).get("message_type") != "session_welcome":
+            logger.warning(f"Stream EventSub: unexpected first message: {welcome}")
+            return None
+        session: dict[str, Any] = welcome["payload"]["session"]
+        return session
+
+    async def _listen(self, ws: "aiohttp.ClientWebSocketResponse[bool]", keepalive: float) -> bool:
+        """Handle messages until the channel list changes or Twitch asks to reconnect.
+
+        Returns:
+            False if the socket closed or went quiet for longer than keepalive.
+        """
+        last_message = time.monotonic()
+        while not self._changed.is_set():
+            try:
+                msg = await asyncio.wait_for(ws.receive(), timeout=POLL_CHANGES_INTERVAL)
+            except asyncio.TimeoutError:
+                if time.monotonic() - last_message > keepalive:
+                    logger.warning("Stream EventSub: keepalive timeout, reconnecting")
+                    return False
+                continue
+            last_message = time.monotonic()
+
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                self._handle_message(json.loads(msg.data))
+                if self._reconnect_url is not None:
+                    return True
+            elif msg.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                return False
+        return True
+
+    async def _subscribe_all(self, session_id: str) -> bool:
+        """Subscribe channels in priority order until Twitch refuses more.
+
+        Returns:
+            False if nothing could be subscribed.
+        """
+        covered: set[str] = set()
+        logins = list(self._logins)
+        ids = {login: uid for uid, login in self._login_by_id.items()}
+        ordered = [login for login in logins if login in ids]
+        try:
+            for event_type in ("stream.online", "stream.offline"):
+                for login in ordered:
+                    status = await self._subscribe(session_id, event_type, ids[login])
+                    if status == 429:
+                        if event_type == "stream.online":
+                            self._within_budget = logins[: logins.index(login)]
+                        logger.info(
+                            f"Stream EventSub: subscription limit reached, "
+                            f"{len(covered)} channels covered"
+                        )
+                        return bool(covered)
+                    if status in (401, 403):
+                        logger.warning(f"Stream EventSub: not authorized (HTTP {status})")
+                        return bool(covered)
+                    if status in (200, 202, 409) and event_type == "stream.online":
+                        covered.add(login)
+            return bool(covered)
+        finally:
+            self._set_covered(covered)
+
+    async def _subscribe(self, session_id: str, event_type: str, broadcaster_id: str) -> int:
+        """Create one subscription; returns the HTTP status (0 on network error)."""
+        payload = {
+            "type": event_type,
+            "version": "1",
+            "condition": {"broadcaster_user_id": broadcaster_id},
+            "transport": {"method": "websocket", "session_id": session_id},
+        }
+        headers = dict(self._client.helix_headers(), **{"Content-Type": "application/json"})
+        try:
+            async with self._client.session.post(
+                SUBSCRIPTIONS_URL,
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status not in (200, 202, 409, 429):
+                    body = await resp.text()
+                    logger.warning(
+                        f"Stream EventSub: {event_type} subscribe failed "
+                        f"(HTTP {resp.status}): {body[:200]}"
+                    )
+                return resp.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Stream EventSub: {event_type} subscribe error: {e}")
+            return 0
+
+    def _handle_message(self, data: dict[str, Any]) -> None:
+        """Handle one WebSocket message."""
+        msg_type = data.get("metadata", {}).get("message_type", "")
+        payload = data.get("payload", {})
+        if msg_type == "notification":
+            sub_type = payload.get("subscription", {}).get("type", "")
+            broadcaster_id = str(payload.get("event", {}).get("broadcaster_user_id", ""))
+            login = self._login_by_id.get(broadcaster_id)
+            if login is None or sub_type not in ("stream.online", "stream.offline"):
+                return
+            logger.info(f"Stream EventSub: {login} {sub_type.split('.')[1]}")
+            try:
+                self._on_event(login, sub_type == "stream.online")
+            except Exception as e:
+                logger.error(f"Stream EventSub event callback error: {e}")
+        elif msg_type == "session_reconnect":
+            url = payload.get("session", {}).get("reconnect_url")
+            logger.info("Stream EventSub: reconnect requested")
+            if url:
+                self._reconnect_url = url
+            else:
+                # Nowhere to move the session to; start over and resubscribe
+                self._changed.set()
+        elif msg_type == "revocation":
+            # Only this subscription is gone; the session and the rest stay
+            subscription = payload.get("subscription", {})
+            status = subscription.get("status", "unknown")
+            broadcaster_id = str(subscription.get("condition", {}).get("broadcaster_user_id", ""))
+            login = self._login_by_id.get(broadcaster_id, broadcaster_id)
+            sub_type = subscription.get("type", "")
+            logger.warning(f"Stream EventSub: {sub_type} for {login} revoked: {status}")
+            if sub_type == "stream.online":
+                self._set_covered(self._covered - {login})
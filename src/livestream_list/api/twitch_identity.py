@@ -0,0 +1,132 @@
+"""Shared Twitch identity lookups for code running on its own event loop.
+
+Chat workers and dialogs run short-lived loops on their own threads, and
+each used to build a TwitchApiClient (or a raw session against Helix
+/users) per lookup, throwing away its connections and token validation
+every time. The shared resolver keeps one client per account on the HTTP
+pool's loop (the app's service loop), with sessions on the pool's
+connector; callers on any loop await its results, and every lookup goes
+through the persistent TwitchUserStore like the refresh loop's do:
+
+    users = await get_identity_resolver().get_users_by_login(["name"], access_token=token)
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from ..core.settings import TwitchSettings
+from .http_pool import SharedHttpPool, get_http_pool
+from .twitch import TwitchApiClient
+from .twitch_users import TwitchUser
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TwitchIdentityResolver:
+    """Resolves Twitch users on a shared client from any thread or loop.
+
+    The pool's loop is started on the first lookup if it is not running.
+    """
+
+    def __init__(self, pool: SharedHttpPool | None = None) -> None:
+        self._pool = pool or get_http_pool()
+        # (client id, has token) -> the account's client (pool loop only)
+        self._clients: dict[tuple[str, bool], TwitchApiClient] = {}
+
+    async def get_users_by_login(
+        self, logins: Sequence[str], *, access_token: str = "", client_id: str = ""
+    ) -> dict[str, TwitchUser]:
+        """Resolve logins to users (see TwitchApiClient.get_users_by_login())."""
+        return await self._run(
+            lambda client: client.get_users_by_login(logins), access_token, client_id
+        )
+
+    async def get_users_by_id(
+        self, user_ids: Sequence[str], *, access_token: str = "", client_id: str = ""
+    ) -> dict[str, TwitchUser]:
+        """Resolve user ids to users (see TwitchApiClient.get_users_by_id())."""
+        return await self._run(
+            lambda client: client.get_users_by_id(user_ids), access_token, client_id
+        )
+
+    async def get_authenticated_user(
+        self, access_token: str, client_id: str = ""
+    ) -> TwitchUser | None:
+        """Return the user an access token belongs to.
+
+        The token validation is cached by the shared client, so repeated
+        calls only hit the network about once an hour.
+
+        Returns:
+            The user, or None if the token is missing or invalid.
+        """
+        if not access_token:
+            return None
+        return await self._run(
+            lambda client: client.get_authenticated_user(), access_token, client_id
+        )
+
+    async def _run(
+        self,
+        call: Callable[[TwitchApiClient], Awaitable[T]],
+        access_token: str,
+        client_id: str,
+    ) -> T:
+        """Run call with the account's client on the pool loop."""
+
+        async def on_loop() -> T:
+            return await call(await self._client_for(access_token, client_id))
+
+        loop = self._pool.loop
+        if asyncio.get_running_loop() is loop.loop:
+            return await on_loop()
+        loop.start()
+        return await asyncio.wrap_future(loop.submit(on_loop()))
+
+    async def _client_for(self, access_token: str, client_id: str) -> TwitchApiClient:
+        """The shared client for an account (call on the pool loop).
+
+        A client whose token has been replaced (refreshed, or another
+        login) is closed and a new one takes its place.
+        """
+        key = (client_id, bool(access_token))
+        client = self._clients.get(key)
+        if client is not None and client.settings.access_token == access_token:
+            return client
+        old = client
+        client = TwitchApiClient(TwitchSettings(client_id=client_id, access_token=access_token))
+        client.share_connector(self._pool.connector)
+        self._clients[key] = client
+        if old is not None:
+            await old.close()
+        return client
+
+    async def close(self) -> None:
+        """Close the clients (call on the pool loop, before closing the pool)."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.close()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Run close() on the pool loop from another thread and wait for it."""
+        loop = self._pool.loop
+        if not loop.is_running:
+            self._clients.clear()
+            return
+        try:
+            loop.submit(self.close()).result(timeout)
+        except Exception as e:
+            logger.warning(f"Twitch identity resolver shutdown error: {e}")
+
+
+_resolver = TwitchIdentityResolver()
+
+
+def get_identity_resolver() -> TwitchIdentityResolver:
+    """Return the process-wide identity resolver."""
+    return _resolver
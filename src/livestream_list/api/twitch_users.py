@@ -0,0 +1,169 @@
+"""Persistent cache of Twitch user identities.
+
+Maps logins and user ids to a user's id, login, display name and avatar URL.
+One SQLite database is shared by every thread (the refresh loop, chat
+workers, dialogs), so a user resolved once is reused across chats and
+launches and only looked up again once its record is older than USER_TTL.
+
+Lookups go through TwitchApiClient.get_users_by_login() and
+get_users_by_id(), which consult this store first.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..core.settings import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Records older than this are revalidated on the next lookup. A user's id
+# never changes; login, display name and avatar occasionally do.
+USER_TTL = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    login TEXT NOT NULL,
+    display_name TEXT NOT NULL,
+    profile_image_url TEXT NOT NULL,
+    verified_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_login ON users (login);
+"""
+
+
+@dataclass
+class TwitchUser:
+    """A Twitch user's identity as of verified_at (Unix time)."""
+
+    id: str
+    login: str
+    display_name: str = ""
+    profile_image_url: str = ""
+    verified_at: float = 0.0
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the record is recent enough to use without revalidating."""
+        if now is None:
+            now = time.time()
+        return now - self.verified_at < USER_TTL
+
+
+class TwitchUserStore:
+    """SQLite-backed identity cache with an in-memory index.
+
+    The whole table is read on first use; afterwards lookups never touch
+    the disk. Thread-safe.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._by_id: dict[str, TwitchUser] = {}
+        self._by_login: dict[str, TwitchUser] = {}
+
+    @property
+    def path(self) -> Path:
+        """Database file path."""
+        if self._path is None:
+            self._path = get_data_dir() / "twitch_users.db"
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and load the index on first use (call with _lock held)."""
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        rows = conn.execute(
+            "SELECT id, login, display_name, profile_image_url, verified_at "
+            "FROM users ORDER BY verified_at"
+        ).fetchall()
+        for row in rows:
+            # Ordered by age, so a login reused after a rename maps to the newest owner
+            self._index(TwitchUser(*row))
+        self._conn = conn
+        return conn
+
+    def _index(self, user: TwitchUser) -> None:
+        old = self._by_id.get(user.id)
+        if old is not None and self._by_login.get(old.login) is old:
+            del self._by_login[old.login]
+        self._by_id[user.id] = user
+        self._by_login[user.login] = user
+
+    def get_by_logins(self, logins: Iterable[str]) -> dict[str, TwitchUser]:
+        """Return cached users (fresh or not) keyed by lowercased login."""
+        with self._lock:
+            self._connect()
+            found = {login.lower(): self._by_login.get(login.lower()) for login in logins}
+        return {login: user for login, user in found.items() if user is not None}
+
+    def get_by_ids(self, ids: Iterable[str]) -> dict[str, TwitchUser]:
+        """Return cached users (fresh or not) keyed by user id."""
+        with self._lock:
+            self._connect()
+            found = {uid: self._by_id.get(uid) for uid in ids}
+        return {uid: user for uid, user in found.items() if user is not None}
+
+    def put(self, users: Iterable[TwitchUser]) -> None:
+        """Insert or update users.
+
+        Logins are stored lowercased. A record without an avatar URL keeps
+        the one already stored for that id.
+        """
+        records = []
+        with self._lock:
+            conn = self._connect()
+            for user in users:
+                user.login = user.login.lower()
+                if not user.profile_image_url:
+                    old = self._by_id.get(user.id)
+                    if old is not None:
+                        user.profile_image_url = old.profile_image_url
+                self._index(user)
+                records.append(
+                    (
+                        user.id,
+                        user.login,
+                        user.display_name,
+                        user.profile_image_url,
+                        user.verified_at,
+                    )
+                )
+            if not records:
+                return
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO users "
+                    "(id, login, display_name, profile_image_url, verified_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    records,
+                )
+
+    def close(self) -> None:
+        """Close the database (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._by_id.clear()
+            self._by_login.clear()
+
+
+_store = TwitchUserStore()
+
+
+def get_user_store() -> TwitchUserStore:
+    """Return the process-wide identity cache."""
+    return _store
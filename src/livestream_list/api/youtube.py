@@ -1,6 +1,7 @@
 """YouTube client using HTML scraping for stream detection (yt-dlp fallback)."""
 
 import asyncio
+import codecs
 import hashlib
 import json
 import logging
@@ -8,7 +9,8 @@ import re
 import shutil
 import subprocess
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Collection
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any
 
@@ -17,15 +19,172 @@ import aiohttp
 from ..core.models import Channel, Livestream, StreamPlatform
 from ..core.platform import SUBPROCESS_NO_WINDOW
 from ..core.settings import YouTubeSettings
-from .base import BaseApiClient, safe_json
+from .base import BaseApiClient
+from .concurrency import AdaptiveConcurrencyLimiter
+from .http_pool import get_http_pool
+from .ytdlp_pool import YtDlpPool, YtDlpPoolUnavailableError, options_from_args
 
 logger = logging.getLogger(__name__)
 
-# Regex patterns to extract YouTube page data
-# ytInitialPlayerResponse contains videoDetails with isLive status
-PLAYER_RESPONSE_RE = re.compile(r"var ytInitialPlayerResponse\s*=\s*(\{.+?\});", re.DOTALL)
-# ytInitialData contains page structure (used as fallback)
-INITIAL_DATA_RE = re.compile(r"var ytInitialData\s*=\s*({.+?});</script>", re.DOTALL)
+# Start of the page data objects: ytInitialPlayerResponse contains
+# videoDetails with isLive status, ytInitialData the page structure
+PAGE_DATA_RE = re.compile(r"var (ytInitialPlayerResponse|ytInitialData)\s*=\s*(?=\{)")
+# Literal prefix of PAGE_DATA_RE, located with str.find() before matching
+_PAGE_DATA_PREFIX = "var ytInitial"
+# Longest text a PAGE_DATA_RE match can span, kept between chunks
+_PAGE_DATA_OVERLAP = 64
+# Plain-text markers of a live stream, for pages whose JSON can't be parsed
+_LIVE_INDICATORS = (
+    "hqdefault_live.jpg",
+    '"isLiveBroadcast" content="True"',
+    '"isLiveBroadcast":true',
+)
+# Bytes read from the response per chunk
+PAGE_CHUNK_SIZE = 64 * 1024
+# Persistent yt-dlp worker processes (matches the yt-dlp pass concurrency)
+YTDLP_WORKERS = 4
+# How long yt-dlp metadata for a live video is reused before the second pass
+# runs again (the category can change mid-broadcast; start time never does)
+YTDLP_DETAILS_TTL = 30 * 60.0
+
+_json_decoder = json.JSONDecoder()
+
+
+def _with_ytdlp_details(scraped: Livestream, details: Livestream) -> Livestream:
+    """Merge a yt-dlp second pass into a scraped live stream.
+
+    Fields only yt-dlp provides come from details, whether the pass just ran
+    or is reused from the cache. The scrape's title and viewers are current
+    on every refresh and win; yt-dlp's fill in when the scrape had none.
+    """
+    return replace(
+        scraped,
+        title=scraped.title or details.title,
+        viewers=scraped.viewers or details.viewers,
+        video_id=scraped.video_id or details.video_id,
+        start_time=details.start_time,
+        game=details.game,
+        language=details.language,
+        thumbnail_url=details.thumbnail_url or scraped.thumbnail_url,
+    )
+
+
+class PageDataScanner:
+    """Extracts ytInitialPlayerResponse/ytInitialData from a page fed in chunks.
+
+    Only the text that may still be needed is buffered: everything before
+    the first data object is dropped as it is scanned, and the object itself
+    is decoded with a single JSONDecoder.raw_decode() call once the
+    closing </script> has arrived (YouTube escapes "<" inside the JSON, so
+    the first </script> ends the object).
+
+    By default the scan is done as soon as either object decodes: a /live
+    page with a player response never needs ytInitialData. Callers that need
+    specific objects pass them as ``wanted``; the scan then runs until all of
+    them have decoded (objects not wanted are skipped undecoded), whatever
+    order the page serves them in.
+
+    Usage:
+        scanner = PageDataScanner(wanted={"ytInitialData"})
+        for chunk in chunks:
+            if scanner.feed(chunk):
+                break  # Stop downloading
+        scanner.close()
+        scanner.player_response, scanner.initial_data, scanner.live_indicator
+    """
+
+    def __init__(self, wanted: Collection[str] | None = None) -> None:
+        self.player_response: dict[str, Any] | None = None
+        self.initial_data: dict[str, Any] | None = None
+        # Plain-text live markers seen in the scanned text
+        self.live_indicator = False
+        self.done = False
+        # Objects still needed; None finishes on the first decoded object
+        self._wanted: set[str] | None = set(wanted) if wanted is not None else None
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        # Name of the object starting at _buffer[0], if any
+        self._pending: str | None = None
+        # Where to resume looking for </script> in _buffer
+        self._end_search = 0
+        self._tail = ""
+
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk of the page.
+
+        Returns:
+            True once the wanted objects have been decoded and the rest of
+            the page is not needed.
+        """
+        if not self.done:
+            self._scan(self._utf8.decode(chunk))
+        return self.done
+
+    def close(self) -> None:
+        """Finish the scan at the end of the page."""
+        if self.done:
+            return
+        self._scan(self._utf8.decode(b"", final=True))
+        if self._pending is not None:
+            # No </script> after the object; try what we have
+            self._decode_pending(len(self._buffer))
+        self.done = True
+
+    def _scan(self, text: str) -> None:
+        if not self.live_indicator:
+            window = self._tail + text
+            self.live_indicator = any(marker in window for marker in _LIVE_INDICATORS)
+            self._tail = window[-_PAGE_DATA_OVERLAP:]
+        self._buffer += text
+
+        while not self.done:
+            if self._pending is None:
+                match = self._find_object_start()
+                if match is None:
+                    self._buffer = self._buffer[-_PAGE_DATA_OVERLAP:]
+                    return
+                self._pending = match.group(1)
+                self._buffer = self._buffer[match.end() :]
+                self._end_search = 0
+            end = self._buffer.find("</script>", self._end_search)
+            if end == -1:
+                self._end_search = max(0, len(self._buffer) - len("</script>"))
+                return
+            self._decode_pending(end)
+
+    def _find_object_start(self) -> re.Match[str] | None:
+        pos = self._buffer.find(_PAGE_DATA_PREFIX)
+        while pos != -1:
+            match = PAGE_DATA_RE.match(self._buffer, pos)
+            if match is not None:
+                return match
+            pos = self._buffer.find(_PAGE_DATA_PREFIX, pos + 1)
+        return None
+
+    def _decode_pending(self, end: int) -> None:
+        """Decode the pending object at the start of _buffer; skip to end on failure."""
+        name, self._pending = self._pending, None
+        if self._wanted is not None and name not in self._wanted:
+            self._buffer = self._buffer[end:]
+            return
+        try:
+            # Parses from the start of the buffer and stops at the object's end
+            data, _ = _json_decoder.raw_decode(self._buffer)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Failed to parse {name}: {e}")
+            data = None
+        self._buffer = self._buffer[end:]
+        if not isinstance(data, dict):
+            return
+        if name == "ytInitialPlayerResponse":
+            self.player_response = data
+        else:
+            self.initial_data = data
+        if self._wanted is not None:
+            self._wanted.discard(name)
+            self.done = not self._wanted
+        else:
+            self.done = True
 
 
 class YouTubeApiClient(BaseApiClient):
@@ -52,9 +211,16 @@ class YouTubeApiClient(BaseApiClient):
     def __init__(self, settings: YouTubeSettings, concurrency: int = 10) -> None:
         super().__init__()
         self.settings = settings
-        self.concurrency = concurrency
+        # Channel pages fetched at once; starts at the configured concurrency
+        self._limiter = AdaptiveConcurrencyLimiter("YouTube", initial=concurrency)
         self._ytdlp_path: str | None = None
         self._check_ytdlp()
+        # Warm yt-dlp workers; None runs one yt-dlp process per lookup instead
+        self._ytdlp_pool: YtDlpPool | None = (
+            YtDlpPool(size=YTDLP_WORKERS) if self._ytdlp_path and YtDlpPool.supported() else None
+        )
+        # Second-pass results by video_id: (monotonic fetch time, yt-dlp result)
+        self._ytdlp_details: dict[str, tuple[float, Livestream]] = {}
 
     def _check_ytdlp(self) -> None:
         """Check if yt-dlp is available."""
@@ -76,6 +242,18 @@ class YouTubeApiClient(BaseApiClient):
     def name(self) -> str:
         return "YouTube"
 
+    def _trace_configs(self) -> list[aiohttp.TraceConfig]:
+        return [self._limiter.trace_config()]
+
+    def get_metrics(self) -> dict[str, Any]:
+        return self._limiter.metrics()
+
+    def get_persistent_state(self) -> dict[str, Any] | None:
+        return {"concurrency": self._limiter.to_dict()}
+
+    def restore_persistent_state(self, state: dict[str, Any]) -> None:
+        self._limiter.load_dict(state.get("concurrency") or {})
+
     async def is_authorized(self) -> bool:
         """Check if yt-dlp is available."""
         return self._ytdlp_path is not None
@@ -126,10 +304,31 @@ class YouTubeApiClient(BaseApiClient):
     async def _run_ytdlp_async(
         self, url: str, extra_args: list[str] | None = None
     ) -> dict[str, Any] | None:
-        """Run yt-dlp asynchronously."""
+        """Run yt-dlp asynchronously.
+
+        Uses the worker pool when possible, otherwise a yt-dlp process in a
+        thread.
+        """
+        if self._ytdlp_path and self._ytdlp_pool is not None:
+            options = options_from_args(extra_args)
+            if options is not None:
+                try:
+                    return await self._ytdlp_pool.extract(url, options)
+                except YtDlpPoolUnavailableError as e:
+                    logger.debug(f"yt-dlp pool unavailable, running yt-dlp directly: {e}")
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self._run_ytdlp, url, extra_args)
 
+    async def close(self) -> None:
+        """Stop the yt-dlp workers and close the HTTP session."""
+        if self._ytdlp_pool is not None:
+            pool, self._ytdlp_pool = self._ytdlp_pool, YtDlpPool(size=YTDLP_WORKERS)
+            try:
+                await pool.close()
+            except RuntimeError as e:
+                logger.debug(f"yt-dlp pool attached to different loop, skipping close: {e}")
+        await super().close()
+
     # -------------------------------------------------------------------------
     # HTML Scraping Methods (Primary - fast and lightweight)
     # -------------------------------------------------------------------------
@@ -143,86 +342,39 @@ class YouTubeApiClient(BaseApiClient):
         else:
             return f"https://www.youtube.com/@{channel_id}/live"
 
-    async def _fetch_live_page(self, channel_id: str) -> str | None:
-        """Fetch the channel's /live page HTML."""
-        url = self._build_channel_live_url(channel_id)
+    async def _scan_page(
+        self, url: str, wanted: Collection[str] | None = None
+    ) -> PageDataScanner | None:
+        """Stream a YouTube page through a PageDataScanner.
+
+        The download stops as soon as the scanner has what it needs.
+
+        Args:
+            url: Page to fetch.
+            wanted: Page data objects the caller needs (see PageDataScanner).
+
+        Returns:
+            The finished scanner, or None if the page could not be fetched.
+        """
         try:
             timeout = aiohttp.ClientTimeout(total=15)
             async with self.session.get(url, headers=self.SCRAPE_HEADERS, timeout=timeout) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-                else:
-                    logger.debug(f"YouTube /live page returned {resp.status} for {channel_id}")
+                if resp.status != 200:
+                    logger.debug(f"YouTube page {url} returned {resp.status}")
+                    return None
+                scanner = PageDataScanner(wanted)
+                async for chunk in resp.content.iter_chunked(PAGE_CHUNK_SIZE):
+                    if scanner.feed(chunk):
+                        # Leaving the block early closes the connection
+                        break
         except asyncio.TimeoutError:
-            logger.debug(f"Timeout fetching YouTube /live page for {channel_id}")
-        except aiohttp.ClientError as e:
-            logger.debug(f"Error fetching YouTube /live page for {channel_id}: {e}")
-        return None
-
-    def _parse_player_response(self, html: str) -> dict[str, Any] | None:
-        """Extract ytInitialPlayerResponse JSON from page HTML.
-
-        This contains videoDetails with isLive status.
-        """
-        # Find the start of ytInitialPlayerResponse
-        marker = "var ytInitialPlayerResponse = "
-        start_idx = html.find(marker)
-        if start_idx == -1:
+            logger.debug(f"Timeout fetching YouTube page {url}")
             return None
-
-        start_idx += len(marker)
-
-        # Find the matching closing brace by counting braces
-        brace_count = 0
-        in_string = False
-        escape_next = False
-        end_idx = start_idx
-
-        for i, char in enumerate(html[start_idx:], start_idx):
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == "\\":
-                escape_next = True
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if in_string:
-                continue
-
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    end_idx = i + 1
-                    break
-
-        if brace_count != 0:
-            return None
-
-        try:
-            json_str = html[start_idx:end_idx]
-            result: dict[str, Any] = json.loads(json_str)
-            return result
-        except json.JSONDecodeError as e:
-            logger.debug(f"Failed to parse ytInitialPlayerResponse: {e}")
+        except aiohttp.ClientError as e:
+            logger.debug(f"Error fetching YouTube page {url}: {e}")
             return None
-
-    def _parse_initial_data(self, html: str) -> dict[str, Any] | None:
-        """Extract ytInitialData JSON from page HTML (fallback)."""
-        match = INITIAL_DATA_RE.search(html)
-        if match:
-            try:
-                data: dict[str, Any] = json.loads(match.group(1))
-                return data
-            except json.JSONDecodeError:
-                pass
-        return None
+        scanner.close()
+        return scanner
 
     def _extract_livestream_from_data(
         self, data: dict[str, Any], channel: Channel
@@ -292,21 +444,6 @@ class YouTubeApiClient(BaseApiClient):
             # Note: game/category not directly available in videoDetails
         )
 
-    def _check_live_indicators(self, html: str) -> bool:
-        """Quick check for live stream indicators in HTML.
-
-        This is a fast fallback when JSON parsing fails.
-        """
-        # Check for live thumbnail indicator
-        if "hqdefault_live.jpg" in html:
-            return True
-        # Check for schema.org live broadcast marker
-        if '"isLiveBroadcast" content="True"' in html:
-            return True
-        if '"isLiveBroadcast":true' in html.lower():
-            return True
-        return False
-
     @staticmethod
     def _is_portrait_stream(data: dict[str, Any]) -> bool:
         """Check if a player response contains a portrait (vertical) video stream.
@@ -331,16 +468,8 @@ class YouTubeApiClient(BaseApiClient):
         else:
             url = f"https://www.youtube.com/@{channel_id}/streams"
 
-        try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            async with self.session.get(url, headers=self.SCRAPE_HEADERS, timeout=timeout) as resp:
-                if resp.status != 200:
-                    return []
-                html = await resp.text()
-        except (asyncio.TimeoutError, aiohttp.ClientError):
-            return []
-
-        data = self._parse_initial_data(html)
+        scan = await self._scan_page(url, wanted={"ytInitialData"})
+        data = scan.initial_data if scan else None
         if not data:
             return []
 
@@ -372,16 +501,10 @@ class YouTubeApiClient(BaseApiClient):
 
     async def _fetch_video_player_response(self, video_id: str) -> dict[str, Any] | None:
         """Fetch ytInitialPlayerResponse for a specific video."""
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            async with self.session.get(url, headers=self.SCRAPE_HEADERS, timeout=timeout) as resp:
-                if resp.status != 200:
-                    return None
-                html = await resp.text()
-        except (asyncio.TimeoutError, aiohttp.ClientError):
-            return None
-        return self._parse_player_response(html)
+        scan = await self._scan_page(
+            f"https://www.youtube.com/watch?v={video_id}", wanted={"ytInitialPlayerResponse"}
+        )
+        return scan.player_response if scan else None
 
     async def _get_livestream_scrape(self, channel: Channel) -> Livestream | None:
         """Get livestream status using HTML scraping.
@@ -391,12 +514,12 @@ class YouTubeApiClient(BaseApiClient):
         landscape stream, the landscape stream is preferred.
         """
         try:
-            html = await self._fetch_live_page(channel.channel_id)
-            if not html:
+            scan = await self._scan_page(self._build_channel_live_url(channel.channel_id))
+            if not scan:
                 return None
 
             # Try ytInitialPlayerResponse first (contains videoDetails with isLive)
-            data = self._parse_player_response(html)
+            data = scan.player_response
             if data:
                 result = self._extract_livestream_from_data(data, channel)
                 if result and result.live and self._is_portrait_stream(data):
@@ -407,13 +530,13 @@ class YouTubeApiClient(BaseApiClient):
                 return result
 
             # Fallback to ytInitialData
-            data = self._parse_initial_data(html)
+            data = scan.initial_data
             if data:
                 return self._extract_livestream_from_data(data, channel)
 
             # Last resort: check for live indicators in HTML
             # This gives us live/not-live but no metadata
-            if self._check_live_indicators(html):
+            if scan.live_indicator:
                 logger.debug(f"Detected live via HTML indicators for {channel.display_name}")
                 return Livestream(
                     channel=channel,
@@ -732,10 +855,8 @@ class YouTubeApiClient(BaseApiClient):
         if not channels:
             return []
 
-        semaphore = asyncio.Semaphore(self.concurrency)
-
         async def fetch_with_semaphore(channel: Channel) -> list[Livestream]:
-            async with semaphore:
+            async with self._limiter:
                 try:
                     return await self._get_all_concurrent_streams(channel)
                 except Exception as e:
@@ -755,14 +876,26 @@ class YouTubeApiClient(BaseApiClient):
             live_indices = [i for i, ls in enumerate(final_results) if ls.live]
             if live_indices:
                 logger.debug(f"Fetching full metadata for {len(live_indices)} live YT streams")
-                ytdlp_semaphore = asyncio.Semaphore(4)
+                ytdlp_semaphore = asyncio.Semaphore(YTDLP_WORKERS)
+                now = time.monotonic()
+                self._ytdlp_details = {
+                    vid: entry
+                    for vid, entry in self._ytdlp_details.items()
+                    if now - entry[0] < YTDLP_DETAILS_TTL
+                }
 
                 async def fetch_ytdlp(idx: int) -> tuple[int, Livestream]:
+                    ls = final_results[idx]
+                    cached = self._ytdlp_details.get(ls.video_id) if ls.video_id else None
+                    if cached is not None:
+                        # Same broadcast as a recent pass: reuse its details
+                        return (idx, _with_ytdlp_details(ls, cached[1]))
                     async with ytdlp_semaphore:
-                        ls = final_results[idx]
                         full_ls = await self._get_livestream_ytdlp(ls.channel, video_id=ls.video_id)
                         if full_ls.live and full_ls.start_time:
-                            return (idx, full_ls)
+                            if ls.video_id:
+                                self._ytdlp_details[ls.video_id] = (time.monotonic(), full_ls)
+                            return (idx, _with_ytdlp_details(ls, full_ls))
                         return (idx, ls)
 
                 ytdlp_tasks = [fetch_ytdlp(idx) for idx in live_indices]
@@ -846,45 +979,46 @@ class YouTubeApiClient(BaseApiClient):
         channels: list[Channel] = []
         url = "https://www.youtube.com/youtubei/v1/browse"
 
-        async with aiohttp.ClientSession() as session:
-            while True:
-                async with session.post(url, json=innertube_body, headers=headers) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        raise ValueError(f"YouTube API returned {resp.status}: {text[:200]}")
-                    raw_data = await safe_json(resp)
-                    if raw_data is None or not isinstance(raw_data, dict):
-                        raise ValueError("YouTube API returned invalid JSON")
-                    data: dict[str, Any] = raw_data
-
-                # Check if authentication succeeded
-                if not channels:  # Only check on first page
-                    if not self._is_logged_in(data):
-                        raise ValueError(
-                            "YouTube cookies expired or invalid. "
-                            "Please re-import cookies from your browser."
-                        )
+        while True:
+            resp = await get_http_pool().post(url, json=innertube_body, headers=headers)
+            if resp.status != 200:
+                raise ValueError(f"YouTube API returned {resp.status}: {resp.text()[:200]}")
+            try:
+                raw_data = resp.json()
+            except ValueError:
+                raw_data = None
+            if raw_data is None or not isinstance(raw_data, dict):
+                raise ValueError("YouTube API returned invalid JSON")
+            data: dict[str, Any] = raw_data
+
+            # Check if authentication succeeded
+            if not channels:  # Only check on first page
+                if not self._is_logged_in(data):
+                    raise ValueError(
+                        "YouTube cookies expired or invalid. "
+                        "Please re-import cookies from your browser."
+                    )
 
-                # Parse channels from response
-                new_channels = self._parse_subscriptions_response(data)
-                channels.extend(new_channels)
-
-                # Check for continuation
-                continuation = self._get_continuation_token(data)
-                if not continuation:
-                    break
-
-                # Set up continuation request
-                innertube_body = {
-                    "context": {
-                        "client": {
-                            "clientName": "WEB",
-                            "clientVersion": "2.20250120.01.00",
-                            "hl": "en",
-                        }
-                    },
-                    "continuation": continuation,
-                }
+            # Parse channels from response
+            new_channels = self._parse_subscriptions_response(data)
+            channels.extend(new_channels)
+
+            # Check for continuation
+            continuation = self._get_continuation_token(data)
+            if not continuation:
+                break
+
+            # Set up continuation request
+            innertube_body = {
+                "context": {
+                    "client": {
+                        "clientName": "WEB",
+                        "clientVersion": "2.20250120.01.00",
+                        "hl": "en",
+                    }
+                },
+                "continuation": continuation,
+            }
 
         logger.info(f"Found {len(channels)} YouTube subscriptions")
         return channels
@@ -0,0 +1,235 @@
+"""Pool of long-lived yt-dlp worker processes for metadata lookups.
+
+Running the yt-dlp executable per lookup pays interpreter start-up, imports
+and extractor initialization every time. The pool keeps a few worker
+processes (ytdlp_worker.py) with yt_dlp loaded and sends them jobs over
+their stdin/stdout pipes instead. A worker that times out or dies is killed
+and replaced on its next job, and workers are recycled after
+MAX_JOBS_PER_WORKER jobs to bound memory growth.
+
+The pool needs the yt_dlp package importable by the running interpreter;
+frozen builds and installs that only have the yt-dlp executable keep using
+one subprocess per lookup (see YtDlpPool.supported()).
+"""
+
+import asyncio
+import importlib.util
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from ..core import json_codec
+from ..core.platform import SUBPROCESS_NO_WINDOW
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("ytdlp_worker.py")
+
+# Jobs a worker runs before it is replaced
+MAX_JOBS_PER_WORKER = 500
+# Largest reply line accepted from a worker (full video info can be large)
+MAX_REPLY_BYTES = 32 * 1024 * 1024
+
+
+class YtDlpPoolUnavailableError(RuntimeError):
+    """The pool can't run jobs here; use the yt-dlp executable instead."""
+
+
+def options_from_args(args: list[str] | None) -> dict[str, Any] | None:
+    """Translate the yt-dlp command-line flags the YouTube client uses into YoutubeDL options.
+
+    Returns:
+        The options, or None if some flag is not supported by the pool.
+    """
+    options: dict[str, Any] = {}
+    remaining = list(args or [])
+    while remaining:
+        flag = remaining.pop(0)
+        if flag == "--flat-playlist":
+            options["extract_flat"] = "in_playlist"
+        elif flag == "--playlist-items" and remaining:
+            options["playlist_items"] = remaining.pop(0)
+        else:
+            return None
+    return options
+
+
+class _Worker:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.jobs = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    def kill(self) -> None:
+        if self.alive:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class YtDlpPool:
+    """Runs yt-dlp metadata lookups on a fixed number of warm worker processes.
+
+    Bound to the event loop of its first job; calls from another loop raise
+    YtDlpPoolUnavailableError.
+
+    Usage:
+        pool = YtDlpPool(size=4)
+        data = await pool.extract(url, {"playlist_items": "1"})
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        job_timeout: float = 30.0,
+        command: list[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            size: Number of worker processes (and concurrent jobs).
+            job_timeout: Seconds before a job's worker is killed.
+            command: Worker command line (defaults to this interpreter
+                running ytdlp_worker.py).
+        """
+        self.size = size
+        self.job_timeout = job_timeout
+        self.command = command or [sys.executable, str(WORKER_SCRIPT)]
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Worker slots; None means not spawned yet (or replaced after a failure)
+        self._idle: asyncio.Queue[_Worker | None] | None = None
+        self._workers: set[_Worker] = set()
+        self._closed = False
+
+    @staticmethod
+    def supported() -> bool:
+        """Whether worker processes can import yt_dlp with this interpreter."""
+        if getattr(sys, "frozen", False):
+            return False
+        return importlib.util.find_spec("yt_dlp") is not None
+
+    async def extract(self, url: str, options: dict[str, Any]) -> dict[str, Any] | None:
+        """Run one metadata lookup.
+
+        Args:
+            url: Video, channel or playlist URL.
+            options: Extra YoutubeDL options (see options_from_args()).
+
+        Returns:
+            The first result as yt-dlp --dump-json would print it, or None if
+            there is none or the lookup failed or timed out.
+
+        Raises:
+            YtDlpPoolUnavailableError: If the pool is closed, bound to another
+                event loop, or can't start workers.
+        """
+        idle = self._idle_queue()
+        worker = await idle.get()
+        reply = None
+        try:
+            if worker is None or not worker.alive or worker.jobs >= MAX_JOBS_PER_WORKER:
+                if worker is not None:
+                    self._retire(worker)
+                worker = None
+                worker = await self._spawn()
+            worker.jobs += 1
+            reply = await self._request(worker, url, options)
+        finally:
+            # A worker whose job did not complete (failure, timeout or
+            # cancellation) may still send a reply later, so it is replaced
+            if reply is None and worker is not None:
+                self._retire(worker)
+                worker = None
+            idle.put_nowait(worker)
+        if reply is None:
+            return None
+
+        if "error" in reply:
+            logger.warning(f"yt-dlp worker error for {url}: {reply['error']}")
+            return None
+        data: dict[str, Any] | None = reply.get("data")
+        return data
+
+    def _idle_queue(self) -> asyncio.Queue[_Worker | None]:
+        if self._closed:
+            raise YtDlpPoolUnavailableError("pool is closed")
+        loop = asyncio.get_running_loop()
+        if self._idle is None:
+            self._loop = loop
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(None)
+        elif loop is not self._loop:
+            raise YtDlpPoolUnavailableError("pool belongs to another event loop")
+        return self._idle
+
+    async def _spawn(self) -> _Worker:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                limit=MAX_REPLY_BYTES,
+                **SUBPROCESS_NO_WINDOW,
+            )
+        except OSError as e:
+            raise YtDlpPoolUnavailableError(f"cannot start yt-dlp worker: {e}") from e
+        worker = _Worker(process)
+        self._workers.add(worker)
+        logger.debug(f"Started yt-dlp worker pid={process.pid}")
+        return worker
+
+    async def _request(
+        self, worker: _Worker, url: str, options: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Send one job and read its reply; None if the worker failed."""
+        process = worker.process
+        assert process.stdin is not None and process.stdout is not None
+        line = json.dumps({"url": url, "options": options}) + "\n"
+        try:
+            process.stdin.write(line.encode())
+            await process.stdin.drain()
+            raw = await asyncio.wait_for(process.stdout.readline(), timeout=self.job_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"yt-dlp worker timed out for {url}")
+            return None
+        except (ConnectionError, ValueError) as e:
+            # Broken pipe, or a reply longer than MAX_REPLY_BYTES
+            logger.warning(f"yt-dlp worker failed for {url}: {e}")
+            return None
+        if not raw:
+            logger.warning(f"yt-dlp worker exited during job for {url}")
+            return None
+        try:
+            reply: dict[str, Any] = json_codec.loads(raw)
+        except json_codec.JSONDecodeError as e:
+            logger.warning(f"Invalid reply from yt-dlp worker for {url}: {e}")
+            return None
+        return reply
+
+    def _retire(self, worker: _Worker) -> None:
+        """Kill a worker; asyncio's child watcher reaps it."""
+        self._workers.discard(worker)
+        worker.kill()
+
+    async def close(self) -> None:
+        """Stop all workers. Jobs still running get None."""
+        self._closed = True
+        workers, self._workers = list(self._workers), set()
+        for worker in workers:
+            if worker.process.stdin is not None:
+                worker.process.stdin.close()
+        for worker in workers:
+            try:
+                await asyncio.wait_for(worker.process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                worker.kill()
+                await worker.process.wait()
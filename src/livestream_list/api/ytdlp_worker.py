@@ -0,0 +1,71 @@
+"""yt-dlp metadata worker process (run by YtDlpPool, not imported by the app).
+
+Keeps yt_dlp imported and one YoutubeDL instance per option set warm, and
+answers metadata requests read from stdin, one JSON object per line:
+
+    request: {"url": "...", "options": {...extra YoutubeDL options}}
+    reply:   {"data": {...} | null} or {"error": "..."}
+
+The reply data matches the first object `yt-dlp --dump-json` would print.
+Runs as a plain script so it does not depend on the app package being
+importable in the child.
+"""
+
+import json
+import os
+import sys
+from typing import Any
+
+# Equivalent of: --dump-json --no-download --no-warnings --ignore-errors
+BASE_OPTIONS: dict[str, Any] = {
+    "quiet": True,
+    "no_warnings": True,
+    "ignoreerrors": True,
+    "skip_download": True,
+    "noprogress": True,
+    "socket_timeout": 15,
+}
+
+
+def _first_result(ydl: Any, info: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the first video of a playlist result, or the result itself."""
+    if info is None:
+        return None
+    if info.get("_type") in ("playlist", "multi_video"):
+        for entry in info.get("entries") or []:
+            if entry:
+                return _first_result(ydl, entry)
+        return None
+    result: dict[str, Any] = ydl.sanitize_info(info)
+    return result
+
+
+def main() -> int:
+    # Replies go to the real stdout; anything yt-dlp prints ends up on stderr
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    sys.stdout = sys.stderr
+
+    import yt_dlp  # type: ignore[import-untyped]
+
+    instances: dict[str, Any] = {}
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            return 0
+        try:
+            request = json.loads(line)
+            options = request.get("options") or {}
+            key = json.dumps(options, sort_keys=True)
+            ydl = instances.get(key)
+            if ydl is None:
+                ydl = instances[key] = yt_dlp.YoutubeDL({**BASE_OPTIONS, **options})
+            info = ydl.extract_info(request["url"], download=False)
+            reply: dict[str, Any] = {"data": _first_result(ydl, info)}
+        except Exception as e:
+            reply = {"error": f"{type(e).__name__}: {e}"}
+        out.write(json.dumps(reply, default=str) + "\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,12 @@
 """Persistent JSONL/text chat log storage with disk rotation."""
 
-import json
 import logging
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ..core import json_codec
 from ..core.models import StreamPlatform
 from ..core.settings import ChatLoggingSettings, get_data_dir
 from .models import ChatMessage, ChatUser
@@ -155,7 +155,7 @@ class ChatLogWriter:
             with open(log_file, "a", encoding="utf-8") as f:
                 if self._settings.log_format == "jsonl":
                     for msg in buf:
-                        f.write(json.dumps(_msg_to_dict(msg), ensure_ascii=False) + "\n")
+                        f.write(json_codec.dumps(_msg_to_dict(msg)) + "\n")
                 else:
                     for msg in buf:
                         f.write(_msg_to_text(msg) + "\n")
@@ -241,9 +241,9 @@ class ChatLogWriter:
                     if not line:
                         continue
                     try:
-                        d = json.loads(line)
+                        d = json_codec.loads(line)
                         messages.append(_dict_to_msg(d))
-                    except (json.JSONDecodeError, KeyError):
+                    except (json_codec.JSONDecodeError, KeyError):
                         continue
             except Exception as e:
                 logger.warning(f"Failed to read log file {log_file}: {e}")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import random
 import string
@@ -14,6 +13,7 @@ from typing import Any
 import aiohttp
 from PySide6.QtCore import QObject
 
+from ...core import json_codec
 from ...core.models import StreamPlatform
 from ..models import ChatBadge, ChatMessage, ChatUser, ModerationEvent
 from .base import BaseChatConnection
@@ -81,7 +81,7 @@ class ChaturbateChatConnection(BaseChatConnection):
                 return
 
             # Authenticate
-            connect_msg = json.dumps(
+            connect_msg = json_codec.dumps(
                 {
                     "method": "connect",
                     "data": {
@@ -92,7 +92,7 @@ class ChaturbateChatConnection(BaseChatConnection):
                     },
                 }
             )
-            await self._ws.send_str(json.dumps([connect_msg]))
+            await self._ws.send_str(json_codec.dumps([connect_msg]))
 
             self._set_connected(channel_id)
             self._reset_backoff()
@@ -129,7 +129,7 @@ class ChaturbateChatConnection(BaseChatConnection):
             return False
 
         try:
-            send_msg = json.dumps(
+            send_msg = json_codec.dumps(
                 {
                     "method": "privmsg",
                     "data": {
@@ -139,7 +139,7 @@ class ChaturbateChatConnection(BaseChatConnection):
                     },
                 }
             )
-            await self._ws.send_str(json.dumps([send_msg]))
+            await self._ws.send_str(json_codec.dumps([send_msg]))
             return True
         except Exception as e:
             self._emit_error(f"Failed to send message: {e}")
@@ -204,11 +204,11 @@ class ChaturbateChatConnection(BaseChatConnection):
                 if data.startswith("a"):
                     # SockJS array frame — contains JSON-encoded message strings
                     try:
-                        payloads = json.loads(data[1:])
+                        payloads = json_codec.loads(data[1:])
                         for payload_str in payloads:
-                            payload = json.loads(payload_str)
+                            payload = json_codec.loads(payload_str)
                             self._handle_event(payload)
-                    except (json.JSONDecodeError, TypeError):
+                    except (json_codec.JSONDecodeError, TypeError):
                         pass
                 elif data == "h":
                     # SockJS heartbeat — no action needed
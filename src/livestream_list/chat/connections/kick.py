@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import time
@@ -14,6 +13,7 @@ from typing import Any
 import aiohttp
 from PySide6.QtCore import QObject
 
+from ...core import json_codec
 from ...core.models import StreamPlatform
 from ...core.settings import KickSettings
 from ..emotes.image import ImageSet, ImageSpec
@@ -96,7 +96,7 @@ class KickChatConnection(BaseChatConnection):
             # Wait for connection established
             msg = await self._ws.receive()
             if msg.type == aiohttp.WSMsgType.TEXT:
-                data = json.loads(msg.data)
+                data = json_codec.loads(msg.data)
                 if data.get("event") == "pusher:connection_established":
                     logger.debug(f"Kick Pusher connected for {channel_id}")
 
@@ -108,7 +108,7 @@ class KickChatConnection(BaseChatConnection):
                     "channel": f"chatrooms.{self._chatroom_id}.v2",
                 },
             }
-            await self._ws.send_str(json.dumps(subscribe_data))
+            await self._ws.send_str(json_codec.dumps(subscribe_data))
 
             self._set_connected(channel_id)
             self._reset_backoff()  # Reset backoff on successful connection
@@ -359,9 +359,9 @@ class KickChatConnection(BaseChatConnection):
 
             if msg.type == aiohttp.WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = json_codec.loads(msg.data)
                     await self._handle_pusher_event(data)
-                except json.JSONDecodeError:
+                except json_codec.JSONDecodeError:
                     pass
 
                 # Flush batched messages
@@ -381,8 +381,8 @@ class KickChatConnection(BaseChatConnection):
         # Parse event data (Pusher wraps JSON as string)
         if isinstance(event_data_str, str) and event_data_str:
             try:
-                event_data = json.loads(event_data_str)
-            except json.JSONDecodeError:
+                event_data = json_codec.loads(event_data_str)
+            except json_codec.JSONDecodeError:
                 event_data = {}
         else:
             event_data = event_data_str if isinstance(event_data_str, dict) else {}
@@ -396,7 +396,7 @@ class KickChatConnection(BaseChatConnection):
         elif event == "pusher:ping":
             # Respond to Pusher ping
             if self._ws and not self._ws.closed:
-                await self._ws.send_str(json.dumps({"event": "pusher:pong", "data": ""}))
+                await self._ws.send_str(json_codec.dumps({"event": "pusher:pong", "data": ""}))
 
     def _handle_chat_message(self, data: dict[str, Any]) -> None:
         """Handle a chat message event."""
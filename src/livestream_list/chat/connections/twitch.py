@@ -12,6 +12,7 @@ from typing import Any
 import aiohttp
 from PySide6.QtCore import QObject
 
+from ...api.http_pool import get_http_pool
 from ...core.models import StreamPlatform
 from ..emotes.image import ImageSet, ImageSpec
 from ..models import ChatBadge, ChatEmote, ChatMessage, ChatRoomState, ChatUser, ModerationEvent
@@ -302,11 +303,10 @@ class TwitchChatConnection(BaseChatConnection):
         """Fetch recent chat history from the recent-messages API."""
         url = f"https://recent-messages.robotty.de/api/v2/recent-messages/{channel}?limit=50&hideModeratedMessages=true"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status != 200:
-                        return
-                    data = await resp.json()
+            resp = await get_http_pool().get(url, timeout=5)
+            if resp.status != 200:
+                return
+            data = resp.json()
 
             raw_messages = data.get("messages", [])
             if not raw_messages:
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
 from typing import Any
 
 import aiohttp
 
+from ...api.http_pool import get_http_pool
+from ...core import json_codec
 from ..models import ChatEmote
 from .image import ImageSet, ImageSpec
 
@@ -16,17 +17,41 @@ logger = logging.getLogger(__name__)
 
 # Default Twitch client ID for unauthenticated requests
 _DEFAULT_TWITCH_CLIENT_ID = "kimne78kx3ncx6brgo4mv6wki5h1ko"
-_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
-
-
-@asynccontextmanager
-async def _optional_session(session: aiohttp.ClientSession | None = None, **kwargs: Any):  # type: ignore[no-untyped-def]
-    """Use an existing session or create a temporary one."""
+_REQUEST_TIMEOUT = 15.0
+
+
+async def _get_json(
+    session: aiohttp.ClientSession | None,
+    url: str,
+    *,
+    params: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+    cached: bool = True,
+) -> tuple[int, Any]:
+    """GET a JSON document, returning (status, data); data is None unless 200.
+
+    Without a session the request goes through the shared HTTP pool, so
+    chats opening together share one fetch of the same emote set. Emote
+    sets are the same for every viewer, so unless cached is False they are
+    served from the on-disk response cache and revalidated in the background.
+    """
     if session is not None:
-        yield session
-    else:
-        async with aiohttp.ClientSession(**kwargs) as s:
-            yield s
+        async with session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT),
+        ) as resp:
+            if resp.status != 200:
+                return resp.status, None
+            return resp.status, await resp.json(loads=json_codec.loads)
+
+    pool = get_http_pool()
+    fetch = pool.get_cached if cached else pool.get
+    pool_resp = await fetch(url, params=params, headers=headers, timeout=_REQUEST_TIMEOUT)
+    if pool_resp.status != 200:
+        return pool_resp.status, None
+    return pool_resp.status, pool_resp.json()
 
 
 class BaseEmoteProvider(ABC):
@@ -81,21 +106,19 @@ class TwitchProvider(BaseEmoteProvider):
         """Fetch Twitch global emotes."""
         emotes: list[ChatEmote] = []
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/chat/emotes/global",
-                    headers=self._get_headers(),
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        logger.debug(f"Twitch global emotes failed: {resp.status}")
-                        return emotes
-                    data = await resp.json()
-
-                    for emote_data in data.get("data", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(
+                session,
+                f"{self.BASE_URL}/chat/emotes/global",
+                headers=self._get_headers(),
+            )
+            if status != 200:
+                logger.debug(f"Twitch global emotes failed: {status}")
+                return emotes
+
+            for emote_data in data.get("data", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"Twitch global emotes error: {e}")
 
@@ -110,22 +133,20 @@ class TwitchProvider(BaseEmoteProvider):
             return emotes
 
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/chat/emotes",
-                    params={"broadcaster_id": channel_id},
-                    headers=self._get_headers(),
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        logger.debug(f"Twitch channel emotes failed: {resp.status}")
-                        return emotes
-                    data = await resp.json()
-
-                    for emote_data in data.get("data", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(
+                session,
+                f"{self.BASE_URL}/chat/emotes",
+                params={"broadcaster_id": channel_id},
+                headers=self._get_headers(),
+            )
+            if status != 200:
+                logger.debug(f"Twitch channel emotes failed: {status}")
+                return emotes
+
+            for emote_data in data.get("data", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"Twitch channel emotes error for {channel_id}: {e}")
 
@@ -144,31 +165,30 @@ class TwitchProvider(BaseEmoteProvider):
             return emotes
 
         try:
-            async with _optional_session(session) as s:
-                cursor: str | None = ""
-                while cursor is not None:
-                    params: dict[str, str] = {"user_id": user_id}
-                    if cursor:
-                        params["after"] = cursor
-
-                    async with s.get(
-                        f"{self.BASE_URL}/chat/emotes/user",
-                        params=params,
-                        headers=self._get_headers(),
-                        timeout=_REQUEST_TIMEOUT,
-                    ) as resp:
-                        if resp.status != 200:
-                            logger.debug(f"Twitch user emotes failed: {resp.status}")
-                            return emotes
-                        data = await resp.json()
-
-                        for emote_data in data.get("data", []):
-                            emote = self._parse_emote(emote_data)
-                            if emote:
-                                emotes.append(emote)
-
-                        # Handle pagination
-                        cursor = data.get("pagination", {}).get("cursor")
+            cursor: str | None = ""
+            while cursor is not None:
+                params: dict[str, str] = {"user_id": user_id}
+                if cursor:
+                    params["after"] = cursor
+
+                status, data = await _get_json(
+                    session,
+                    f"{self.BASE_URL}/chat/emotes/user",
+                    params=params,
+                    headers=self._get_headers(),
+                    cached=False,  # Depends on the user
+                )
+                if status != 200:
+                    logger.debug(f"Twitch user emotes failed: {status}")
+                    return emotes
+
+                for emote_data in data.get("data", []):
+                    emote = self._parse_emote(emote_data)
+                    if emote:
+                        emotes.append(emote)
+
+                # Handle pagination
+                cursor = data.get("pagination", {}).get("cursor")
         except Exception as e:
             logger.debug(f"Twitch user emotes error: {e}")
 
@@ -226,19 +246,14 @@ class SevenTVProvider(BaseEmoteProvider):
         """Fetch 7TV global emotes."""
         emotes: list[ChatEmote] = []
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/emote-sets/global",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    for emote_data in data.get("emotes", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(session, f"{self.BASE_URL}/emote-sets/global")
+            if status != 200:
+                return emotes
+
+            for emote_data in data.get("emotes", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"7TV global emotes error: {e}")
 
@@ -250,20 +265,17 @@ class SevenTVProvider(BaseEmoteProvider):
         """Fetch 7TV channel emotes."""
         emotes: list[ChatEmote] = []
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/users/{platform}/{channel_id}",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    emote_set = data.get("emote_set", {})
-                    for emote_data in emote_set.get("emotes", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(
+                session, f"{self.BASE_URL}/users/{platform}/{channel_id}"
+            )
+            if status != 200:
+                return emotes
+
+            emote_set = data.get("emote_set", {})
+            for emote_data in emote_set.get("emotes", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"7TV channel emotes error for {channel_id}: {e}")
 
@@ -320,19 +332,14 @@ class BTTVProvider(BaseEmoteProvider):
         """Fetch BTTV global emotes."""
         emotes: list[ChatEmote] = []
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/cached/emotes/global",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    for emote_data in data:
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(session, f"{self.BASE_URL}/cached/emotes/global")
+            if status != 200:
+                return emotes
+
+            for emote_data in data:
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"BTTV global emotes error: {e}")
 
@@ -348,26 +355,23 @@ class BTTVProvider(BaseEmoteProvider):
             return emotes
 
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/cached/users/twitch/{channel_id}",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    # Channel emotes
-                    for emote_data in data.get("channelEmotes", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
-
-                    # Shared emotes
-                    for emote_data in data.get("sharedEmotes", []):
-                        emote = self._parse_emote(emote_data)
-                        if emote:
-                            emotes.append(emote)
+            status, data = await _get_json(
+                session, f"{self.BASE_URL}/cached/users/twitch/{channel_id}"
+            )
+            if status != 200:
+                return emotes
+
+            # Channel emotes
+            for emote_data in data.get("channelEmotes", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
+
+            # Shared emotes
+            for emote_data in data.get("sharedEmotes", []):
+                emote = self._parse_emote(emote_data)
+                if emote:
+                    emotes.append(emote)
         except Exception as e:
             logger.debug(f"BTTV channel emotes error for {channel_id}: {e}")
 
@@ -414,21 +418,16 @@ class FFZProvider(BaseEmoteProvider):
         """Fetch FFZ global emotes."""
         emotes: list[ChatEmote] = []
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/set/global",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    for set_id in data.get("default_sets", []):
-                        emote_set = data.get("sets", {}).get(str(set_id), {})
-                        for emote_data in emote_set.get("emoticons", []):
-                            emote = self._parse_emote(emote_data)
-                            if emote:
-                                emotes.append(emote)
+            status, data = await _get_json(session, f"{self.BASE_URL}/set/global")
+            if status != 200:
+                return emotes
+
+            for set_id in data.get("default_sets", []):
+                emote_set = data.get("sets", {}).get(str(set_id), {})
+                for emote_data in emote_set.get("emoticons", []):
+                    emote = self._parse_emote(emote_data)
+                    if emote:
+                        emotes.append(emote)
         except Exception as e:
             logger.debug(f"FFZ global emotes error: {e}")
 
@@ -444,20 +443,15 @@ class FFZProvider(BaseEmoteProvider):
             return emotes
 
         try:
-            async with _optional_session(session) as s:
-                async with s.get(
-                    f"{self.BASE_URL}/room/id/{channel_id}",
-                    timeout=_REQUEST_TIMEOUT,
-                ) as resp:
-                    if resp.status != 200:
-                        return emotes
-                    data = await resp.json()
-
-                    for set_data in data.get("sets", {}).values():
-                        for emote_data in set_data.get("emoticons", []):
-                            emote = self._parse_emote(emote_data)
-                            if emote:
-                                emotes.append(emote)
+            status, data = await _get_json(session, f"{self.BASE_URL}/room/id/{channel_id}")
+            if status != 200:
+                return emotes
+
+            for set_data in data.get("sets", {}).values():
+                for emote_data in set_data.get("emoticons", []):
+                    emote = self._parse_emote(emote_data)
+                    if emote:
+                        emotes.append(emote)
         except Exception as e:
             logger.debug(f"FFZ channel emotes error for {channel_id}: {e}")
 
@@ -5,8 +5,7 @@ import logging
 import re
 from urllib.parse import parse_qs, unquote, urlparse
 
-import aiohttp
-
+from ..api.http_pool import get_http_pool
 from ..core.models import StreamPlatform
 
 logger = logging.getLogger(__name__)
@@ -102,31 +101,27 @@ async def _fetch_twitch_socials(channel_id: str) -> dict[str, str]:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                gql_url,
-                json=query,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return socials
-
-                data = await resp.json()
-                user = data.get("data", {}).get("user")
-                if not user:
-                    return socials
-
-                channel = user.get("channel", {})
-                social_medias = channel.get("socialMedias", []) if channel else []
-
-                for social in social_medias:
-                    name = (social.get("name") or "").lower()
-                    url = social.get("url") or ""
-                    if url:
-                        standard_name = _normalize_social_name(name)
-                        if standard_name not in socials:
-                            socials[standard_name] = url
+        resp = await get_http_pool().post(
+            gql_url, json=query, headers=headers, timeout=10, coalesce=True
+        )
+        if resp.status != 200:
+            return socials
+
+        data = resp.json()
+        user = data.get("data", {}).get("user")
+        if not user:
+            return socials
+
+        channel = user.get("channel", {})
+        social_medias = channel.get("socialMedias", []) if channel else []
+
+        for social in social_medias:
+            name = (social.get("name") or "").lower()
+            url = social.get("url") or ""
+            if url:
+                standard_name = _normalize_social_name(name)
+                if standard_name not in socials:
+                    socials[standard_name] = url
 
     except Exception as e:
         logger.debug(f"Twitch GQL socials query failed: {e}")
@@ -159,135 +154,130 @@ async def _fetch_youtube_socials(channel_id: str) -> dict[str, str]:
     logger.debug(f"Fetching YouTube socials from: {url}")
 
     try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                logger.debug(f"YouTube about page status: {resp.status}")
-                if resp.status != 200:
-                    return socials
-
-                html = await resp.text()
-                logger.debug(f"YouTube HTML length: {len(html)}")
-
-                # Extract ytInitialData JSON
-                match = re.search(r"var ytInitialData\s*=\s*({.+?});</script>", html, re.DOTALL)
-                if not match:
-                    logger.warning("Could not find ytInitialData in YouTube page")
-                    return socials
-
-                data = json.loads(match.group(1))
-                logger.debug(f"ytInitialData keys: {list(data.keys())}")
-
-                # Navigate to about channel links
-                endpoints = data.get("onResponseReceivedEndpoints", [])
-                logger.debug(f"YouTube onResponseReceivedEndpoints count: {len(endpoints)}")
-
-                # If no endpoints, try alternative path via tabs
-                if not endpoints:
-                    # Try contents.twoColumnBrowseResultsRenderer.tabs
-                    tabs = (
-                        data.get("contents", {})
-                        .get("twoColumnBrowseResultsRenderer", {})
-                        .get("tabs", [])
-                    )
-                    logger.debug(f"Trying tabs path, found {len(tabs)} tabs")
-                    for tab in tabs:
-                        tab_content = (
-                            tab.get("tabRenderer", {})
-                            .get("content", {})
-                            .get("sectionListRenderer", {})
-                            .get("contents", [])
-                        )
-                        for section in tab_content:
-                            about = (
-                                section.get("itemSectionRenderer", {})
-                                .get("contents", [{}])[0]
-                                .get("channelAboutFullMetadataRenderer", {})
-                            )
-                            if about:
-                                logger.debug("Found channelAboutFullMetadataRenderer")
-                                links = about.get("primaryLinks", [])
-                                for link in links:
-                                    title = link.get("title", {}).get("simpleText", "") or link.get(
-                                        "title", {}
-                                    ).get("runs", [{}])[0].get("text", "")
-                                    nav = link.get("navigationEndpoint", {})
-                                    url_ep = nav.get("urlEndpoint", {})
-                                    redirect_url = url_ep.get("url", "")
-                                    if redirect_url and "q=" in redirect_url:
-                                        actual_url = unquote(redirect_url.split("q=")[-1])
-                                        name = _detect_social_from_url(actual_url)
-                                        if not name:
-                                            name = _detect_social_from_title(title)
-                                        if name and name not in socials:
-                                            socials[name] = actual_url
-                                            logger.debug(f"Found social (tabs): {name}")
-
-                for endpoint in endpoints:
-                    panel = (
-                        endpoint.get("showEngagementPanelEndpoint", {})
-                        .get("engagementPanel", {})
-                        .get("engagementPanelSectionListRenderer", {})
-                        .get("content", {})
-                        .get("sectionListRenderer", {})
-                        .get("contents", [])
+        resp = await get_http_pool().get(url, headers=headers, timeout=15)
+        logger.debug(f"YouTube about page status: {resp.status}")
+        if resp.status != 200:
+            return socials
+
+        html = resp.text()
+        logger.debug(f"YouTube HTML length: {len(html)}")
+
+        # Extract ytInitialData JSON
+        match = re.search(r"var ytInitialData\s*=\s*({.+?});</script>", html, re.DOTALL)
+        if not match:
+            logger.warning("Could not find ytInitialData in YouTube page")
+            return socials
+
+        data = json.loads(match.group(1))
+        logger.debug(f"ytInitialData keys: {list(data.keys())}")
+
+        # Navigate to about channel links
+        endpoints = data.get("onResponseReceivedEndpoints", [])
+        logger.debug(f"YouTube onResponseReceivedEndpoints count: {len(endpoints)}")
+
+        # If no endpoints, try alternative path via tabs
+        if not endpoints:
+            # Try contents.twoColumnBrowseResultsRenderer.tabs
+            tabs = (
+                data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
+            )
+            logger.debug(f"Trying tabs path, found {len(tabs)} tabs")
+            for tab in tabs:
+                tab_content = (
+                    tab.get("tabRenderer", {})
+                    .get("content", {})
+                    .get("sectionListRenderer", {})
+                    .get("contents", [])
+                )
+                for section in tab_content:
+                    about = (
+                        section.get("itemSectionRenderer", {})
+                        .get("contents", [{}])[0]
+                        .get("channelAboutFullMetadataRenderer", {})
                     )
-                    logger.debug(f"YouTube panel contents count: {len(panel)}")
-                    for section in panel:
-                        about = (
-                            section.get("itemSectionRenderer", {})
-                            .get("contents", [{}])[0]
-                            .get("aboutChannelRenderer", {})
-                            .get("metadata", {})
-                            .get("aboutChannelViewModel", {})
-                        )
-                        links = about.get("links", [])
-                        if about:
-                            logger.debug(f"Found aboutChannelViewModel with {len(links)} links")
+                    if about:
+                        logger.debug("Found channelAboutFullMetadataRenderer")
+                        links = about.get("primaryLinks", [])
                         for link in links:
-                            link_vm = link.get("channelExternalLinkViewModel", {})
-                            title = link_vm.get("title", {}).get("content", "")
-                            link_data = link_vm.get("link", {})
-                            display_url = link_data.get("content", "")
-
-                            # Get actual URL from redirect
-                            actual_url = ""
-                            runs = link_data.get("commandRuns", [])
-                            for run in runs:
-                                innertube = run.get("onTap", {}).get("innertubeCommand", {})
-                                web_cmd = innertube.get("commandMetadata", {}).get(
-                                    "webCommandMetadata", {}
-                                )
-                                redirect_url = web_cmd.get("url", "")
-                                if redirect_url:
-                                    parsed = urlparse(redirect_url)
-                                    qs = parse_qs(parsed.query)
-                                    if "q" in qs:
-                                        # External link with redirect
-                                        actual_url = qs["q"][0]
-                                    elif parsed.path and not parsed.path.startswith("/redirect"):
-                                        # Internal YouTube link (direct URL)
-                                        actual_url = redirect_url
-                                    break
-
-                            # Use actual URL if available, else construct from display
-                            final_url = actual_url
-                            if not final_url and display_url:
-                                if not display_url.startswith("http"):
-                                    final_url = f"https://{display_url}"
-                                else:
-                                    final_url = display_url
-
-                            if not final_url:
-                                continue
-
-                            logger.debug(f"YouTube link: {title} -> {final_url}")
-
-                            # Detect social from URL or title
-                            name = _detect_social_from_url(final_url)
-                            if not name:
-                                name = _detect_social_from_title(title)
-                            if name and name not in socials:
-                                socials[name] = final_url
+                            title = link.get("title", {}).get("simpleText", "") or link.get(
+                                "title", {}
+                            ).get("runs", [{}])[0].get("text", "")
+                            nav = link.get("navigationEndpoint", {})
+                            url_ep = nav.get("urlEndpoint", {})
+                            redirect_url = url_ep.get("url", "")
+                            if redirect_url and "q=" in redirect_url:
+                                actual_url = unquote(redirect_url.split("q=")[-1])
+                                name = _detect_social_from_url(actual_url)
+                                if not name:
+                                    name = _detect_social_from_title(title)
+                                if name and name not in socials:
+                                    socials[name] = actual_url
+                                    logger.debug(f"Found social (tabs): {name}")
+
+        for endpoint in endpoints:
+            panel = (
+                endpoint.get("showEngagementPanelEndpoint", {})
+                .get("engagementPanel", {})
+                .get("engagementPanelSectionListRenderer", {})
+                .get("content", {})
+                .get("sectionListRenderer", {})
+                .get("contents", [])
+            )
+            logger.debug(f"YouTube panel contents count: {len(panel)}")
+            for section in panel:
+                about = (
+                    section.get("itemSectionRenderer", {})
+                    .get("contents", [{}])[0]
+                    .get("aboutChannelRenderer", {})
+                    .get("metadata", {})
+                    .get("aboutChannelViewModel", {})
+                )
+                links = about.get("links", [])
+                if about:
+                    logger.debug(f"Found aboutChannelViewModel with {len(links)} links")
+                for link in links:
+                    link_vm = link.get("channelExternalLinkViewModel", {})
+                    title = link_vm.get("title", {}).get("content", "")
+                    link_data = link_vm.get("link", {})
+                    display_url = link_data.get("content", "")
+
+                    # Get actual URL from redirect
+                    actual_url = ""
+                    runs = link_data.get("commandRuns", [])
+                    for run in runs:
+                        innertube = run.get("onTap", {}).get("innertubeCommand", {})
+                        web_cmd = innertube.get("commandMetadata", {}).get("webCommandMetadata", {})
+                        redirect_url = web_cmd.get("url", "")
+                        if redirect_url:
+                            parsed = urlparse(redirect_url)
+                            qs = parse_qs(parsed.query)
+                            if "q" in qs:
+                                # External link with redirect
+                                actual_url = qs["q"][0]
+                            elif parsed.path and not parsed.path.startswith("/redirect"):
+                                # Internal YouTube link (direct URL)
+                                actual_url = redirect_url
+                            break
+
+                    # Use actual URL if available, else construct from display
+                    final_url = actual_url
+                    if not final_url and display_url:
+                        if not display_url.startswith("http"):
+                            final_url = f"https://{display_url}"
+                        else:
+                            final_url = display_url
+
+                    if not final_url:
+                        continue
+
+                    logger.debug(f"YouTube link: {title} -> {final_url}")
+
+                    # Detect social from URL or title
+                    name = _detect_social_from_url(final_url)
+                    if not name:
+                        name = _detect_social_from_title(title)
+                    if name and name not in socials:
+                        socials[name] = final_url
 
     except Exception as e:
         logger.debug(f"YouTube socials fetch failed: {e}")
@@ -307,31 +297,30 @@ async def _fetch_kick_socials(channel_id: str) -> dict[str, str]:
     url = f"https://kick.com/api/v2/channels/{channel_id}"
 
     try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return socials
-
-                data = await resp.json()
-                user = data.get("user", {})
-
-                # Kick stores socials as usernames, need to construct URLs
-                social_fields = {
-                    "twitter": "https://twitter.com/{}",
-                    "instagram": "https://instagram.com/{}",
-                    "youtube": "https://youtube.com/{}",
-                    "discord": "https://discord.gg/{}",
-                    "tiktok": "https://tiktok.com/@{}",
-                    "facebook": "https://facebook.com/{}",
-                }
-
-                for field, url_template in social_fields.items():
-                    value = user.get(field)
-                    if value:
-                        # Clean up the value (remove trailing slashes, etc.)
-                        value = value.strip().rstrip("/")
-                        if value:
-                            socials[field] = url_template.format(value)
+        resp = await get_http_pool().get(url, headers=headers, timeout=10)
+        if resp.status != 200:
+            return socials
+
+        data = resp.json()
+        user = data.get("user", {})
+
+        # Kick stores socials as usernames, need to construct URLs
+        social_fields = {
+            "twitter": "https://twitter.com/{}",
+            "instagram": "https://instagram.com/{}",
+            "youtube": "https://youtube.com/{}",
+            "discord": "https://discord.gg/{}",
+            "tiktok": "https://tiktok.com/@{}",
+            "facebook": "https://facebook.com/{}",
+        }
+
+        for field, url_template in social_fields.items():
+            value = user.get(field)
+            if value:
+                # Clean up the value (remove trailing slashes, etc.)
+                value = value.strip().rstrip("/")
+                if value:
+                    socials[field] = url_template.format(value)
 
     except Exception as e:
         logger.debug(f"Kick socials fetch failed: {e}")
@@ -352,23 +341,22 @@ async def _fetch_chaturbate_socials(channel_id: str) -> dict[str, str]:
     url = f"https://chaturbate.com/api/biocontext/{channel_id}/"
 
     try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return socials
-
-                data = await resp.json()
-
-                # Parse social links from the about_me HTML field
-                about_me = data.get("about_me", "") or ""
-                if about_me:
-                    # Extract URLs from HTML content
-                    url_pattern = re.compile(r'href=["\']?(https?://[^"\'>\s]+)')
-                    found_urls = url_pattern.findall(about_me)
-                    for found_url in found_urls:
-                        name = _detect_social_from_url(found_url)
-                        if name and name not in socials:
-                            socials[name] = found_url
+        resp = await get_http_pool().get(url, headers=headers, timeout=10)
+        if resp.status != 200:
+            return socials
+
+        data = resp.json()
+
+        # Parse social links from the about_me HTML field
+        about_me = data.get("about_me", "") or ""
+        if about_me:
+            # Extract URLs from HTML content
+            url_pattern = re.compile(r'href=["\']?(https?://[^"\'>\s]+)')
+            found_urls = url_pattern.findall(about_me)
+            for found_url in found_urls:
+                name = _detect_social_from_url(found_url)
+                if name and name not in socials:
+                    socials[name] = found_url
 
     except Exception as e:
         logger.debug(f"Chaturbate socials fetch failed: {e}")
@@ -78,71 +78,55 @@ async def _fetch_global_emotes(
     providers: list[str], oauth_token: str, client_id: str
 ) -> dict[str, list[ChatEmote]]:
     """Fetch Twitch + third-party global emotes."""
-    import aiohttp
-
     twitch_globals: list[ChatEmote] = []
     common_globals: list[ChatEmote] = []
 
-    async with aiohttp.ClientSession() as session:
-        twitch_provider = TwitchProvider(
-            oauth_token=oauth_token,
-            client_id=client_id,
-        )
+    twitch_provider = TwitchProvider(
+        oauth_token=oauth_token,
+        client_id=client_id,
+    )
+    try:
+        twitch_globals = await twitch_provider.get_global_emotes()
+        logger.debug(f"Fetched {len(twitch_globals)} Twitch global emotes")
+    except Exception as e:
+        logger.debug(f"Failed to fetch Twitch global emotes: {e}")
+
+    provider_map: dict[str, type[SevenTVProvider] | type[BTTVProvider] | type[FFZProvider]] = {
+        "7tv": SevenTVProvider,
+        "bttv": BTTVProvider,
+        "ffz": FFZProvider,
+    }
+    for name in providers:
+        provider_cls = provider_map.get(name)
+        if not provider_cls:
+            continue
+        provider = provider_cls()
         try:
-            twitch_globals = await twitch_provider.get_global_emotes(session=session)
-            logger.debug(f"Fetched {len(twitch_globals)} Twitch global emotes")
+            emotes = await provider.get_global_emotes()
+            common_globals.extend(emotes)
+            logger.debug(f"Fetched {len(emotes)} global emotes from {name}")
         except Exception as e:
-            logger.debug(f"Failed to fetch Twitch global emotes: {e}")
-
-        provider_map: dict[str, type[SevenTVProvider] | type[BTTVProvider] | type[FFZProvider]] = {
-            "7tv": SevenTVProvider,
-            "bttv": BTTVProvider,
-            "ffz": FFZProvider,
-        }
-        for name in providers:
-            provider_cls = provider_map.get(name)
-            if not provider_cls:
-                continue
-            provider = provider_cls()
-            try:
-                emotes = await provider.get_global_emotes(session=session)
-                common_globals.extend(emotes)
-                logger.debug(f"Fetched {len(emotes)} global emotes from {name}")
-            except Exception as e:
-                logger.debug(f"Failed to fetch global emotes from {name}: {e}")
+            logger.debug(f"Failed to fetch global emotes from {name}: {e}")
 
     return {"twitch": twitch_globals, "common": common_globals}
 
 
 async def _fetch_user_emotes(oauth_token: str, client_id: str) -> list[ChatEmote]:
     """Fetch Twitch user emotes for the authenticated user."""
-    import aiohttp
+    from ..api.twitch_identity import get_identity_resolver
 
     if not oauth_token:
         return []
 
     # Resolve authenticated user ID
-    user_id = None
+    user = None
     if oauth_token and client_id:
         try:
-            headers = {
-                "Authorization": f"Bearer {oauth_token}",
-                "Client-Id": client_id,
-            }
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    "https://api.twitch.tv/helix/users",
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        users = data.get("data", [])
-                        if users:
-                            user_id = users[0].get("id", "") or None
+            user = await get_identity_resolver().get_authenticated_user(oauth_token, client_id)
         except Exception as e:
             logger.debug(f"Failed to get authenticated user ID: {e}")
 
-    if not user_id:
+    if not user:
         return []
 
     twitch_provider = TwitchProvider(
@@ -150,8 +134,7 @@ async def _fetch_user_emotes(oauth_token: str, client_id: str) -> list[ChatEmote
         client_id=client_id,
     )
     try:
-        async with aiohttp.ClientSession() as session:
-            emotes = await twitch_provider.get_user_emotes(user_id, session=session)
+        emotes = await twitch_provider.get_user_emotes(user.id)
         logger.debug(f"Fetched {len(emotes)} user emotes")
         return emotes
     except Exception as e:
@@ -311,110 +294,63 @@ class EmoteFetchWorker(QThread):
             loop.close()
 
     async def _resolve_twitch_user_id(self) -> str | None:
-        """Resolve a Twitch login name to numeric user ID.
-
-        Tries Helix API first (if OAuth available), then falls back to public IVR API.
-        """
-        import aiohttp
+        """Resolve a Twitch login name to numeric user ID via the shared identity cache."""
+        from ..api.twitch_identity import get_identity_resolver
 
         # If channel_id is already numeric, no need to resolve
         if self.channel_id.isdigit():
             return self.channel_id
 
-        # Try Helix API if we have credentials
-        if self.oauth_token and self.client_id:
-            try:
-                headers = {
-                    "Authorization": f"Bearer {self.oauth_token}",
-                    "Client-Id": self.client_id,
-                }
-                async with aiohttp.ClientSession(headers=headers) as session:
-                    async with session.get(
-                        "https://api.twitch.tv/helix/users",
-                        params={"login": self.channel_id},
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            users = data.get("data", [])
-                            if users:
-                                user_id: str = users[0].get("id", "")
-                                if user_id:
-                                    logger.debug(
-                                        f"Resolved Twitch login '{self.channel_id}' "
-                                        f"to user ID {user_id} (Helix)"
-                                    )
-                                    return user_id
-            except Exception as e:
-                logger.debug(f"Helix API failed for {self.channel_id}: {e}")
-
-        # Fallback to public IVR API (no auth required)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://api.ivr.fi/v2/twitch/user?login={self.channel_id}",
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if isinstance(data, list) and data:
-                            user_id = str(data[0].get("id", ""))
-                            if user_id:
-                                logger.debug(
-                                    f"Resolved Twitch login '{self.channel_id}' "
-                                    f"to user ID {user_id} (IVR)"
-                                )
-                                return user_id
+            users = await get_identity_resolver().get_users_by_login(
+                [self.channel_id], access_token=self.oauth_token, client_id=self.client_id
+            )
         except Exception as e:
-            logger.debug(f"IVR API failed for {self.channel_id}: {e}")
+            logger.debug(f"Failed to resolve Twitch user {self.channel_id}: {e}")
+            return None
+        user = users.get(self.channel_id.lower())
 
-        return None
+        if user is None:
+            return None
+        logger.debug(f"Resolved Twitch login '{self.channel_id}' to user ID {user.id}")
+        return user.id
 
     async def _fetch_channel_emotes(self, channel_id: str) -> list[ChatEmote]:
-        """Fetch channel emotes from all providers using a shared session."""
-        import aiohttp
-
+        """Fetch channel emotes from all providers through the shared HTTP pool."""
         all_emotes: list[ChatEmote] = []
 
-        async with aiohttp.ClientSession() as session:
-            # Fetch native platform emotes first
-            if self.platform == "twitch":
-                twitch_provider = TwitchProvider(
-                    oauth_token=self.oauth_token,
-                    client_id=self.client_id,
-                )
-                try:
-                    channel_emotes = await twitch_provider.get_channel_emotes(
-                        self.platform, channel_id, session=session
-                    )
-                    all_emotes.extend(channel_emotes)
-                    logger.debug(f"Fetched {len(channel_emotes)} channel emotes from twitch")
-                except Exception as e:
-                    logger.debug(f"Failed to fetch channel emotes from twitch: {e}")
-
-            # Fetch third-party emotes
-            provider_map: dict[
-                str, type[SevenTVProvider] | type[BTTVProvider] | type[FFZProvider]
-            ] = {
-                "7tv": SevenTVProvider,
-                "bttv": BTTVProvider,
-                "ffz": FFZProvider,
-            }
+        # Fetch native platform emotes first
+        if self.platform == "twitch":
+            twitch_provider = TwitchProvider(
+                oauth_token=self.oauth_token,
+                client_id=self.client_id,
+            )
+            try:
+                channel_emotes = await twitch_provider.get_channel_emotes(self.platform, channel_id)
+                all_emotes.extend(channel_emotes)
+                logger.debug(f"Fetched {len(channel_emotes)} channel emotes from twitch")
+            except Exception as e:
+                logger.debug(f"Failed to fetch channel emotes from twitch: {e}")
 
-            for name in self.providers:
-                provider_cls = provider_map.get(name)
-                if not provider_cls:
-                    continue
+        # Fetch third-party emotes
+        provider_map: dict[str, type[SevenTVProvider] | type[BTTVProvider] | type[FFZProvider]] = {
+            "7tv": SevenTVProvider,
+            "bttv": BTTVProvider,
+            "ffz": FFZProvider,
+        }
 
-                provider = provider_cls()
-                try:
-                    channel_emotes = await provider.get_channel_emotes(
-                        self.platform, channel_id, session=session
-                    )
-                    all_emotes.extend(channel_emotes)
-                    logger.debug(f"Fetched {len(channel_emotes)} channel emotes from {name}")
-                except Exception as e:
-                    logger.debug(f"Failed to fetch channel emotes from {name}: {e}")
+        for name in self.providers:
+            provider_cls = provider_map.get(name)
+            if not provider_cls:
+                continue
+
+            provider = provider_cls()
+            try:
+                channel_emotes = await provider.get_channel_emotes(self.platform, channel_id)
+                all_emotes.extend(channel_emotes)
+                logger.debug(f"Fetched {len(channel_emotes)} channel emotes from {name}")
+            except Exception as e:
+                logger.debug(f"Failed to fetch channel emotes from {name}: {e}")
 
         return all_emotes
 
@@ -424,7 +360,7 @@ class EmoteFetchWorker(QThread):
         Tries authenticated Helix API first, falls back to public badge API.
         Returns: {badge_id: (image_url, title)}
         """
-        import aiohttp
+        from ..api.http_pool import get_http_pool
 
         badge_map: dict[str, tuple[str, str]] = {}
 
@@ -434,53 +370,45 @@ class EmoteFetchWorker(QThread):
                 "Authorization": f"Bearer {self.oauth_token}",
                 "Client-Id": self.client_id,
             }
+            pool = get_http_pool()
             try:
-                async with aiohttp.ClientSession(headers=headers) as session:
-                    # Global badges
-                    async with session.get(
-                        "https://api.twitch.tv/helix/chat/badges/global",
-                        timeout=aiohttp.ClientTimeout(total=15),
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            for badge_set in data.get("data", []):
-                                set_id = badge_set.get("set_id", "")
-                                for version in badge_set.get("versions", []):
-                                    vid = version.get("id", "")
-                                    url = (
-                                        version.get("image_url_2x")
-                                        or version.get("image_url_1x")
-                                        or ""
-                                    )
-                                    title = version.get("title", "")
-                                    if set_id and vid and url:
-                                        badge_map[f"{set_id}/{vid}"] = (url, title)
-                        else:
-                            logger.warning(
-                                f"Helix badge API returned {resp.status}, trying public API"
-                            )
-
-                    # Channel badges (use resolved numeric ID)
-                    broadcaster_id = getattr(self, "_resolved_broadcaster_id", self.channel_id)
-                    async with session.get(
-                        "https://api.twitch.tv/helix/chat/badges",
-                        params={"broadcaster_id": broadcaster_id},
-                        timeout=aiohttp.ClientTimeout(total=15),
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            for badge_set in data.get("data", []):
-                                set_id = badge_set.get("set_id", "")
-                                for version in badge_set.get("versions", []):
-                                    vid = version.get("id", "")
-                                    url = (
-                                        version.get("image_url_2x")
-                                        or version.get("image_url_1x")
-                                        or ""
-                                    )
-                                    title = version.get("title", "")
-                                    if set_id and vid and url:
-                                        badge_map[f"{set_id}/{vid}"] = (url, title)
+                # Global badges (the same for every channel, so chats opening
+                # together share one request). Badge sets rarely change and are
+                # served from the response cache, revalidated in the background.
+                resp = await pool.get_cached(
+                    "https://api.twitch.tv/helix/chat/badges/global",
+                    headers=headers,
+                    timeout=15,
+                )
+                if resp.status == 200:
+                    for badge_set in resp.json().get("data", []):
+                        set_id = badge_set.get("set_id", "")
+                        for version in badge_set.get("versions", []):
+                            vid = version.get("id", "")
+                            url = version.get("image_url_2x") or version.get("image_url_1x") or ""
+                            title = version.get("title", "")
+                            if set_id and vid and url:
+                                badge_map[f"{set_id}/{vid}"] = (url, title)
+                else:
+                    logger.warning(f"Helix badge API returned {resp.status}, trying public API")
+
+                # Channel badges (use resolved numeric ID)
+                broadcaster_id = getattr(self, "_resolved_broadcaster_id", self.channel_id)
+                resp = await pool.get_cached(
+                    "https://api.twitch.tv/helix/chat/badges",
+                    params={"broadcaster_id": broadcaster_id},
+                    headers=headers,
+                    timeout=15,
+                )
+                if resp.status == 200:
+                    for badge_set in resp.json().get("data", []):
+                        set_id = badge_set.get("set_id", "")
+                        for version in badge_set.get("versions", []):
+                            vid = version.get("id", "")
+                            url = version.get("image_url_2x") or version.get("image_url_1x") or ""
+                            title = version.get("title", "")
+                            if set_id and vid and url:
+                                badge_map[f"{set_id}/{vid}"] = (url, title)
             except Exception as e:
                 logger.warning(f"Failed to fetch Twitch badges via Helix: {e}")
 
@@ -493,31 +421,28 @@ class EmoteFetchWorker(QThread):
 
     async def _fetch_public_twitch_badges(self) -> dict[str, tuple[str, str]]:
         """Fetch Twitch badges from the public (unauthenticated) badge API."""
-        import aiohttp
+        from ..api.http_pool import get_http_pool
 
         badge_map: dict[str, tuple[str, str]] = {}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://badges.twitch.tv/v1/badges/global/display",
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        badge_sets = data.get("badge_sets", {})
-                        for set_id, set_data in badge_sets.items():
-                            versions = set_data.get("versions", {})
-                            for vid, version_data in versions.items():
-                                url = (
-                                    version_data.get("image_url_2x")
-                                    or version_data.get("image_url_1x")
-                                    or ""
-                                )
-                                title = version_data.get("title", "")
-                                if url:
-                                    badge_map[f"{set_id}/{vid}"] = (url, title)
-                    else:
-                        logger.warning(f"Public badge API returned {resp.status}")
+            resp = await get_http_pool().get_cached(
+                "https://badges.twitch.tv/v1/badges/global/display", timeout=15
+            )
+            if resp.status == 200:
+                badge_sets = resp.json().get("badge_sets", {})
+                for set_id, set_data in badge_sets.items():
+                    versions = set_data.get("versions", {})
+                    for vid, version_data in versions.items():
+                        url = (
+                            version_data.get("image_url_2x")
+                            or version_data.get("image_url_1x")
+                            or ""
+                        )
+                        title = version_data.get("title", "")
+                        if url:
+                            badge_map[f"{set_id}/{vid}"] = (url, title)
+            else:
+                logger.warning(f"Public badge API returned {resp.status}")
         except Exception as e:
             logger.warning(f"Failed to fetch Twitch badges from public API: {e}")
 
@@ -700,55 +625,21 @@ class WhisperEventSubWorker(QThread):
         self.whisper_received.emit(message)
 
     async def _get_user_id(self) -> str | None:
-        import aiohttp
+        from ..api.twitch_identity import get_identity_resolver
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://id.twitch.tv/oauth2/validate",
-                    headers={"Authorization": f"OAuth {self.oauth_token}"},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        user_id: str | None = data.get("user_id")
-                        login: str = data.get("login", "?")
-                        logger.info(
-                            f"WhisperEventSub: authenticated as {login} (user_id={user_id})"
-                        )
-                        # Fetch properly-cased display_name from /helix/users
-                        display_name = login
-                        if user_id:
-                            display_name = await self._fetch_display_name(session, user_id) or login
-                        if display_name and display_name != "?":
-                            self.authenticated_as.emit(display_name)
-                        return user_id
+            user = await get_identity_resolver().get_authenticated_user(
+                self.oauth_token, self.client_id
+            )
         except Exception as e:
             logger.warning(f"WhisperEventSub: failed to get user ID: {e}")
-        return None
-
-    async def _fetch_display_name(self, session: Any, user_id: str) -> str | None:
-        """Fetch properly-cased display_name from /helix/users."""
-        import aiohttp
-
-        try:
-            async with session.get(
-                f"https://api.twitch.tv/helix/users?id={user_id}",
-                headers={
-                    "Authorization": f"Bearer {self.oauth_token}",
-                    "Client-Id": self.client_id,
-                },
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    users = data.get("data", [])
-                    if users:
-                        result: str | None = users[0].get("display_name")
-                        return result
-        except aiohttp.ClientError:
-            pass
-        return None
+            return None
+        if user is None:
+            return None
+        logger.info(f"WhisperEventSub: authenticated as {user.login} (user_id={user.id})")
+        # Properly-cased display name from the identity cache
+        self.authenticated_as.emit(user.display_name or user.login)
+        return user.id
 
 
 class HypeTrainEventSubWorker(QThread):
@@ -0,0 +1,293 @@
+"""SQLite-backed persistence for monitored channels, the trash bin, the
+last known live state, and state learned by the API clients.
+
+Each channel is one row, so adding, removing, or toggling a channel writes
+only that record. The database runs in WAL mode; every write is a single
+transaction, so a crash mid-write leaves the previous state intact instead
+of a truncated file.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from . import json_codec
+from .settings import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trash (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS live_state (
+    stream_key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS client_state (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def channel_record_key(record: dict[str, Any]) -> str:
+    """Return the channel unique_key for a serialized channel record."""
+    return f"{record['platform']}:{record['channel_id']}"
+
+
+class ChannelStore:
+    """Row-per-channel store for channels and trashed channels.
+
+    Records are the same dicts that used to be written to channels.json and
+    trash.json. On first use, existing JSON files are imported and renamed
+    to ``*.json.migrated``.
+
+    Thread-safe: all access goes through one connection guarded by a lock.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Database file path."""
+        if self._path is None:
+            self._path = get_data_dir() / "channels.db"
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (call with _lock held)."""
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            self._migrate_json(conn)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn = conn
+        return conn
+
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """Import legacy channels.json/trash.json files sitting next to the database."""
+        data_dir = self.path.parent
+        channels_path = data_dir / "channels.json"
+        trash_path = data_dir / "trash.json"
+
+        channels: list[dict[str, Any]] = []
+        trash: list[dict[str, Any]] = []
+        for path, target in ((channels_path, channels), (trash_path, trash)):
+            if not path.exists():
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    loaded = json_codec.loads(f.read())
+                if isinstance(loaded, list):
+                    target.extend(r for r in loaded if isinstance(r, dict))
+            except (OSError, json_codec.JSONDecodeError) as e:
+                logger.error(f"Error reading {path.name} for migration: {e}")
+
+        if not channels and not trash:
+            return
+
+        with conn:
+            conn.execute("BEGIN")
+            for record in channels:
+                try:
+                    key = channel_record_key(record)
+                except KeyError:
+                    continue
+                conn.execute(
+                    "INSERT OR REPLACE INTO channels (key, data) VALUES (?, ?)",
+                    (key, json_codec.dumps(record)),
+                )
+            conn.executemany(
+                "INSERT INTO trash (data) VALUES (?)", [(json_codec.dumps(r),) for r in trash]
+            )
+
+        for path in (channels_path, trash_path):
+            if path.exists():
+                try:
+                    path.replace(path.with_name(path.name + ".migrated"))
+                except OSError as e:
+                    logger.warning(f"Could not rename {path.name} after migration: {e}")
+        logger.info(
+            f"Migrated {len(channels)} channels and {len(trash)} trash entries to {self.path.name}"
+        )
+
+    # --- Channels ---
+
+    def load_channels(self) -> list[dict[str, Any]]:
+        """Return all channel records in insertion order."""
+        with self._lock:
+            rows = self._connect().execute("SELECT data FROM channels ORDER BY rowid").fetchall()
+        records: list[dict[str, Any]] = []
+        for (data,) in rows:
+            try:
+                records.append(json_codec.loads(data))
+            except json_codec.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt channel record: {e}")
+        return records
+
+    def write_channels(
+        self,
+        upserts: list[dict[str, Any]] | None = None,
+        deletes: list[str] | None = None,
+        trash: list[dict[str, Any]] | None = None,
+    ) -> list[int]:
+        """Insert/update and delete channel records in a single transaction.
+
+        Args:
+            upserts: Channel records to insert or replace.
+            deletes: Channel unique_keys to delete.
+            trash: Trash entries to append (e.g. for the deleted channels).
+
+        Returns:
+            The ids of the new trash entries.
+        """
+        ids: list[int] = []
+        if not upserts and not deletes and not trash:
+            return ids
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                if deletes:
+                    conn.executemany("DELETE FROM channels WHERE key = ?", [(k,) for k in deletes])
+                if upserts:
+                    conn.executemany(
+                        "INSERT INTO channels (key, data) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+                        [(channel_record_key(r), json_codec.dumps(r)) for r in upserts],
+                    )
+                for record in trash or ():
+                    cur = conn.execute(
+                        "INSERT INTO trash (data) VALUES (?)", (json_codec.dumps(record),)
+                    )
+                    ids.append(int(cur.lastrowid or 0))
+        return ids
+
+    # --- Trash ---
+
+    def load_trash(self) -> list[tuple[int, dict[str, Any]]]:
+        """Return (id, record) pairs for all trash entries, oldest first."""
+        with self._lock:
+            rows = self._connect().execute("SELECT id, data FROM trash ORDER BY id").fetchall()
+        entries: list[tuple[int, dict[str, Any]]] = []
+        for row_id, data in rows:
+            try:
+                entries.append((row_id, json_codec.loads(data)))
+            except json_codec.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt trash record: {e}")
+        return entries
+
+    def add_trash(self, records: list[dict[str, Any]]) -> list[int]:
+        """Append trash entries and return their ids."""
+        return self.write_channels(trash=records)
+
+    def delete_trash(self, ids: list[int]) -> None:
+        """Delete trash entries by id."""
+        if not ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany("DELETE FROM trash WHERE id = ?", [(i,) for i in ids])
+
+    def clear_trash(self) -> None:
+        """Delete all trash entries."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM trash")
+
+    # --- Live state snapshot ---
+
+    def load_live_snapshot(self) -> list[dict[str, Any]]:
+        """Return the live stream records saved by the last write_live_snapshot()."""
+        with self._lock:
+            rows = self._connect().execute("SELECT data FROM live_state").fetchall()
+        records: list[dict[str, Any]] = []
+        for (data,) in rows:
+            try:
+                records.append(json_codec.loads(data))
+            except json_codec.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt live state record: {e}")
+        return records
+
+    def write_live_snapshot(self, records: dict[str, dict[str, Any]]) -> None:
+        """Replace the live state snapshot.
+
+        Args:
+            records: stream_key -> live stream record.
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM live_state")
+                conn.executemany(
+                    "INSERT INTO live_state (stream_key, data) VALUES (?, ?)",
+                    [(key, json_codec.dumps(r)) for key, r in records.items()],
+                )
+
+    # --- API client state ---
+
+    def load_client_state(self) -> dict[str, dict[str, Any]]:
+        """Return name -> state for every saved API client state."""
+        with self._lock:
+            rows = self._connect().execute("SELECT name, data FROM client_state").fetchall()
+        states: dict[str, dict[str, Any]] = {}
+        for name, data in rows:
+            try:
+                states[name] = json_codec.loads(data)
+            except json_codec.JSONDecodeError as e:
+                logger.error(f"Skipping corrupt client state for {name}: {e}")
+        return states
+
+    def write_client_state(self, states: dict[str, dict[str, Any]]) -> None:
+        """Insert or replace API client states.
+
+        Args:
+            states: Client name (platform value) -> state.
+        """
+        if not states:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT INTO client_state (name, data) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET data = excluded.data",
+                    [(name, json_codec.dumps(state)) for name, state in states.items()],
+                )
+
+    def close(self) -> None:
+        """Checkpoint the WAL and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.debug(f"WAL checkpoint failed: {e}")
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,391 @@
+"""Headless monitor daemon with a local query socket.
+
+Runs StreamMonitor's refresh loop and desktop notifications without Qt, and
+serves the monitor's state over a Unix domain socket so scripts and other
+frontends can consume it. The protocol is newline-delimited JSON: each
+request line is an object with a "cmd" key and gets one reply line,
+{"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+Commands:
+    status      Channel/live counts, last refresh time, uptime.
+    channels    Every monitored channel.
+    live        Every stream that is currently live.
+    refresh     Force a full refresh and reply when it is done (an error
+                reply starting with "busy" if a refresh is already running).
+    subscribe   Push {"event": "changes", ...} lines after each refresh
+                that changed something, until the client disconnects.
+
+Example:
+    echo '{"cmd": "live"}' | socat - UNIX-CONNECT:$XDG_RUNTIME_DIR/livestream-list-qt.sock
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .models import Channel, Livestream, RefreshChanges
+from .monitor import StreamMonitor
+from .settings import Settings, get_data_dir
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "livestream-list-qt.sock"
+
+# Longest accepted request line
+MAX_REQUEST_BYTES = 64 * 1024
+# Replies/events queued per client before it is considered stuck and dropped
+CLIENT_QUEUE_SIZE = 256
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path ($XDG_RUNTIME_DIR, else the data dir)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / SOCKET_NAME
+    return get_data_dir() / SOCKET_NAME
+
+
+def _iso(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt else None
+
+
+def channel_to_dict(channel: Channel) -> dict[str, Any]:
+    """Serialize a channel for the query socket."""
+    return {
+        "key": channel.unique_key,
+        "platform": channel.platform.value,
+        "channel_id": channel.channel_id,
+        "display_name": channel.display_name,
+        "favorite": channel.favorite,
+        "dont_notify": channel.dont_notify,
+    }
+
+
+def livestream_to_dict(livestream: Livestream) -> dict[str, Any]:
+    """Serialize a livestream for the query socket."""
+    return {
+        "key": livestream.stream_key,
+        "channel": livestream.channel.unique_key,
+        "platform": livestream.channel.platform.value,
+        "display_name": livestream.display_name,
+        "live": livestream.live,
+        "title": livestream.title,
+        "game": livestream.game,
+        "viewers": livestream.viewers,
+        "start_time": _iso(livestream.start_time),
+        "last_live_time": _iso(livestream.last_live_time),
+        "video_id": livestream.video_id,
+        "room_status": livestream.room_status,
+        "stale": livestream.stale,
+    }
+
+
+def changes_to_event(changes: RefreshChanges) -> dict[str, Any]:
+    """Serialize a refresh change set as a subscription event."""
+    updated = {ls.stream_key for ls in changes.added_streams} | set(changes.changed)
+    return {
+        "event": "changes",
+        "went_live": [ls.stream_key for ls in changes.went_live],
+        "went_offline": [ls.stream_key for ls in changes.went_offline],
+        "updated": [
+            livestream_to_dict(changes.streams[key])
+            for key in sorted(updated)
+            if key in changes.streams
+        ],
+        "removed": [ls.stream_key for ls in changes.removed_streams],
+        "added_channels": [channel_to_dict(ch) for ch in changes.added_channels],
+        "removed_channels": [ch.unique_key for ch in changes.removed_channels],
+    }
+
+
+class DaemonAlreadyRunningError(RuntimeError):
+    """Another daemon is already listening on the socket."""
+
+
+class _Client:
+    """One socket connection; all writes go through its queue."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(CLIENT_QUEUE_SIZE)
+        self.subscribed = False
+        self.write_task: asyncio.Task[None] | None = None
+
+    def send(self, message: dict[str, Any]) -> bool:
+        """Queue a message; returns False if the client has fallen too far behind."""
+        try:
+            self.queue.put_nowait(json.dumps(message).encode() + b"\n")
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def write_loop(self) -> None:
+        while True:
+            data = await self.queue.get()
+            if data is None:
+                break
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class MonitorDaemon:
+    """Serves a StreamMonitor's state over a Unix domain socket.
+
+    Usage:
+        daemon = MonitorDaemon(monitor, socket_path, notifier=notifier)
+        await daemon.run()  # until request_stop() or SIGINT/SIGTERM
+    """
+
+    def __init__(
+        self,
+        monitor: StreamMonitor,
+        socket_path: Path | None = None,
+        notifier: Any = None,
+    ) -> None:
+        self.monitor = monitor
+        self.socket_path = socket_path or default_socket_path()
+        self.notifier = notifier
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clients: set[_Client] = set()
+        self._stop_event = asyncio.Event()
+        self._started_at = time.monotonic()
+        self._last_refresh: datetime | None = None
+        self._callbacks_registered = False
+
+    async def start(self) -> None:
+        """Bind the socket and hook into the monitor's callbacks.
+
+        Raises:
+            DaemonAlreadyRunningError: If another daemon is already listening on the socket.
+        """
+        self._loop = asyncio.get_running_loop()
+        await self._remove_stale_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path), limit=MAX_REQUEST_BYTES
+        )
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"Daemon listening on {self.socket_path}")
+
+        if not self._callbacks_registered:
+            self._callbacks_registered = True
+            self.monitor.on_refresh_changes(self._on_refresh_changes)
+            self.monitor.on_refresh_complete(self._on_refresh_complete)
+            self.monitor.on_stream_online(self._on_stream_online)
+
+    async def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        try:
+            _reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        except OSError:
+            # Left behind by a crashed daemon
+            logger.warning(f"Removing stale socket {self.socket_path}")
+            self.socket_path.unlink(missing_ok=True)
+            return
+        writer.close()
+        raise DaemonAlreadyRunningError(
+            f"Another daemon is already listening on {self.socket_path}"
+        )
+
+    async def stop(self) -> None:
+        """Disconnect clients, close the server and remove the socket file."""
+        for client in list(self._clients):
+            self._drop_client(client)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def request_stop(self) -> None:
+        """Ask run() to shut down (safe from any thread)."""
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        else:
+            self._stop_event.set()
+
+    async def run(self) -> None:
+        """Serve the socket and run the monitor until stopped."""
+        await self.start()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not on the main thread, or unsupported platform
+
+        try:
+            await self.monitor.initialize()
+            await self.monitor.start()
+            logger.info(
+                f"Monitoring {len(self.monitor.channels)} channels, "
+                f"{len(self.monitor.live_streams)} live"
+            )
+            await self._stop_event.wait()
+        finally:
+            logger.info("Daemon shutting down")
+            await self.stop()
+            await self.monitor.stop()
+            self.monitor.close()
+
+    # --- Monitor callbacks ---
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        """Send a message to every subscriber (runs on the daemon loop)."""
+        for client in list(self._clients):
+            if client.subscribed and not client.send(message):
+                logger.warning("Dropping subscriber that stopped reading events")
+                self._drop_client(client)
+
+    def _on_refresh_changes(self, changes: RefreshChanges) -> None:
+        # Serialize now, while the Livestream objects hold this refresh's values
+        message = changes_to_event(changes)
+        loop = self._loop
+        if loop is None:
+            return
+        if _on_loop(loop):
+            self._dispatch(message)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, message)
+
+    def _on_refresh_complete(self, _livestreams: list[Livestream]) -> None:
+        self._last_refresh = datetime.now(timezone.utc)
+
+    def _on_stream_online(self, livestream: Livestream) -> None:
+        if self.notifier is None:
+            return
+        try:
+            self.notifier.send_notification_sync(livestream)
+        except Exception as e:
+            logger.error(f"Notification error: {e}")
+
+    # --- Connections ---
+
+    def _drop_client(self, client: _Client) -> None:
+        """Disconnect a client without flushing its queued messages."""
+        self._clients.discard(client)
+        if client.write_task is not None:
+            client.write_task.cancel()
+        client.writer.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        client = _Client(writer)
+        self._clients.add(client)
+        write_task = client.write_task = asyncio.create_task(client.write_loop())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    client.send({"ok": False, "error": "request too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                client.send(await self._handle_request(client, line))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if client in self._clients:
+                # Flush pending replies before closing
+                self._clients.discard(client)
+                try:
+                    client.queue.put_nowait(None)
+                    await asyncio.wait_for(write_task, timeout=5.0)
+                except (asyncio.QueueFull, asyncio.TimeoutError, ConnectionError):
+                    write_task.cancel()
+            writer.close()
+
+    async def _handle_request(self, client: _Client, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            cmd = request["cmd"]
+        except (ValueError, TypeError, KeyError):
+            return {"ok": False, "error": "expected a JSON object with a 'cmd' key"}
+
+        try:
+            if cmd == "status":
+                result: Any = self._status()
+            elif cmd == "channels":
+                result = [channel_to_dict(ch) for ch in self.monitor.channels]
+            elif cmd == "live":
+                result = [livestream_to_dict(ls) for ls in self.monitor.live_streams]
+            elif cmd == "refresh":
+                if self.monitor.refresh_in_progress:
+                    return {"ok": False, "error": "busy: a refresh is already running"}
+                await self.monitor.refresh(force=True)
+                result = self._status()
+            elif cmd == "subscribe":
+                client.subscribed = True
+                result = "subscribed"
+            else:
+                return {"ok": False, "error": f"unknown command: {cmd}"}
+        except Exception as e:
+            logger.error(f"Daemon command {cmd!r} failed: {e}")
+            return {"ok": False, "error": str(e)}
+        return {"ok": True, "result": result}
+
+    def _status(self) -> dict[str, Any]:
+        return {
+            "channels": len(self.monitor.channels),
+            "live": len(self.monitor.live_streams),
+            "last_refresh": _iso(self._last_refresh),
+            "uptime": round(time.monotonic() - self._started_at, 1),
+            "clients": len(self._clients),
+        }
+
+
+def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def run_daemon(settings: Settings, socket_path: Path | None = None) -> int:
+    """Run the headless monitor until SIGINT/SIGTERM.
+
+    Args:
+        settings: Loaded application settings.
+        socket_path: Query socket path (defaults to default_socket_path()).
+
+    Returns:
+        Process exit code.
+    """
+    from ..api.http_pool import get_http_pool
+    from ..api.twitch_identity import get_identity_resolver
+    from ..api.twitch_users import get_user_store
+    from ..notifications.notifier import Notifier
+    from .event_loop import get_service_loop
+
+    monitor = StreamMonitor(settings)
+    try:
+        notifier = Notifier(settings.notifications)
+    except Exception as e:
+        logger.warning(f"Notifications unavailable: {e}")
+        notifier = None
+    daemon = MonitorDaemon(monitor, socket_path, notifier=notifier)
+    try:
+        asyncio.run(daemon.run())
+    except DaemonAlreadyRunningError as e:
+        logger.error(str(e))
+        return 1
+    finally:
+        # The shared HTTP pool runs on the service loop if anything used it;
+        # identity clients share its connector, so close them first
+        get_identity_resolver().shutdown()
+        get_http_pool().shutdown()
+        get_service_loop().stop()
+        get_user_store().close()
+    return 0
@@ -0,0 +1,127 @@
+"""Long-lived asyncio event loop running on a background thread."""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """Runs one asyncio event loop on a daemon thread for the app's lifetime.
+
+    Platform clients keep their aiohttp sessions (and the pooled TCP/TLS
+    connections and DNS cache behind them) on this loop, so connections stay
+    warm across refreshes instead of being rebuilt for every short-lived
+    worker loop. Coroutines are submitted from any thread with submit().
+    """
+
+    def __init__(self, name: str = "asyncio-loop") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        # Serializes start()/stop() between threads that share the loop
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The running event loop, or None if not started."""
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """True while the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread (no-op if already running)."""
+        if self.is_running:
+            return
+        with self._lock:
+            if self.is_running:
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+            self._ready.wait()
+
+    def _run(self) -> None:
+        """Thread body: run the loop until stop() is called, then clean up."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            self._loop = None
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule a coroutine on the loop from any thread.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            A concurrent.futures.Future for the coroutine's result.
+
+        Raises:
+            RuntimeError: If the loop is not running.
+        """
+        loop = self._loop
+        if loop is None or not self.is_running:
+            coro.close()
+            raise RuntimeError("Background event loop is not running")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def stop(
+        self,
+        shutdown: Callable[[], Coroutine[Any, Any, Any]] | None = None,
+        timeout: float = 5.0,
+    ) -> None:
+        """Stop the loop and wait for the thread to exit.
+
+        Args:
+            shutdown: Optional coroutine function run on the loop first
+                (e.g. closing HTTP sessions).
+            timeout: Seconds to wait for the shutdown coroutine and the thread.
+        """
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            if loop is None or thread is None:
+                return
+            if shutdown is not None:
+                try:
+                    self.submit(shutdown()).result(timeout)
+                except Exception as e:
+                    logger.warning(f"Background loop shutdown error: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            self._thread = None
+
+
+_service_loop = BackgroundLoop(name="livestream-list-asyncio")
+
+
+def get_service_loop() -> BackgroundLoop:
+    """Return the process-wide service loop.
+
+    The monitor's API clients, the shared HTTP pool and the Twitch identity
+    resolver all keep their sessions on this one loop. Whoever needs it
+    first starts it; the application stops it on shutdown.
+    """
+    return _service_loop
@@ -0,0 +1,147 @@
+"""JSON encoding and decoding for hot paths, using a C backend when available.
+
+Chat frames (a Kick Pusher event is JSON inside JSON, Chaturbate SockJS
+frames are arrays of JSON strings), chat log lines, API responses and the
+channel store are decoded or encoded many times a second in busy sessions.
+loads()/dumps() use orjson or msgspec if one is installed and the standard
+library otherwise:
+
+    pip install "livestream-list-qt[speedups]"
+
+Results match the standard library: input a fast backend rejects (NaN,
+integers beyond 64 bits, non-string keys, ...) is handed to the json
+module, so errors are always json.JSONDecodeError (a ValueError) on decode
+and TypeError/ValueError on encode. Output is compact UTF-8 (no
+ensure_ascii escaping) with every backend.
+"""
+
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Preferred order; the first importable one is used
+BACKENDS = ("orjson", "msgspec", "json")
+
+JSONDecodeError = json.JSONDecodeError
+
+_Loads = Callable[[str | bytes | bytearray], Any]
+_Dumps = Callable[[Any, bool, Callable[[Any], Any] | None], bytes]
+
+
+def _orjson() -> tuple[_Loads, _Dumps]:
+    import orjson
+
+    def dumps(obj: Any, sort_keys: bool, default: Callable[[Any], Any] | None) -> bytes:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return bytes(orjson.dumps(obj, default=default, option=option))
+
+    return orjson.loads, dumps
+
+
+def _msgspec() -> tuple[_Loads, _Dumps]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def dumps(obj: Any, sort_keys: bool, default: Callable[[Any], Any] | None) -> bytes:
+        if default is not None:
+            return bytes(
+                msgspec.json.encode(obj, enc_hook=default, order="sorted" if sort_keys else None)
+            )
+        if sort_keys:
+            return bytes(msgspec.json.encode(obj, order="sorted"))
+        return bytes(encoder.encode(obj))
+
+    return decoder.decode, dumps
+
+
+_FACTORIES: dict[str, Callable[[], tuple[_Loads, _Dumps]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+}
+
+backend = "json"
+_fast_loads: _Loads | None = None
+_fast_dumps: _Dumps | None = None
+
+
+def use_backend(name: str | None = None) -> str:
+    """Select the backend by name, or the first available one if None.
+
+    Returns:
+        The backend now in use.
+
+    Raises:
+        ImportError: If the named backend is not installed.
+    """
+    global backend, _fast_loads, _fast_dumps
+    names = BACKENDS if name is None else (name,)
+    for candidate in names:
+        if candidate == "json":
+            backend, _fast_loads, _fast_dumps = "json", None, None
+            return backend
+        try:
+            _fast_loads, _fast_dumps = _FACTORIES[candidate]()
+        except ImportError:
+            if name is not None:
+                raise
+            continue
+        backend = candidate
+        return backend
+    raise ValueError(f"Unknown JSON backend: {name}")
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except Exception:
+            pass  # Let the json module accept it (e.g. NaN) or raise JSONDecodeError
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    indent: int | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Encode obj as a JSON string.
+
+    Args:
+        obj: Value to encode.
+        sort_keys: Sort object keys.
+        indent: Pretty-print with this indent (always done by the json module).
+        default: Called for objects the encoder cannot handle.
+
+    Raises:
+        TypeError: If obj contains something that cannot be encoded.
+    """
+    if _fast_dumps is not None and indent is None:
+        try:
+            return _fast_dumps(obj, sort_keys, default).decode()
+        except Exception:
+            pass  # e.g. integers beyond 64 bits; the json module handles or explains
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=indent,
+        default=default,
+        ensure_ascii=False,
+        separators=separators,
+    )
+
+
+use_backend()
+logger.debug(f"JSON backend: {backend}")
@@ -78,6 +78,24 @@ class Channel:
         return self.unique_key == other.unique_key
 
 
+# Livestream fields copied verbatim by Livestream.update_from()
+_REFRESHED_FIELDS = (
+    "live",
+    "title",
+    "game",
+    "game_slug",
+    "viewers",
+    "start_time",
+    "thumbnail_url",
+    "is_partner",
+    "language",
+    "is_mature",
+    "error_message",
+    "video_id",
+    "room_status",
+)
+
+
 @dataclass
 class Livestream:
     """Represents an active or offline livestream."""
@@ -98,6 +116,7 @@ class Livestream:
     video_id: str | None = None  # YouTube video ID for live chat
     chatroom_id: int | None = None  # Kick chatroom ID for built-in chat
     room_status: str | None = None  # Chaturbate room status (public/private/hidden/offline)
+    stale: bool = False  # Restored from the startup snapshot, not yet confirmed by a refresh
 
     @property
     def display_name(self) -> str:
@@ -278,6 +297,22 @@ class Livestream:
         self.viewers = 0
         self.start_time = None
 
+    def changed_fields(self, other: "Livestream") -> set[str]:
+        """Return the names of fields that update_from(other) would change.
+
+        last_live_time is only reported for offline streams, since it is
+        bumped on every refresh while a stream is live and isn't displayed.
+        "stale" is reported when a snapshot-restored stream gets confirmed.
+        """
+        changed = {
+            name for name in _REFRESHED_FIELDS if getattr(self, name) != getattr(other, name)
+        }
+        if self.stale:
+            changed.add("stale")
+        if not other.live and other.last_live_time and other.last_live_time != self.last_live_time:
+            changed.add("last_live_time")
+        return changed
+
     def update_from(self, other: "Livestream") -> bool:
         """
         Update this livestream with data from another instance.
@@ -298,6 +333,7 @@ class Livestream:
         self.error_message = other.error_message
         self.video_id = other.video_id
         self.room_status = other.room_status
+        self.stale = False
 
         if other.live:
             self.last_live_time = datetime.now(timezone.utc)
@@ -314,3 +350,53 @@ class Livestream:
         if not isinstance(other, Livestream):
             return False
         return self.channel == other.channel
+
+
+@dataclass
+class RefreshChanges:
+    """Change set produced by a single StreamMonitor refresh.
+
+    Lets consumers touch only the affected rows instead of rescanning every
+    livestream. All Livestream references point at the monitor's live objects.
+    """
+
+    went_live: list[Livestream] = field(default_factory=list)
+    went_offline: list[Livestream] = field(default_factory=list)
+    # stream_key -> names of fields that changed (excluding streams that were added)
+    changed: dict[str, set[str]] = field(default_factory=dict)
+    added_streams: list[Livestream] = field(default_factory=list)
+    removed_streams: list[Livestream] = field(default_factory=list)
+    added_channels: list[Channel] = field(default_factory=list)
+    removed_channels: list[Channel] = field(default_factory=list)
+    # stream_key -> Livestream for every stream referenced above
+    streams: dict[str, Livestream] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed."""
+        return not (
+            self.changed
+            or self.added_streams
+            or self.removed_streams
+            or self.added_channels
+            or self.removed_channels
+        )
+
+    @property
+    def membership_changed(self) -> bool:
+        """True if streams or channels were added/removed or changed live state."""
+        return bool(
+            self.went_live
+            or self.went_offline
+            or self.added_streams
+            or self.removed_streams
+            or self.added_channels
+            or self.removed_channels
+        )
+
+    def changed_field_names(self) -> set[str]:
+        """Union of all changed field names across streams."""
+        names: set[str] = set()
+        for fields in self.changed.values():
+            names |= fields
+        return names
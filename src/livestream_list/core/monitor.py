@@ -1,20 +1,23 @@
 """Stream monitoring service."""
 
 import asyncio
-import json
 import logging
 import threading
+import time
 from collections.abc import Callable
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from ..api.base import BaseApiClient
 from ..api.chaturbate import ChaturbateApiClient
 from ..api.kick import KickApiClient
 from ..api.twitch import TwitchApiClient
+from ..api.twitch_eventsub import TwitchStreamEventSub
 from ..api.youtube import YouTubeApiClient
-from .models import Channel, Livestream, StreamPlatform
-from .settings import Settings, get_data_dir
+from .channel_store import ChannelStore, channel_record_key
+from .models import Channel, Livestream, RefreshChanges, StreamPlatform
+from .scheduler import PollScheduler
+from .settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,19 @@ SAVE_DEBOUNCE_DELAY = 2.0
 # be removed and then re-notified when the next refresh succeeds.
 YOUTUBE_MISS_THRESHOLD = 2
 
+# Live state snapshots older than this are ignored at startup; a stream shown
+# as live from a day-old snapshot is more misleading than an empty list.
+LIVE_SNAPSHOT_MAX_AGE = timedelta(hours=12)
+
+# A pushed stream event is confirmed by polling the channel; the platform API
+# can lag the event by a few seconds, so retry this many times, this far apart.
+PUSH_CONFIRM_ATTEMPTS = 3
+PUSH_CONFIRM_DELAY = 10.0
+
+# Name of the scheduler's row in the store's client state table (next to
+# the API clients' rows, which are named after their platform)
+SCHEDULER_STATE_KEY = "scheduler"
+
 
 class StreamMonitor:
     """
@@ -38,17 +54,50 @@ class StreamMonitor:
         self.settings = settings
         self._channels: dict[str, Channel] = {}
         self._livestreams: dict[str, Livestream] = {}
+        # Channel unique_key -> its stream_keys in _livestreams (base key plus
+        # any YouTube :video_id keys). Maintained alongside _livestreams under
+        # _state_lock so per-channel lookups don't scan every livestream.
+        self._stream_keys_by_channel: dict[str, set[str]] = {}
         self._clients: dict[StreamPlatform, BaseApiClient] = {}
         self._running = False
         self._refresh_task: asyncio.Task[None] | None = None
+        # refresh() calls currently running
+        self._refreshes_running = 0
 
         # Event callbacks
         self._on_stream_online: list[Callable[[Livestream], None]] = []
         self._on_stream_offline: list[Callable[[Livestream], None]] = []
         self._on_refresh_complete: list[Callable[[list[Livestream]], None]] = []
+        self._on_refresh_changes: list[Callable[[RefreshChanges], None]] = []
+        self._on_platform_refreshed: list[Callable[[StreamPlatform, float], None]] = []
 
-        # Trash bin for deleted channels
+        # Channels added/removed since the last refresh, reported in the next
+        # RefreshChanges (guarded by _state_lock)
+        self._pending_added_channels: dict[str, Channel] = {}
+        self._pending_removed_channels: dict[str, Channel] = {}
+
+        # Trash bin for deleted channels, with matching ChannelStore row ids
         self._trash: list[dict[str, Any]] = []
+        self._trash_ids: list[int] = []
+        # Trash entries not yet written; they are stored in the same
+        # transaction as their channels' deletion (guarded by _state_lock)
+        self._pending_trash: list[dict[str, Any]] = []
+
+        # Row-per-channel persistence; only dirty/deleted records are written
+        self._store = ChannelStore()
+        self._dirty_channel_keys: set[str] = set()
+        self._deleted_channel_keys: set[str] = set()
+
+        # Channel unique_key -> when it was last polled (UTC), saved with the
+        # live state snapshot (guarded by _state_lock)
+        self._last_checked: dict[str, datetime] = {}
+
+        # Client state last written to the store, to skip unchanged writes
+        self._saved_client_state: dict[str, dict[str, Any]] = {}
+
+        # Twitch EventSub stream.online/offline session, when enabled
+        self._twitch_push: TwitchStreamEventSub | None = None
+        self._push_tasks: set[asyncio.Task[None]] = set()
 
         # Track initial load to suppress startup notifications
         self._initial_load_complete = False
@@ -67,6 +116,12 @@ class StreamMonitor:
         # Lock for protecting channel/livestream state from concurrent access
         self._state_lock = threading.RLock()
 
+        # Per-channel next-check deadlines (guarded by _state_lock)
+        self._scheduler = PollScheduler(
+            self.settings.refresh_interval,
+            self.settings.performance.max_poll_interval,
+        )
+
         # Initialize API clients
         self._init_clients()
 
@@ -101,6 +156,11 @@ class StreamMonitor:
         with self._state_lock:
             return [s for s in self._livestreams.values() if s.live]
 
+    @property
+    def refresh_in_progress(self) -> bool:
+        """True while a refresh() call is running."""
+        return self._refreshes_running > 0
+
     def get_client(self, platform: StreamPlatform) -> BaseApiClient:
         """Get the API client for a platform."""
         return self._clients[platform]
@@ -117,6 +177,21 @@ class StreamMonitor:
         """Register a callback for when a refresh cycle completes."""
         self._on_refresh_complete.append(callback)
 
+    def on_refresh_changes(self, callback: Callable[[RefreshChanges], None]) -> None:
+        """Register a callback receiving the change set of each refresh.
+
+        Only called when something changed. Runs on the refreshing thread.
+        """
+        self._on_refresh_changes.append(callback)
+
+    def on_platform_refreshed(self, callback: Callable[[StreamPlatform, float], None]) -> None:
+        """Register a callback for when one platform's results have been applied.
+
+        Called with the platform and the seconds its query took, after that
+        platform's online/offline and change-set callbacks have fired.
+        """
+        self._on_platform_refreshed.append(callback)
+
     async def initialize(self) -> None:
         """Initialize the monitor service."""
         # Load saved channels
@@ -144,6 +219,7 @@ class StreamMonitor:
 
         self._running = True
         self._refresh_task = asyncio.create_task(self._refresh_loop())
+        await self.sync_push_updates()
 
     async def stop(self) -> None:
         """Stop the monitoring loop."""
@@ -156,6 +232,8 @@ class StreamMonitor:
             except asyncio.CancelledError:
                 pass
 
+        await self._stop_push_updates()
+
         # Close API clients
         for client in self._clients.values():
             await client.close()
@@ -164,19 +242,61 @@ class StreamMonitor:
         """Main refresh loop."""
         while self._running:
             try:
-                await asyncio.sleep(self.settings.refresh_interval)
+                if self.settings.performance.adaptive_polling:
+                    with self._state_lock:
+                        delay = self._scheduler.seconds_until_next_due()
+                else:
+                    delay = self.settings.refresh_interval
+                await asyncio.sleep(delay)
                 await self.refresh()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in refresh loop: {e}")
 
-    async def refresh(self) -> None:
-        """Refresh all livestream statuses."""
+    async def refresh(self, force: bool = False) -> None:
+        """Refresh livestream statuses.
+
+        With adaptive polling enabled, only channels whose next-check deadline
+        has passed are queried. Pass force=True to query every channel
+        (e.g. for a manual refresh).
+
+        Platforms are queried concurrently and each platform's results are
+        applied and published (online/offline, change-set and
+        platform-refreshed callbacks) as soon as it finishes. Refresh-complete
+        callbacks fire once every platform is done.
+        """
+        self._refreshes_running += 1
+        try:
+            await self._refresh(force)
+        finally:
+            self._refreshes_running -= 1
+
+    async def _refresh(self, force: bool) -> None:
         with self._state_lock:
             if not self._channels:
                 return
             channels_snapshot = list(self._channels.values())
+            self._scheduler.set_intervals(
+                self.settings.refresh_interval,
+                self.settings.performance.max_poll_interval,
+            )
+            if not force and self.settings.performance.adaptive_polling:
+                total = len(channels_snapshot)
+                channels_snapshot = self._scheduler.due_channels(channels_snapshot)
+                logger.debug("Polling %d/%d due channels", len(channels_snapshot), total)
+            if self._twitch_push is not None:
+                self._twitch_push.set_channels(self._push_priority_logins())
+            # Confirm channels the startup snapshot showed as live first
+            restored_keys = {
+                ls.channel.unique_key for ls in self._livestreams.values() if ls.stale and ls.live
+            }
+            if restored_keys:
+                channels_snapshot.sort(key=lambda ch: ch.unique_key not in restored_keys)
+
+        if not channels_snapshot:
+            self._fire_pending_channel_changes()
+            return
 
         # Group channels by platform
         by_platform: dict[StreamPlatform, list[Channel]] = {}
@@ -185,47 +305,172 @@ class StreamMonitor:
                 by_platform[channel.platform] = []
             by_platform[channel.platform].append(channel)
 
-        # Query each platform concurrently
-        tasks = []
-        for platform, channels in by_platform.items():
-            client = self._clients[platform]
-            tasks.append(self._query_platform(client, channels))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        all_livestreams: list[Livestream] = []
+        # Query each platform concurrently; each one's results are applied and
+        # published as soon as it finishes, so fast platforms never wait on slow ones
+        results = await asyncio.gather(
+            *(
+                self._refresh_platform(platform, channels)
+                for platform, channels in by_platform.items()
+            ),
+            return_exceptions=True,
+        )
         for result in results:
             if isinstance(result, BaseException):
-                logger.error(f"Platform query error: {result}")
+                logger.error(f"Platform refresh error: {result}")
+
+        self._save_live_snapshot()
+        self._save_client_state()
+
+        # Fire refresh complete
+        for callback in self._on_refresh_complete:
+            try:
+                callback(self.livestreams)
+            except Exception as e:
+                logger.error(f"Refresh callback error: {e}")
+
+    async def _refresh_platform(self, platform: StreamPlatform, channels: list[Channel]) -> None:
+        """Query one platform, merge its results, and fire events for them."""
+        started = time.monotonic()
+        livestreams = await self._query_platform(self._clients[platform], channels)
+        changes = self._apply_results(channels, livestreams)
+        elapsed = time.monotonic() - started
+        logger.debug(
+            "%s refreshed %d channels in %.2fs (%d changed)",
+            platform.value,
+            len(channels),
+            elapsed,
+            len(changes.changed),
+        )
+
+        for livestream in changes.went_live:
+            self._fire_stream_online(livestream)
+        for livestream in changes.went_offline:
+            self._fire_stream_offline(livestream)
+        self._fire_refresh_changes(changes)
+
+        for callback in self._on_platform_refreshed:
+            try:
+                callback(platform, elapsed)
+            except Exception as e:
+                logger.error(f"Platform refreshed callback error: {e}")
+
+    # --- Push updates (Twitch EventSub) ---
+
+    async def sync_push_updates(self) -> None:
+        """Start or stop Twitch EventSub go-live push updates to match the settings.
+
+        Must run on the loop the refreshes run on. Safe to call repeatedly.
+        """
+        twitch = self.settings.twitch
+        client = self._clients.get(StreamPlatform.TWITCH)
+        enabled = (
+            twitch.eventsub_stream_events
+            and bool(twitch.access_token)
+            and isinstance(client, TwitchApiClient)
+        )
+        if not enabled:
+            await self._stop_push_updates()
+            return
+        if self._twitch_push is not None:
+            return
+        assert isinstance(client, TwitchApiClient)
+        self._twitch_push = TwitchStreamEventSub(
+            client, self._on_twitch_stream_event, self._on_push_coverage
+        )
+        with self._state_lock:
+            self._twitch_push.set_channels(self._push_priority_logins())
+        self._twitch_push.start()
+        logger.info("Twitch EventSub push updates enabled")
+
+    async def _stop_push_updates(self) -> None:
+        push, self._twitch_push = self._twitch_push, None
+        if push is not None:
+            await push.stop()
+        for task in list(self._push_tasks):
+            task.cancel()
+
+    def _push_priority_logins(self) -> list[str]:
+        """Twitch channels to subscribe to, favorites first (call under _state_lock)."""
+        twitch = [ch for ch in self._channels.values() if ch.platform == StreamPlatform.TWITCH]
+        twitch.sort(key=lambda ch: not ch.favorite)
+        return [ch.channel_id for ch in twitch]
+
+    def _on_push_coverage(self, logins: set[str]) -> None:
+        """Poll pushed channels only to reconcile while they are offline."""
+        keys = {f"{StreamPlatform.TWITCH.value}:{login}" for login in logins}
+        with self._state_lock:
+            self._scheduler.set_push_covered(keys)
+
+    def _on_twitch_stream_event(self, login: str, online: bool) -> None:
+        """Refresh a channel right away when Twitch pushes a stream event for it."""
+        key = f"{StreamPlatform.TWITCH.value}:{login}"
+        with self._state_lock:
+            channel = self._channels.get(key)
+        if channel is None:
+            return
+        task = asyncio.create_task(self._refresh_pushed_channel(channel, online))
+        self._push_tasks.add(task)
+        task.add_done_callback(self._push_tasks.discard)
+
+    async def _refresh_pushed_channel(self, channel: Channel, online: bool) -> None:
+        """Poll a channel until it reflects a pushed online/offline event."""
+        key = channel.unique_key
+        for attempt in range(PUSH_CONFIRM_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(PUSH_CONFIRM_DELAY)
+            try:
+                await self._refresh_platform(channel.platform, [channel])
+            except Exception as e:
+                logger.error(f"Error refreshing {key} after push event: {e}")
                 continue
-            all_livestreams.extend(result)
+            with self._state_lock:
+                live = any(ls.live for ls in self._channel_livestreams(key))
+            if live == online:
+                break
+        self._save_live_snapshot()
 
-        # Update internal state and fire events
-        events_to_fire: list[tuple[str, Livestream]] = []
+    def _apply_results(
+        self, channels: list[Channel], livestreams: list[Livestream]
+    ) -> RefreshChanges:
+        """Merge polled livestreams into state and return what changed.
+
+        Args:
+            channels: The channels that were polled.
+            livestreams: Livestreams returned by the platform clients.
+        """
+        changes = RefreshChanges()
 
         with self._state_lock:
+            self._drain_pending_channel_changes(changes)
+
             # Track which stream_keys we received per channel (for cleanup)
             new_keys_by_channel: dict[str, set[str]] = {}
-            for livestream in all_livestreams:
+            for livestream in livestreams:
                 channel_key = livestream.channel.unique_key
                 new_keys_by_channel.setdefault(channel_key, set()).add(livestream.stream_key)
 
             # Process incoming livestreams
-            for livestream in all_livestreams:
+            for livestream in livestreams:
                 key = livestream.stream_key
                 existing = self._livestreams.get(key)
 
                 if existing:
+                    was_live = existing.live
+                    changed = existing.changed_fields(livestream)
                     went_live = existing.update_from(livestream)
+                    if changed:
+                        changes.changed[key] = changed
+                        changes.streams[key] = existing
                     if went_live:
-                        events_to_fire.append(("online", existing))
-                    elif not livestream.live and existing.live:
-                        events_to_fire.append(("offline", existing))
+                        changes.went_live.append(existing)
+                    elif was_live and not livestream.live:
+                        changes.went_offline.append(existing)
                 else:
-                    self._livestreams[key] = livestream
+                    self._put_livestream(livestream)
+                    changes.added_streams.append(livestream)
+                    changes.streams[key] = livestream
                     if livestream.live:
-                        events_to_fire.append(("online", livestream))
+                        changes.went_live.append(livestream)
 
             # Cleanup: remove stale YouTube stream_keys that are no longer live
             # (e.g., one of two concurrent streams ended). A stream_key is
@@ -233,51 +478,136 @@ class StreamMonitor:
             # misses to tolerate transient scrape failures that would
             # otherwise trigger duplicate online notifications.
             stale_keys: list[str] = []
-            for key, ls in list(self._livestreams.items()):
-                if ls.channel.platform != StreamPlatform.YOUTUBE:
-                    continue
-                channel_key = ls.channel.unique_key
-                if channel_key not in new_keys_by_channel:
-                    continue  # Channel wasn't refreshed this cycle
-                new_keys = new_keys_by_channel[channel_key]
-                if key == channel_key:
-                    continue  # Never reap the bare channel key here
-                if key in new_keys:
-                    # Present this cycle — reset miss counter
-                    self._youtube_miss_counts.pop(key, None)
+            for channel_key, new_keys in new_keys_by_channel.items():
+                if not channel_key.startswith(StreamPlatform.YOUTUBE.value + ":"):
                     continue
-                # Missing this cycle — increment miss counter
-                misses = self._youtube_miss_counts.get(key, 0) + 1
-                if misses >= YOUTUBE_MISS_THRESHOLD:
-                    stale_keys.append(key)
-                else:
-                    self._youtube_miss_counts[key] = misses
-                    logger.debug(
-                        "YouTube stream %s missing (%d/%d), keeping in state",
-                        key,
-                        misses,
-                        YOUTUBE_MISS_THRESHOLD,
-                    )
+                for key in self._stream_keys_by_channel.get(channel_key, ()):
+                    if key == channel_key:
+                        continue  # Never reap the bare channel key here
+                    if key in new_keys:
+                        # Present this cycle — reset miss counter
+                        self._youtube_miss_counts.pop(key, None)
+                        continue
+                    # Missing this cycle — increment miss counter
+                    misses = self._youtube_miss_counts.get(key, 0) + 1
+                    if misses >= YOUTUBE_MISS_THRESHOLD or self._livestreams[key].stale:
+                        stale_keys.append(key)
+                    else:
+                        self._youtube_miss_counts[key] = misses
+                        logger.debug(
+                            "YouTube stream %s missing (%d/%d), keeping in state",
+                            key,
+                            misses,
+                            YOUTUBE_MISS_THRESHOLD,
+                        )
 
             for key in stale_keys:
-                stale_ls = self._livestreams.pop(key)
+                stale_ls = self._pop_livestream(key)
                 self._youtube_miss_counts.pop(key, None)
+                changes.removed_streams.append(stale_ls)
+                changes.changed.pop(key, None)
+                changes.streams[key] = stale_ls
                 if stale_ls.live:
-                    events_to_fire.append(("offline", stale_ls))
+                    changes.went_offline.append(stale_ls)
+
+            # last_live_time moves while a stream is live; persist it with the
+            # next save (or on shutdown) without scheduling a write per refresh
+            for ls in changes.went_offline + [ls for ls in livestreams if ls.live]:
+                if ls.channel.unique_key in self._channels:
+                    self._mark_channel_dirty(ls.channel.unique_key)
+
+            # Schedule the next check for every channel polled this cycle. A
+            # channel the client left out (e.g. live, but its details failed)
+            # was not really checked: poll it again on the next refresh.
+            for ls in changes.went_live:
+                self._scheduler.record_went_live(ls.channel.unique_key, ls.start_time)
+            checked_at = datetime.now(timezone.utc)
+            for channel in channels:
+                channel_key = channel.unique_key
+                if channel_key not in new_keys_by_channel:
+                    self._scheduler.mark_due(channel_key)
+                    continue
+                self._last_checked[channel_key] = checked_at
+                self._scheduler.record_checked(channel, self._channel_livestreams(channel_key))
+
+        return changes
+
+    # --- Livestream index helpers (call under _state_lock) ---
+
+    def _put_livestream(self, livestream: Livestream) -> None:
+        """Insert or replace a livestream, keeping the channel index in sync."""
+        key = livestream.stream_key
+        self._livestreams[key] = livestream
+        self._stream_keys_by_channel.setdefault(livestream.channel.unique_key, set()).add(key)
+
+    def _pop_livestream(self, stream_key: str) -> Livestream:
+        """Remove a livestream by stream_key, keeping the channel index in sync."""
+        livestream = self._livestreams.pop(stream_key)
+        channel_key = livestream.channel.unique_key
+        keys = self._stream_keys_by_channel.get(channel_key)
+        if keys is not None:
+            keys.discard(stream_key)
+            if not keys:
+                del self._stream_keys_by_channel[channel_key]
+        return livestream
+
+    def _pop_channel_livestreams(self, channel_key: str) -> list[Livestream]:
+        """Remove every livestream belonging to a channel."""
+        removed: list[Livestream] = []
+        self._last_checked.pop(channel_key, None)
+        for key in self._stream_keys_by_channel.pop(channel_key, ()):
+            livestream = self._livestreams.pop(key, None)
+            self._youtube_miss_counts.pop(key, None)
+            if livestream is not None:
+                removed.append(livestream)
+        return removed
+
+    def _channel_livestreams(self, channel_key: str) -> list[Livestream]:
+        """Return every livestream belonging to a channel."""
+        return [
+            self._livestreams[key]
+            for key in self._stream_keys_by_channel.get(channel_key, ())
+            if key in self._livestreams
+        ]
+
+    def _note_channel_added(self, channel: Channel) -> None:
+        """Record a channel addition for the next change set (call under _state_lock)."""
+        key = channel.unique_key
+        if self._pending_removed_channels.pop(key, None) is None:
+            self._pending_added_channels[key] = channel
 
-        # Fire events outside the lock
-        for event_type, livestream in events_to_fire:
-            if event_type == "online":
-                self._fire_stream_online(livestream)
-            else:
-                self._fire_stream_offline(livestream)
+    def _note_channel_removed(self, channel: Channel) -> None:
+        """Record a channel removal for the next change set (call under _state_lock)."""
+        key = channel.unique_key
+        if self._pending_added_channels.pop(key, None) is None:
+            self._pending_removed_channels[key] = channel
+        client = self._clients.get(channel.platform)
+        if client is not None:
+            client.forget_channel(channel.channel_id)
+
+    def _drain_pending_channel_changes(self, changes: RefreshChanges) -> None:
+        """Move pending channel additions/removals into a change set."""
+        changes.added_channels.extend(self._pending_added_channels.values())
+        changes.removed_channels.extend(self._pending_removed_channels.values())
+        self._pending_added_channels.clear()
+        self._pending_removed_channels.clear()
+
+    def _fire_pending_channel_changes(self) -> None:
+        """Report channel additions/removals when no channel was polled."""
+        changes = RefreshChanges()
+        with self._state_lock:
+            self._drain_pending_channel_changes(changes)
+        self._fire_refresh_changes(changes)
 
-        # Fire refresh complete
-        for callback in self._on_refresh_complete:
+    def _fire_refresh_changes(self, changes: RefreshChanges) -> None:
+        """Fire refresh change-set callbacks if anything changed."""
+        if changes.is_empty:
+            return
+        for callback in self._on_refresh_changes:
             try:
-                callback(self.livestreams)
+                callback(changes)
             except Exception as e:
-                logger.error(f"Refresh callback error: {e}")
+                logger.error(f"Refresh changes callback error: {e}")
 
     async def _query_platform(
         self, client: BaseApiClient, channels: list[Channel]
@@ -344,12 +674,14 @@ class StreamMonitor:
                 return self._channels[channel.unique_key]
 
             self._channels[channel.unique_key] = channel
+            self._note_channel_added(channel)
+            self._mark_channel_dirty(channel.unique_key)
 
         # Create initial livestream entry
         livestream = await client.get_livestream(channel)
 
         with self._state_lock:
-            self._livestreams[livestream.stream_key] = livestream
+            self._put_livestream(livestream)
 
         # Save to disk
         await self._save_channels()
@@ -361,12 +693,12 @@ class StreamMonitor:
         key = channel.unique_key
 
         with self._state_lock:
-            self._channels.pop(key, None)
+            if self._channels.pop(key, None) is not None:
+                self._note_channel_removed(channel)
+                self._mark_channel_deleted(key)
+            self._scheduler.forget(key)
             # Remove all stream_keys for this channel (base key + any with video_id suffix)
-            keys_to_remove = [k for k in self._livestreams if k == key or k.startswith(key + ":")]
-            for k in keys_to_remove:
-                self._livestreams.pop(k, None)
-                self._youtube_miss_counts.pop(k, None)
+            self._pop_channel_livestreams(key)
 
         await self._save_channels()
 
@@ -384,7 +716,9 @@ class StreamMonitor:
             for channel in channels:
                 if channel.unique_key not in self._channels:
                     self._channels[channel.unique_key] = channel
-                    self._livestreams[channel.unique_key] = Livestream(channel=channel)
+                    self._put_livestream(Livestream(channel=channel))
+                    self._note_channel_added(channel)
+                    self._mark_channel_dirty(channel.unique_key)
                     added.append(channel)
 
         if added:
@@ -404,19 +738,22 @@ class StreamMonitor:
             if key in self._channels:
                 return False
             self._channels[key] = channel
-            self._livestreams[key] = Livestream(channel=channel)
+            self._put_livestream(Livestream(channel=channel))
+            self._note_channel_added(channel)
+            self._mark_channel_dirty(key)
             return True
 
     def remove_channels(self, keys: list[str]) -> None:
         """Remove multiple channels by their unique keys."""
         with self._state_lock:
             for key in keys:
-                self._channels.pop(key, None)
-                keys_to_remove = [
-                    k for k in self._livestreams if k == key or k.startswith(key + ":")
-                ]
-                for k in keys_to_remove:
-                    self._livestreams.pop(k, None)
+                removed = self._channels.pop(key, None)
+                if removed is not None:
+                    self._note_channel_removed(removed)
+                    self._mark_channel_deleted(key)
+                self._scheduler.forget(key)
+                self._pop_channel_livestreams(key)
+        self._schedule_debounced_save()
 
     def has_channel(self, key: str) -> bool:
         """Check if a channel exists by its unique key."""
@@ -457,6 +794,7 @@ class StreamMonitor:
         with self._state_lock:
             if channel.unique_key in self._channels:
                 self._channels[channel.unique_key].dont_notify = dont_notify
+                self._mark_channel_dirty(channel.unique_key)
         self._schedule_debounced_save()
 
     def set_favorite(self, channel: Channel, favorite: bool) -> None:
@@ -464,6 +802,9 @@ class StreamMonitor:
         with self._state_lock:
             if channel.unique_key in self._channels:
                 self._channels[channel.unique_key].favorite = favorite
+                self._mark_channel_dirty(channel.unique_key)
+                if favorite:
+                    self._scheduler.mark_due(channel.unique_key)
         self._schedule_debounced_save()
 
     def set_auto_launch(self, channel: Channel, auto_launch: bool) -> None:
@@ -471,6 +812,7 @@ class StreamMonitor:
         with self._state_lock:
             if channel.unique_key in self._channels:
                 self._channels[channel.unique_key].auto_launch = auto_launch
+                self._mark_channel_dirty(channel.unique_key)
         self._schedule_debounced_save()
 
     def _schedule_debounced_save(self) -> None:
@@ -502,43 +844,71 @@ class StreamMonitor:
         # Save synchronously (this runs in timer thread)
         self._save_channels_sync()
 
-    def _serialize_channels(self) -> list[dict[str, Any]]:
-        """Serialize channels to a list of dicts for JSON persistence."""
-        data = []
-        with self._state_lock:
-            for ch in self._channels.values():
-                ch_data = {
-                    "channel_id": ch.channel_id,
-                    "platform": ch.platform.value,
-                    "display_name": ch.display_name,
-                    "imported_by": ch.imported_by,
-                    "dont_notify": ch.dont_notify,
-                    "favorite": ch.favorite,
-                    "auto_launch": ch.auto_launch,
-                    "added_at": ch.added_at.isoformat(),
-                }
-                # Pick the most recent last_live_time across all stream_keys for this channel
-                best_last_live: datetime | None = None
-                for key, ls in self._livestreams.items():
-                    if key == ch.unique_key or key.startswith(ch.unique_key + ":"):
-                        if ls.last_live_time:
-                            if best_last_live is None or ls.last_live_time > best_last_live:
-                                best_last_live = ls.last_live_time
-                if best_last_live:
-                    ch_data["last_live_time"] = best_last_live.isoformat()
-                data.append(ch_data)
-        return data
+    def _mark_channel_dirty(self, key: str) -> None:
+        """Queue a channel record to be written on the next save (call under _state_lock)."""
+        self._deleted_channel_keys.discard(key)
+        self._dirty_channel_keys.add(key)
+
+    def _mark_channel_deleted(self, key: str) -> None:
+        """Queue a channel record to be deleted on the next save (call under _state_lock)."""
+        self._dirty_channel_keys.discard(key)
+        self._deleted_channel_keys.add(key)
+
+    def _serialize_channel(self, ch: Channel) -> dict[str, Any]:
+        """Serialize a channel to a dict for persistence (call under _state_lock)."""
+        ch_data: dict[str, Any] = {
+            "channel_id": ch.channel_id,
+            "platform": ch.platform.value,
+            "display_name": ch.display_name,
+            "imported_by": ch.imported_by,
+            "dont_notify": ch.dont_notify,
+            "favorite": ch.favorite,
+            "auto_launch": ch.auto_launch,
+            "added_at": ch.added_at.isoformat(),
+        }
+        # Pick the most recent last_live_time across all stream_keys for this channel
+        best_last_live: datetime | None = None
+        for ls in self._channel_livestreams(ch.unique_key):
+            if ls.last_live_time:
+                if best_last_live is None or ls.last_live_time > best_last_live:
+                    best_last_live = ls.last_live_time
+        if best_last_live:
+            ch_data["last_live_time"] = best_last_live.isoformat()
+        return ch_data
 
     def _save_channels_sync(self) -> None:
-        """Save channels to disk synchronously."""
-        path = get_data_dir() / "channels.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
+        """Write dirty channel records, pending deletions and trash entries to the store."""
+        with self._state_lock:
+            # Walk _channels so new rows are inserted in channel order (the
+            # store loads by insertion order)
+            dirty = self._dirty_channel_keys
+            upserts = [
+                self._serialize_channel(ch) for key, ch in self._channels.items() if key in dirty
+            ]
+            deletes = list(self._deleted_channel_keys)
+            trash, self._pending_trash = self._pending_trash, []
+            self._dirty_channel_keys.clear()
+            self._deleted_channel_keys.clear()
 
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self._serialize_channels(), f, indent=2)
+            ids = self._store.write_channels(upserts=upserts, deletes=deletes, trash=trash)
         except Exception as e:
             logger.error(f"Error saving channels: {e}")
+            # Re-queue so the next save retries
+            with self._state_lock:
+                self._pending_trash[:0] = trash
+                for record in upserts:
+                    key = channel_record_key(record)
+                    if key not in self._deleted_channel_keys:
+                        self._dirty_channel_keys.add(key)
+                for key in deletes:
+                    if key not in self._dirty_channel_keys:
+                        self._deleted_channel_keys.add(key)
+            return
+        if trash:
+            with self._state_lock:
+                self._trash.extend(trash)
+                self._trash_ids.extend(ids)
 
     def flush_pending_save(self) -> None:
         """Immediately save any pending changes.
@@ -550,25 +920,35 @@ class StreamMonitor:
                 self._save_timer.cancel()
                 self._save_timer = None
 
-            if self._pending_save:
-                self._pending_save = False
-                self._save_channels_sync()
+            self._pending_save = False
+        # Dirty records also accumulate without a scheduled save (e.g.
+        # last_live_time updates from refreshes), so always flush here.
+        self._save_channels_sync()
+        self._save_live_snapshot()
+        self._save_client_state()
+
+    def close(self) -> None:
+        """Save pending changes and close the channel store.
+
+        Call this last on application shutdown, after stop() or
+        close_all_sessions(); it checkpoints the store's WAL.
+        """
+        self.flush_pending_save()
+        self._store.close()
 
     async def save_channels(self) -> None:
         """Public method to save channels to disk."""
         await self._save_channels()
 
     async def _load_channels(self) -> None:
-        """Load channels from disk."""
-        path = get_data_dir() / "channels.json"
-
-        if not path.exists():
-            return
-
+        """Load channels from the channel store."""
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._store.load_channels()
+        except Exception as e:
+            logger.error(f"Error loading channels: {e}")
+            data = []
 
+        with self._state_lock:
             for ch_data in data:
                 try:
                     platform = StreamPlatform(ch_data["platform"])
@@ -578,6 +958,9 @@ class StreamMonitor:
                         ch_data.get("platform"),
                     )
                     continue
+                except (KeyError, TypeError) as e:
+                    logger.error(f"Error loading channel record: {e}")
+                    continue
                 channel = Channel(
                     channel_id=ch_data["channel_id"],
                     platform=platform,
@@ -604,58 +987,174 @@ class StreamMonitor:
                         )
                     except ValueError:
                         pass
-                self._livestreams[channel.unique_key] = livestream
+                self._put_livestream(livestream)
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.error(f"Error loading channels: {e}")
+            self._load_live_snapshot()
 
         self._load_trash()
+        self._load_client_state()
 
     async def _save_channels(self) -> None:
-        """Save channels to disk."""
-        path = get_data_dir() / "channels.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
+        """Save pending channel changes to the store."""
+        self._save_channels_sync()
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._serialize_channels(), f, indent=2)
+    # --- Live state snapshot ---
 
-    # --- Trash bin management ---
+    def _serialize_live_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Serialize live streams for the warm-start snapshot (call under _state_lock)."""
+        records: dict[str, dict[str, Any]] = {}
+        for key, ls in self._livestreams.items():
+            if not ls.live:
+                continue
+            checked_at = self._last_checked.get(ls.channel.unique_key)
+            if checked_at is None:
+                continue
+            records[key] = {
+                "channel": ls.channel.unique_key,
+                "title": ls.title,
+                "game": ls.game,
+                "game_slug": ls.game_slug,
+                "viewers": ls.viewers,
+                "start_time": ls.start_time.isoformat() if ls.start_time else None,
+                "video_id": ls.video_id,
+                "room_status": ls.room_status,
+                "checked_at": checked_at.isoformat(),
+            }
+        return records
+
+    def _save_live_snapshot(self) -> None:
+        """Persist the currently live streams so the next startup can show them at once."""
+        with self._state_lock:
+            records = self._serialize_live_snapshot()
+        try:
+            self._store.write_live_snapshot(records)
+        except Exception as e:
+            logger.error(f"Error saving live state snapshot: {e}")
 
-    def _load_trash(self) -> None:
-        """Load trash from disk."""
-        path = get_data_dir() / "trash.json"
-        if not path.exists():
+    def _load_live_snapshot(self) -> None:
+        """Restore live streams from the last snapshot, marked stale (call under _state_lock).
+
+        Restored streams show up immediately and are confirmed or cleared by
+        the first refresh that polls their channel.
+        """
+        try:
+            records = self._store.load_live_snapshot()
+        except Exception as e:
+            logger.error(f"Error loading live state snapshot: {e}")
+            return
+
+        cutoff = datetime.now(timezone.utc) - LIVE_SNAPSHOT_MAX_AGE
+        restored = 0
+        for record in records:
+            try:
+                channel = self._channels.get(record["channel"])
+                checked_at = datetime.fromisoformat(record["checked_at"])
+                start_time = (
+                    datetime.fromisoformat(record["start_time"])
+                    if record.get("start_time")
+                    else None
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping live state record: {e}")
+                continue
+            if channel is None or checked_at < cutoff:
+                continue
+
+            livestream = Livestream(
+                channel=channel,
+                live=True,
+                title=record.get("title"),
+                game=record.get("game"),
+                game_slug=record.get("game_slug"),
+                viewers=record.get("viewers") or 0,
+                start_time=start_time,
+                last_live_time=checked_at,
+                video_id=record.get("video_id"),
+                room_status=record.get("room_status"),
+                stale=True,
+            )
+            self._put_livestream(livestream)
+            # Keep the original timestamp if we shut down before confirming it
+            self._last_checked.setdefault(channel.unique_key, checked_at)
+            restored += 1
+
+        if restored:
+            logger.info(f"Restored {restored} live streams from snapshot")
+
+    # --- API client state ---
+
+    def _save_client_state(self) -> None:
+        """Persist learned state if it changed.
+
+        Covers each API client's state (e.g. tuned batch sizes) and the
+        scheduler's go-live history, so neither is relearned after a restart.
+        """
+        changed: dict[str, dict[str, Any]] = {}
+        with self._state_lock:
+            scheduler_state = self._scheduler.to_dict()
+        if scheduler_state != self._saved_client_state.get(SCHEDULER_STATE_KEY):
+            changed[SCHEDULER_STATE_KEY] = scheduler_state
+        for platform, client in self._clients.items():
+            if not isinstance(client, BaseApiClient):
+                continue
+            state = client.get_persistent_state()
+            if state is not None and state != self._saved_client_state.get(platform.value):
+                changed[platform.value] = state
+        if not changed:
             return
         try:
-            with open(path, encoding="utf-8") as f:
-                self._trash = json.load(f)
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.error(f"Error loading trash: {e}")
-            self._trash = []
+            self._store.write_client_state(changed)
+            self._saved_client_state.update(changed)
+        except Exception as e:
+            logger.error(f"Error saving API client state: {e}")
 
-    def _save_trash(self) -> None:
-        """Save trash to disk."""
-        path = get_data_dir() / "trash.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def _load_client_state(self) -> None:
+        """Hand the scheduler and each API client the state saved in an earlier run."""
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self._trash, f, indent=2)
+            states = self._store.load_client_state()
         except Exception as e:
-            logger.error(f"Error saving trash: {e}")
+            logger.error(f"Error loading API client state: {e}")
+            return
+        scheduler_state = states.get(SCHEDULER_STATE_KEY)
+        if scheduler_state is not None:
+            with self._state_lock:
+                self._scheduler.load_dict(scheduler_state)
+            self._saved_client_state[SCHEDULER_STATE_KEY] = scheduler_state
+        for platform, client in self._clients.items():
+            state = states.get(platform.value)
+            if state is None or not isinstance(client, BaseApiClient):
+                continue
+            try:
+                client.restore_persistent_state(state)
+            except Exception as e:
+                logger.warning(f"Ignoring saved {client.name} state: {e}")
+            self._saved_client_state[platform.value] = state
+
+    # --- Trash bin management ---
+
+    def _load_trash(self) -> None:
+        """Load trash from the channel store."""
+        try:
+            entries = self._store.load_trash()
+        except Exception as e:
+            logger.error(f"Error loading trash: {e}")
+            entries = []
+        self._trash_ids = [row_id for row_id, _ in entries]
+        self._trash = [record for _, record in entries]
 
     def trash_channels(self, keys: list[str]) -> None:
         """Move channels to trash by their unique keys."""
         with self._state_lock:
             for key in keys:
                 ch = self._channels.pop(key, None)
+                if ch is not None:
+                    self._note_channel_removed(ch)
+                self._scheduler.forget(key)
                 # Remove all stream_keys for this channel
-                keys_to_remove = [
-                    k for k in self._livestreams if k == key or k.startswith(key + ":")
-                ]
-                for k in keys_to_remove:
-                    self._livestreams.pop(k, None)
+                self._pop_channel_livestreams(key)
                 if ch:
-                    self._trash.append(
+                    self._mark_channel_deleted(key)
+                    self._pending_trash.append(
                         {
                             "channel_id": ch.channel_id,
                             "platform": ch.platform.value,
@@ -665,15 +1164,13 @@ class StreamMonitor:
                             "trashed_at": datetime.now(timezone.utc).isoformat(),
                         }
                     )
+        # Deleting the channels and adding their trash entries is one
+        # transaction; if it fails, both are retried by the next save
         self._save_channels_sync()
-        self._save_trash()
 
     def restore_from_trash(self, indices: list[int]) -> None:
         """Restore channels from trash by their indices (sorted descending for safe removal)."""
-        restored: list[dict[str, Any]] = []
-        for idx in sorted(indices, reverse=True):
-            if 0 <= idx < len(self._trash):
-                restored.append(self._trash.pop(idx))
+        restored = self._pop_trash(indices)
 
         with self._state_lock:
             for entry in restored:
@@ -686,22 +1183,38 @@ class StreamMonitor:
                 )
                 if channel.unique_key not in self._channels:
                     self._channels[channel.unique_key] = channel
-                    self._livestreams[channel.unique_key] = Livestream(channel=channel)
+                    self._put_livestream(Livestream(channel=channel))
+                    self._note_channel_added(channel)
+                    self._mark_channel_dirty(channel.unique_key)
 
         self._save_channels_sync()
-        self._save_trash()
 
     def permanently_delete_trash(self, indices: list[int]) -> None:
         """Permanently delete entries from trash by indices."""
-        for idx in sorted(indices, reverse=True):
+        self._pop_trash(indices)
+
+    def _pop_trash(self, indices: list[int]) -> list[dict[str, Any]]:
+        """Remove trash entries by index, deleting them from the store."""
+        removed: list[dict[str, Any]] = []
+        removed_ids: list[int] = []
+        for idx in sorted(set(indices), reverse=True):
             if 0 <= idx < len(self._trash):
-                self._trash.pop(idx)
-        self._save_trash()
+                removed.append(self._trash.pop(idx))
+                removed_ids.append(self._trash_ids.pop(idx))
+        try:
+            self._store.delete_trash(removed_ids)
+        except Exception as e:
+            logger.error(f"Error saving trash: {e}")
+        return removed
 
     def empty_trash(self) -> None:
         """Clear all trash entries."""
         self._trash.clear()
-        self._save_trash()
+        self._trash_ids.clear()
+        try:
+            self._store.clear_trash()
+        except Exception as e:
+            logger.error(f"Error saving trash: {e}")
 
     def get_trash(self) -> list[dict[str, Any]]:
         """Return a copy of the trash list."""
@@ -0,0 +1,208 @@
+"""Adaptive per-channel poll scheduling for StreamMonitor."""
+
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .models import Channel, Livestream
+
+logger = logging.getLogger(__name__)
+
+# Offline channels are polled at a multiple of the base refresh interval that
+# grows with how long ago they were last seen live. Entries are
+# (max age since last live, interval multiplier), checked in order.
+OFFLINE_BACKOFF_STEPS: tuple[tuple[timedelta, int], ...] = (
+    (timedelta(days=1), 2),
+    (timedelta(days=7), 5),
+    (timedelta(days=30), 10),
+)
+# Multiplier for channels last live more than 30 days ago
+DORMANT_MULTIPLIER = 15
+# Multiplier for channels we have never seen live (no last_live_time)
+UNKNOWN_MULTIPLIER = 5
+
+# Window around a channel's usual go-live time-of-day during which it is
+# polled at the base interval: starts this many minutes before...
+GO_LIVE_LEAD_MINUTES = 15
+# ...and ends this many minutes after.
+GO_LIVE_TRAIL_MINUTES = 30
+# Number of recent go-live times remembered per channel
+GO_LIVE_HISTORY_SIZE = 8
+
+# Random spread applied to offline deadlines so channels that were checked in
+# the same cycle don't all come due again on the same tick.
+DEADLINE_JITTER = 0.1
+
+
+class PollScheduler:
+    """Tracks a next-check deadline for every monitored channel.
+
+    Live channels, favorites, and channels approaching their usual go-live
+    time are polled every base interval. Offline channels back off in steps
+    based on how long ago they were last live, up to ``max_interval``.
+
+    Not thread-safe on its own; StreamMonitor calls it under ``_state_lock``.
+    """
+
+    def __init__(self, base_interval: float, max_interval: float) -> None:
+        self.base_interval = base_interval
+        self.max_interval = max(max_interval, base_interval)
+        # channel unique_key -> monotonic deadline
+        self._next_due: dict[str, float] = {}
+        # channel unique_key -> recent go-live times as minutes past midnight (UTC)
+        self._go_live_minutes: dict[str, list[int]] = {}
+        # Channels whose go-live is pushed to us (e.g. Twitch EventSub); while
+        # offline they are only polled at max_interval to reconcile
+        self._push_covered: set[str] = set()
+
+    def set_intervals(self, base_interval: float, max_interval: float) -> None:
+        """Update the base and maximum poll intervals."""
+        self.base_interval = base_interval
+        self.max_interval = max(max_interval, base_interval)
+
+    def due_channels(self, channels: list[Channel], now: float | None = None) -> list[Channel]:
+        """Return the channels whose deadline has passed (or that have none)."""
+        if now is None:
+            now = time.monotonic()
+        # Half a second of slack so a timer firing marginally early still
+        # picks up channels scheduled for exactly one base interval.
+        cutoff = now + 0.5
+        return [ch for ch in channels if self._next_due.get(ch.unique_key, 0.0) <= cutoff]
+
+    def seconds_until_next_due(self, now: float | None = None) -> float:
+        """Seconds until the earliest deadline, capped at the base interval."""
+        if not self._next_due:
+            return self.base_interval
+        if now is None:
+            now = time.monotonic()
+        earliest = min(self._next_due.values())
+        return max(0.0, min(earliest - now, self.base_interval))
+
+    def record_checked(
+        self,
+        channel: Channel,
+        livestreams: list[Livestream],
+        now: float | None = None,
+        wall_now: datetime | None = None,
+    ) -> float:
+        """Schedule the next check for a channel that was just polled.
+
+        Args:
+            channel: The channel that was polled.
+            livestreams: All current livestream entries for the channel.
+            now: Monotonic timestamp (defaults to time.monotonic()).
+            wall_now: Current UTC time (defaults to datetime.now(timezone.utc)).
+
+        Returns:
+            The interval in seconds until the channel is due again.
+        """
+        if now is None:
+            now = time.monotonic()
+        if wall_now is None:
+            wall_now = datetime.now(timezone.utc)
+
+        interval = self.interval_for(channel, livestreams, wall_now)
+        if interval > self.base_interval:
+            interval *= 1.0 + random.uniform(-DEADLINE_JITTER, DEADLINE_JITTER)
+            interval = max(self.base_interval, min(interval, self.max_interval))
+        self._next_due[channel.unique_key] = now + interval
+        return interval
+
+    def set_push_covered(self, channel_keys: set[str]) -> None:
+        """Set the channels whose go-live events are pushed rather than polled for.
+
+        Newly uncovered channels become due at once so polling resumes.
+        """
+        for key in self._push_covered - channel_keys:
+            self.mark_due(key)
+        self._push_covered = set(channel_keys)
+
+    def interval_for(
+        self, channel: Channel, livestreams: list[Livestream], wall_now: datetime
+    ) -> float:
+        """Compute the poll interval for a channel (without jitter)."""
+        if any(ls.live for ls in livestreams):
+            return self.base_interval
+        if channel.unique_key in self._push_covered:
+            return self.max_interval
+        if channel.favorite:
+            return self.base_interval
+        if self._near_usual_go_live(channel.unique_key, wall_now):
+            return self.base_interval
+
+        last_live: datetime | None = None
+        for ls in livestreams:
+            if ls.last_live_time and (last_live is None or ls.last_live_time > last_live):
+                last_live = ls.last_live_time
+
+        if last_live is None:
+            multiplier = UNKNOWN_MULTIPLIER
+        else:
+            if last_live.tzinfo is None:
+                last_live = last_live.replace(tzinfo=timezone.utc)
+            age = wall_now - last_live
+            multiplier = DORMANT_MULTIPLIER
+            for max_age, step_multiplier in OFFLINE_BACKOFF_STEPS:
+                if age <= max_age:
+                    multiplier = step_multiplier
+                    break
+
+        return min(self.base_interval * multiplier, self.max_interval)
+
+    def record_went_live(self, channel_key: str, start_time: datetime | None) -> None:
+        """Remember when a channel went live to learn its usual schedule."""
+        when = start_time or datetime.now(timezone.utc)
+        if when.tzinfo is not None:
+            when = when.astimezone(timezone.utc)
+        history = self._go_live_minutes.setdefault(channel_key, [])
+        history.append(when.hour * 60 + when.minute)
+        if len(history) > GO_LIVE_HISTORY_SIZE:
+            del history[: len(history) - GO_LIVE_HISTORY_SIZE]
+
+    def _near_usual_go_live(self, channel_key: str, wall_now: datetime) -> bool:
+        """Check if now falls within the go-live window of a past go-live time."""
+        history = self._go_live_minutes.get(channel_key)
+        if not history:
+            return False
+        if wall_now.tzinfo is not None:
+            wall_now = wall_now.astimezone(timezone.utc)
+        now_minutes = wall_now.hour * 60 + wall_now.minute
+        for minutes in history:
+            # Signed distance on a 24h circle: positive = after the usual time
+            delta = (now_minutes - minutes + 720) % 1440 - 720
+            if -GO_LIVE_LEAD_MINUTES <= delta <= GO_LIVE_TRAIL_MINUTES:
+                return True
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the learned go-live history (deadlines are not kept)."""
+        return {"go_live_minutes": {key: list(h) for key, h in self._go_live_minutes.items() if h}}
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Restore go-live history saved by to_dict(), skipping invalid entries."""
+        history = data.get("go_live_minutes")
+        if not isinstance(history, dict):
+            return
+        for key, minutes in history.items():
+            if not isinstance(minutes, list):
+                logger.warning(f"Ignoring invalid saved go-live history for {key}")
+                continue
+            valid = [m for m in minutes if isinstance(m, int) and 0 <= m < 1440]
+            if valid:
+                self._go_live_minutes[key] = valid[-GO_LIVE_HISTORY_SIZE:]
+
+    def mark_due(self, channel_key: str) -> None:
+        """Make a channel due on the next refresh."""
+        self._next_due.pop(channel_key, None)
+
+    def forget(self, channel_key: str) -> None:
+        """Drop all scheduling state for a removed channel."""
+        self._next_due.pop(channel_key, None)
+        self._go_live_minutes.pop(channel_key, None)
+        self._push_covered.discard(channel_key)
+
+    def reset(self) -> None:
+        """Make every channel due on the next refresh."""
+        self._next_due.clear()
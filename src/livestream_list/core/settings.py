@@ -121,6 +121,8 @@ class TwitchSettings:
     refresh_token: str = ""
     login_name: str = ""  # Twitch username of the logged-in account
     browser_auth_token: str = ""  # Browser auth-token cookie for streamlink Turbo
+    # Get go-live events pushed over EventSub (needs login; limited channel count)
+    eventsub_stream_events: bool = False
 
 
 @dataclass
@@ -294,8 +296,11 @@ class ChatSettings:
 class PerformanceSettings:
     """Performance-related settings for API concurrency."""
 
-    youtube_concurrency: int = 10  # Concurrent HTTP requests for YouTube (I/O-bound)
-    kick_concurrency: int = 10  # Concurrent API calls for Kick
+    # Starting concurrency for YouTube/Kick; each then adapts to the server (up to 50)
+    youtube_concurrency: int = 10
+    kick_concurrency: int = 10
+    adaptive_polling: bool = True  # Poll long-offline channels less often than live ones
+    max_poll_interval: int = 900  # seconds; upper bound for offline channel poll interval
 
 
 @dataclass
@@ -835,6 +840,10 @@ class Settings:
                 kick_concurrency=cls._validate_int(
                     perf.get("kick_concurrency"), 10, min_val=1, max_val=50
                 ),
+                adaptive_polling=bool(perf.get("adaptive_polling", True)),
+                max_poll_interval=cls._validate_int(
+                    perf.get("max_poll_interval"), 900, min_val=60, max_val=86400
+                ),
             )
 
         # Logging
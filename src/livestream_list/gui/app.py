@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import gc
 import logging
 import sys
@@ -18,7 +19,8 @@ from PySide6.QtWidgets import QApplication
 
 from .. import __version__
 from ..chat.manager import ChatManager
-from ..core.models import Livestream
+from ..core.event_loop import BackgroundLoop, get_service_loop
+from ..core.models import Livestream, RefreshChanges
 from ..core.monitor import StreamMonitor
 from ..core.settings import Settings
 from ..core.streamlink import StreamlinkLauncher
@@ -163,6 +165,94 @@ class AsyncWorker(QThread):
             gc.enable()
 
 
+# Number of AsyncTasks in flight. GC stays disabled while any task runs, for
+# the same reason AsyncWorker disables it (see AsyncWorker.run).
+_gc_pause_count = 0
+_gc_pause_lock = threading.Lock()
+
+
+def _pause_gc() -> None:
+    global _gc_pause_count
+    with _gc_pause_lock:
+        _gc_pause_count += 1
+        gc.disable()
+
+
+def _resume_gc() -> None:
+    global _gc_pause_count
+    with _gc_pause_lock:
+        _gc_pause_count -= 1
+        if _gc_pause_count <= 0:
+            _gc_pause_count = 0
+            gc.enable()
+
+
+class AsyncTask(QObject):
+    """Runs a coroutine on the application's long-lived background loop.
+
+    Drop-in for AsyncWorker (same signals, start/stop/isRunning/wait) that
+    reuses one loop and its warm HTTP sessions instead of creating a thread,
+    an event loop and fresh connections per call. Signals are emitted from
+    the loop thread and delivered to the main thread queued.
+    """
+
+    finished = Signal(object)
+    error = Signal(str)
+    progress = Signal(str, str)  # message, detail
+
+    def __init__(
+        self,
+        coro_func: Callable[[], Any],
+        loop: BackgroundLoop,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.coro_func = coro_func
+        self._loop = loop
+        self._future: concurrent.futures.Future[Any] | None = None
+
+    def start(self) -> None:
+        """Submit the coroutine to the background loop."""
+        _pause_gc()
+        try:
+            self._future = self._loop.submit(self.coro_func())
+        except Exception as e:
+            _resume_gc()
+            logger.error(f"Async task error: {e}")
+            self.error.emit(str(e))
+            return
+        self._future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: concurrent.futures.Future[Any]) -> None:
+        """Emit the result (runs on the loop thread)."""
+        _resume_gc()
+        if future.cancelled():
+            self.error.emit("Cancelled")
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Async task error: {exc}", exc_info=exc)
+            self.error.emit(str(exc))
+        else:
+            self.finished.emit(future.result())
+
+    def isRunning(self) -> bool:  # noqa: N802 - mirrors QThread.isRunning
+        """True until the coroutine has finished."""
+        return self._future is not None and not self._future.done()
+
+    def stop(self) -> None:
+        """Cancel the coroutine."""
+        if self._future is not None:
+            self._future.cancel()
+
+    def wait(self, msecs: int) -> bool:
+        """Block until the coroutine finishes or msecs elapse."""
+        if self._future is None:
+            return True
+        done, _ = concurrent.futures.wait([self._future], timeout=msecs / 1000)
+        return bool(done)
+
+
 class NotificationBridge(QObject):
     """Bridge for handling notifications from background threads.
 
@@ -218,6 +308,7 @@ class Application(QApplication):
     # Signals for cross-thread communication
     stream_online = Signal(object)  # Livestream
     refresh_complete = Signal()
+    refresh_changes = Signal(object)  # RefreshChanges
     refresh_error = Signal(str)  # Error message for failed refreshes
     status_changed = Signal(str)
     open_stream_requested = Signal(object)  # Livestream - for notification Watch button
@@ -251,8 +342,12 @@ class Application(QApplication):
         self._refresh_timer: QTimer | None = None
         self._process_check_timer: QTimer | None = None
 
+        # Long-lived event loop owning the monitor's API clients, the shared
+        # HTTP pool and their sessions
+        self.background_loop = get_service_loop()
+
         # Track active workers to prevent garbage collection
-        self._active_workers: list[AsyncWorker] = []
+        self._active_workers: list[AsyncWorker | AsyncTask] = []
 
         # Prevent concurrent refreshes (causes aiohttp timeout errors)
         self._refresh_in_progress = False
@@ -302,6 +397,7 @@ class Application(QApplication):
         self.open_stream_requested.connect(self._on_notification_open_stream_ui)
 
         # Initialize core services
+        self.background_loop.start()
         self.monitor = StreamMonitor(self.settings)
         # Extract browser auth-token if logged in but missing it
         if self.settings.twitch.access_token and not self.settings.twitch.browser_auth_token:
@@ -338,6 +434,8 @@ class Application(QApplication):
 
         # Set up monitor callbacks
         self.monitor.on_stream_online(self._on_stream_online)
+        self.monitor.on_refresh_changes(lambda changes: self.refresh_changes.emit(changes))
+        self.refresh_changes.connect(self._on_refresh_changes)
 
         # Set up process check timer (every 2 seconds)
         self._process_check_timer = QTimer(self)  # Parent ensures cleanup
@@ -399,13 +497,14 @@ class Application(QApplication):
         def on_loaded(channel_count: object) -> None:
             if on_channels_loaded and isinstance(channel_count, int):
                 on_channels_loaded(channel_count)
+            self._sync_push_updates()
 
             if isinstance(channel_count, int) and channel_count > 0:
                 self._start_refresh(on_complete=on_init_complete)
             elif on_init_complete:
                 on_init_complete()
 
-        worker = AsyncWorker(init, monitor, parent=self)
+        worker = AsyncTask(init, self.background_loop, parent=self)
         worker.finished.connect(on_loaded)
         worker.finished.connect(lambda: self._cleanup_worker(worker))
         self._active_workers.append(worker)
@@ -415,8 +514,12 @@ class Application(QApplication):
         self,
         on_complete: Callable[[], None] | None = None,
         on_progress: Callable[[str, str], None] | None = None,
+        force: bool = False,
     ) -> None:
-        """Start a refresh operation."""
+        """Start a refresh operation.
+
+        Timed refreshes only poll channels that are due; force=True polls all.
+        """
         # Prevent concurrent refreshes (causes aiohttp timeout errors)
         if self._refresh_in_progress:
             logger.info("Refresh already in progress, ignoring request")
@@ -429,7 +532,7 @@ class Application(QApplication):
         assert monitor is not None
 
         async def refresh() -> dict[str, Any]:
-            await monitor.refresh()
+            await monitor.refresh(force=force)
             # Collect any error messages from livestreams
             errors: list[str] = []
             for ls in monitor.livestreams:
@@ -440,9 +543,6 @@ class Application(QApplication):
         def on_finished(result: object) -> None:
             self._refresh_in_progress = False
             self.refresh_complete.emit()
-            # Push updated livestream data to chat window (viewer count, uptime, etc.)
-            if self._chat_window and monitor:
-                self._chat_window.update_livestreams(monitor.livestreams)
             # Emit error signal if there were any errors
             if result and isinstance(result, dict):
                 errors = result.get("errors", [])
@@ -460,18 +560,19 @@ class Application(QApplication):
             if on_complete:
                 on_complete()
 
-        worker = AsyncWorker(refresh, monitor, parent=self)
+        worker = AsyncTask(refresh, self.background_loop, parent=self)
         worker.finished.connect(on_finished)
         worker.error.connect(on_error)
         worker.finished.connect(lambda: self._cleanup_worker(worker))
+        worker.error.connect(lambda: self._cleanup_worker(worker))
         if on_progress:
             worker.progress.connect(on_progress)
         self._active_workers.append(worker)
         worker.start()
 
     def refresh(self, on_complete: Callable[[], None] | None = None) -> None:
-        """Trigger a manual refresh."""
-        self._start_refresh(on_complete=on_complete)
+        """Trigger a manual refresh of every channel."""
+        self._start_refresh(on_complete=on_complete, force=True)
 
     def start_refresh_timer(self) -> None:
         """Start the automatic refresh timer."""
@@ -514,6 +615,11 @@ class Application(QApplication):
         # Emit signal for UI update
         self.stream_online.emit(livestream)
 
+    def _on_refresh_changes(self, changes: RefreshChanges) -> None:
+        """Push changed livestream data to the chat window (viewer count, title, etc.)."""
+        if self._chat_window and changes.streams:
+            self._chat_window.update_livestreams(list(changes.streams.values()))
+
     def _on_notification_watch_clicked(self, livestream: Livestream) -> None:
         """Handle Watch button click from notification.
 
@@ -611,7 +717,11 @@ class Application(QApplication):
                 else:
                     self.main_window.set_status("Playing Streams")
 
-    def _cleanup_worker(self, worker: AsyncWorker) -> None:
+    def run_async(self, coro_func: Callable[[], Any], parent: QObject | None = None) -> AsyncTask:
+        """Create (but don't start) a task running coro_func on the background loop."""
+        return AsyncTask(coro_func, self.background_loop, parent=parent or self)
+
+    def _cleanup_worker(self, worker: AsyncWorker | AsyncTask) -> None:
         """Remove worker from active list."""
         if worker in self._active_workers:
             self._active_workers.remove(worker)
@@ -724,6 +834,19 @@ class Application(QApplication):
     def save_settings(self) -> None:
         """Save current settings."""
         self.settings.save()
+        self._sync_push_updates()
+
+    def _sync_push_updates(self) -> None:
+        """Start/stop the monitor's EventSub push updates to match the settings."""
+        if self.monitor is None or not self.background_loop.is_running:
+            return
+        future = self.background_loop.submit(self.monitor.sync_push_updates())
+
+        def log_error(done: Any) -> None:
+            if done.exception() is not None:
+                logger.error(f"Push update error: {done.exception()}")
+
+        future.add_done_callback(log_error)
 
     def save_channels(self) -> None:
         """Save channels to disk."""
@@ -734,7 +857,7 @@ class Application(QApplication):
         async def do_save() -> None:
             await monitor.save_channels()
 
-        worker = AsyncWorker(do_save, monitor, parent=self)
+        worker = AsyncTask(do_save, self.background_loop, parent=self)
         worker.finished.connect(lambda: self._cleanup_worker(worker))
         self._active_workers.append(worker)
         worker.start()
@@ -809,9 +932,26 @@ class Application(QApplication):
                 worker.wait(3000)
         self._active_workers.clear()
 
-        # Flush any pending channel saves (debounced saves)
-        if self.monitor:
-            self.monitor.flush_pending_save()
+        # Close HTTP sessions on the loop that owns them, then stop it
+        from ..api.http_pool import get_http_pool
+        from ..api.twitch_identity import get_identity_resolver
+        from ..api.twitch_users import get_user_store
+
+        monitor = self.monitor
+
+        async def close_sessions() -> None:
+            if monitor:
+                await monitor.close_all_sessions()
+            # Identity clients share the pool's connector; close them first
+            await get_identity_resolver().close()
+            await get_http_pool().close()
+
+        self.background_loop.stop(shutdown=close_sessions)
+        get_user_store().close()
+
+        # Flush pending channel saves (debounced saves) and close the store
+        if monitor:
+            monitor.close()
 
         # Save settings
         self.save_settings()
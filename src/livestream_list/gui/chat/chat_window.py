@@ -1494,25 +1494,14 @@ class ChatWindow(QMainWindow):
             def run(self) -> None:
                 import asyncio
 
-                import aiohttp
+                from ...api.twitch_identity import get_identity_resolver
 
                 async def resolve() -> str:
-                    headers = {
-                        "Authorization": f"Bearer {self._token}",
-                        "Client-Id": self._client_id,
-                    }
-                    async with aiohttp.ClientSession(headers=headers) as session:
-                        async with session.get(
-                            "https://api.twitch.tv/helix/users",
-                            params={"login": self._login.lower()},
-                            timeout=aiohttp.ClientTimeout(total=10),
-                        ) as resp:
-                            if resp.status == 200:
-                                data = await resp.json()
-                                users = data.get("data", [])
-                                if users:
-                                    return users[0].get("id", "")  # type: ignore[no-any-return]
-                    return ""
+                    users = await get_identity_resolver().get_users_by_login(
+                        [self._login], access_token=self._token, client_id=self._client_id
+                    )
+                    user = users.get(self._login.lower())
+                    return user.id if user else ""
 
                 loop = asyncio.new_event_loop()
                 try:
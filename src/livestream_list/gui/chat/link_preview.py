@@ -27,34 +27,39 @@ class LinkPreviewWorker(QThread):
 
     def run(self) -> None:
         """Fetch the URL and extract the page title."""
-        import urllib.error
-        import urllib.request
+        import asyncio
+        import html as html_mod
+
+        from ...api.http_pool import get_http_pool
 
         try:
-            req = urllib.request.Request(
-                self._url,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; LinkPreview/1.0)"},
+            resp = asyncio.run(
+                get_http_pool().get(
+                    self._url,
+                    headers={"User-Agent": "Mozilla/5.0 (compatible; LinkPreview/1.0)"},
+                    timeout=FETCH_TIMEOUT,
+                    max_bytes=FETCH_BYTES,
+                )
             )
-            with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT) as resp:
-                data = resp.read(FETCH_BYTES)
-                # Try UTF-8, fall back to latin-1
-                try:
-                    html = data.decode("utf-8", errors="replace")
-                except Exception:
-                    html = data.decode("latin-1", errors="replace")
-                match = _TITLE_RE.search(html)
-                if match:
-                    title = match.group(1).strip()
-                    # Clean up HTML entities
-                    import html as html_mod
-
-                    title = html_mod.unescape(title)
-                    # Truncate long titles
-                    if len(title) > 100:
-                        title = title[:97] + "..."
-                    self.preview_ready.emit(self._url, title)
-                else:
-                    self.preview_ready.emit(self._url, "")
+            if resp.status >= 400:
+                self.preview_ready.emit(self._url, "")
+                return
+            # Try UTF-8, fall back to latin-1
+            try:
+                html = resp.body.decode("utf-8", errors="replace")
+            except Exception:
+                html = resp.body.decode("latin-1", errors="replace")
+            match = _TITLE_RE.search(html)
+            if match:
+                title = match.group(1).strip()
+                # Clean up HTML entities
+                title = html_mod.unescape(title)
+                # Truncate long titles
+                if len(title) > 100:
+                    title = title[:97] + "..."
+                self.preview_ready.emit(self._url, title)
+            else:
+                self.preview_ready.emit(self._url, "")
         except Exception:
             self.preview_ready.emit(self._url, "")
 
@@ -3,9 +3,9 @@
 import json
 import logging
 import re
+import time
 import webbrowser
 
-import aiohttp
 from PySide6.QtCore import QPoint, QSize, Qt, Signal
 from PySide6.QtGui import QContextMenuEvent, QFont, QKeyEvent, QKeySequence, QPixmap
 from PySide6.QtWidgets import (
@@ -19,6 +19,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ...api.http_pool import get_http_pool
+from ...api.twitch_users import TwitchUser, get_user_store
 from ...chat.emotes.cache import EmoteCache
 from ...chat.models import ChatUser
 from ...core.models import StreamPlatform
@@ -69,7 +71,7 @@ class UserCardFetchWorker:
     ) -> dict[str, object] | None:
         """Fetch Twitch user card info via GraphQL.
 
-        Uses its own aiohttp session and static GQL credentials so it can
+        Uses the shared HTTP pool and static GQL credentials so it can
         run from any thread without depending on the main API client.
         If channel_login is provided, also fetches follow age for that channel.
         """
@@ -78,91 +80,105 @@ class UserCardFetchWorker:
             "Content-Type": "application/json",
         }
         try:
-            async with aiohttp.ClientSession() as session:
-                # Step 1: Fetch user info (+ channel numeric ID if needed)
-                if channel_login and channel_login.lower() != login.lower():
-                    query = """
-                    query GetUserCard($login: String!, $channelLogin: String!) {
-                        user(login: $login) {
-                            id
-                            login
-                            displayName
-                            createdAt
-                            description
-                            profileImageURL(width: 70)
-                            followers { totalCount }
-                        }
-                        channel: user(login: $channelLogin) { id }
+            # Step 1: Fetch user info (+ channel numeric ID if needed)
+            if channel_login and channel_login.lower() != login.lower():
+                query = """
+                query GetUserCard($login: String!, $channelLogin: String!) {
+                    user(login: $login) {
+                        id
+                        login
+                        displayName
+                        createdAt
+                        description
+                        profileImageURL(width: 70)
+                        followers { totalCount }
                     }
-                    """
-                    variables = {"login": login, "channelLogin": channel_login}
-                else:
-                    query = """
-                    query GetUserCard($login: String!) {
-                        user(login: $login) {
-                            id
-                            login
-                            displayName
-                            createdAt
-                            description
-                            profileImageURL(width: 70)
-                            followers { totalCount }
-                        }
+                    channel: user(login: $channelLogin) { id }
+                }
+                """
+                variables = {"login": login, "channelLogin": channel_login}
+            else:
+                query = """
+                query GetUserCard($login: String!) {
+                    user(login: $login) {
+                        id
+                        login
+                        displayName
+                        createdAt
+                        description
+                        profileImageURL(width: 70)
+                        followers { totalCount }
                     }
-                    """
-                    variables = {"login": login}
-
-                async with session.post(
-                    UserCardFetchWorker.GQL_URL,
-                    headers=headers,
-                    json={"query": query, "variables": variables},
-                ) as resp:
-                    if resp.status != 200:
-                        return None
-                    data = await resp.json()
-
-                user_data = data.get("data", {}).get("user")
-                if not user_data:
-                    return None
-
-                result = {
-                    "created_at": user_data.get("createdAt", ""),
-                    "profile_image_url": user_data.get("profileImageURL", ""),
-                    "display_name": user_data.get("displayName", ""),
-                    "description": user_data.get("description") or "",
-                    "follower_count": (user_data.get("followers", {}).get("totalCount", 0)),
-                    "followed_at": "",
                 }
+                """
+                variables = {"login": login}
+
+            pool = get_http_pool()
+            resp = await pool.post(
+                UserCardFetchWorker.GQL_URL,
+                headers=headers,
+                json={"query": query, "variables": variables},
+                coalesce=True,
+            )
+            if resp.status != 200:
+                return None
+            data = resp.json()
+
+            user_data = data.get("data", {}).get("user")
+            if not user_data:
+                return None
+            if user_data.get("id") and user_data.get("login"):
+                get_user_store().put(
+                    [
+                        TwitchUser(
+                            id=str(user_data["id"]),
+                            login=user_data["login"],
+                            display_name=user_data.get("displayName") or user_data["login"],
+                            profile_image_url=user_data.get("profileImageURL") or "",
+                            verified_at=time.time(),
+                        )
+                    ]
+                )
 
-                # Step 2: Fetch follow relationship if we got the channel ID
-                channel_data = data.get("data", {}).get("channel")
-                if channel_data and channel_data.get("id"):
-                    channel_id = channel_data["id"]
-                    follow_query = """
-                    query GetFollowAge($login: String!, $targetId: ID!) {
-                        user(login: $login) {
-                            follow(targetID: $targetId) { followedAt }
-                        }
+            result = {
+                "created_at": user_data.get("createdAt", ""),
+                "profile_image_url": user_data.get("profileImageURL", ""),
+                "display_name": user_data.get("displayName", ""),
+                "description": user_data.get("description") or "",
+                "follower_count": (user_data.get("followers", {}).get("totalCount", 0)),
+                "followed_at": "",
+            }
+
+            # Step 2: Fetch follow relationship if we got the channel ID
+            channel_data = data.get("data", {}).get("channel")
+            if channel_data and channel_data.get("id"):
+                channel_id = channel_data["id"]
+                follow_query = """
+                query GetFollowAge($login: String!, $targetId: ID!) {
+                    user(login: $login) {
+                        follow(targetID: $targetId) { followedAt }
                     }
-                    """
-                    async with session.post(
-                        UserCardFetchWorker.GQL_URL,
-                        headers=headers,
-                        json={
-                            "query": follow_query,
-                            "variables": {
-                                "login": login,
-                                "targetId": channel_id,
-                            },
+                }
+                """
+                resp2 = await pool.post(
+                    UserCardFetchWorker.GQL_URL,
+                    headers=headers,
+                    json={
+                        "query": follow_query,
+                        "variables": {
+                            "login": login,
+                            "targetId": channel_id,
                         },
-                    ) as resp2:
-                        if resp2.status == 200:
-                            fdata = await resp2.json()
-                            follow = fdata.get("data", {}).get("user", {}).get("follow")
-                            if follow:
-                                result["followed_at"] = follow.get("followedAt", "")
-
-                return result
+                    },
+                    coalesce=True,
+                )
+                if resp2.status == 200:
+                    fdata = resp2.json()
+                    follow = fdata.get("data", {}).get("user", {}).get("follow")
+                    if follow:
+                        result["followed_at"] = follow.get("followedAt", "")
+
+            return result
         except Exception as e:
             logger.debug(f"Failed to fetch user card info: {e}")
             return None
@@ -173,10 +189,9 @@ class UserCardFetchWorker:
         if not url:
             return b""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        return await resp.read()
+            resp = await get_http_pool().get(url, timeout=5)
+            if resp.status == 200:
+                return resp.body
         except Exception as e:
             logger.debug(f"Failed to fetch avatar: {e}")
         return b""
@@ -185,17 +200,15 @@ class UserCardFetchWorker:
     async def fetch_pronouns(login: str) -> str:
         """Fetch user pronouns from pronouns.alejo.io API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://pronouns.alejo.io/api/users/{login}",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    if resp.status != 200:
-                        return ""
-                    data = await resp.json()
-                    if data and isinstance(data, list) and len(data) > 0:
-                        pronoun_id = data[0].get("pronoun_id", "")
-                        return str(PRONOUN_MAP.get(pronoun_id, pronoun_id))
+            resp = await get_http_pool().get(
+                f"https://pronouns.alejo.io/api/users/{login}", timeout=5
+            )
+            if resp.status != 200:
+                return ""
+            data = resp.json()
+            if data and isinstance(data, list) and len(data) > 0:
+                pronoun_id = data[0].get("pronoun_id", "")
+                return str(PRONOUN_MAP.get(pronoun_id, pronoun_id))
         except Exception as e:
             logger.debug(f"Failed to fetch pronouns for {login}: {e}")
         return ""
@@ -214,14 +227,12 @@ class UserCardFetchWorker:
             "Accept": "application/json",
         }
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    f"https://kick.com/api/v2/channels/{slug}",
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        return None
-                    data = await resp.json()
+            resp = await get_http_pool().get(
+                f"https://kick.com/api/v2/channels/{slug}", headers=headers, timeout=10
+            )
+            if resp.status != 200:
+                return None
+            data = resp.json()
 
             user_data = data.get("user", {})
             return {
@@ -258,11 +269,10 @@ class UserCardFetchWorker:
             url = f"https://www.youtube.com/@{channel_id}/about"
 
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status != 200:
-                        return None
-                    html = await resp.text()
+            resp = await get_http_pool().get(url, headers=headers, timeout=15)
+            if resp.status != 200:
+                return None
+            html = resp.text()
 
             match = re.search(r"var ytInitialData\s*=\s*({.+?});</script>", html, re.DOTALL)
             if not match:
@@ -255,9 +255,7 @@ class AddChannelDialog(QDialog):
             self.setEnabled(True)
             QMessageBox.warning(self, "Error", f"Failed to add channel: {error}")
 
-        from ..app import AsyncWorker
-
-        worker = AsyncWorker(add_channel, self.app.monitor, parent=self)
+        worker = self.app.run_async(add_channel, parent=self)
         worker.finished.connect(on_complete)
         worker.error.connect(on_error)
         worker.start()
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from PySide6.QtCore import Qt, QUrl, Signal
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
+    QCheckBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -252,6 +253,11 @@ class AccountsTab(QScrollArea):
         twitch_buttons.addStretch()
         twitch_layout.addLayout(twitch_buttons)
 
+        self.twitch_eventsub_cb = QCheckBox("Instant go-live updates (EventSub, favorites first)")
+        self.twitch_eventsub_cb.setChecked(self.app.settings.twitch.eventsub_stream_events)
+        self.twitch_eventsub_cb.stateChanged.connect(self._on_twitch_eventsub_changed)
+        twitch_layout.addWidget(self.twitch_eventsub_cb)
+
         layout.addWidget(twitch_group)
 
         # YouTube group
@@ -385,6 +391,7 @@ class AccountsTab(QScrollArea):
         self.twitch_login_btn.setVisible(not is_logged_in)
         self.twitch_import_btn.setVisible(is_logged_in)
         self.twitch_logout_btn.setVisible(is_logged_in)
+        self.twitch_eventsub_cb.setVisible(is_logged_in)
 
         # Update Twitch Turbo checkbox availability via PlaybackTab
         self.dialog.playback_tab.update_twitch_turbo_state(is_logged_in)
@@ -484,6 +491,10 @@ class AccountsTab(QScrollArea):
 
             self.app.refresh(on_complete=on_refresh_complete)
 
+    def _on_twitch_eventsub_changed(self, state: int) -> None:
+        self.app.settings.twitch.eventsub_stream_events = state == Qt.CheckState.Checked.value
+        self.app.save_settings()
+
     def _on_twitch_logout(self) -> None:
         """Handle Twitch logout."""
         self.app.settings.twitch.access_token = ""
@@ -46,7 +46,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..core.chat import ChatLauncher
-from ..core.models import Channel, Livestream, SortMode, StreamPlatform
+from ..core.models import Channel, Livestream, RefreshChanges, SortMode, StreamPlatform
 from ..core.settings import ThemeMode
 from .dialogs import (
     AboutDialog,
@@ -64,6 +64,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Livestream fields that feed each sort mode's key (beyond live state), used to
+# decide whether a refresh change set can be applied without re-sorting
+_SORT_FIELDS: dict[SortMode, set[str]] = {
+    SortMode.NAME: set(),
+    SortMode.VIEWERS: {"viewers"},
+    SortMode.PLAYING: set(),
+    SortMode.LAST_SEEN: {"start_time", "last_live_time"},
+    SortMode.TIME_LIVE: {"start_time"},
+}
+
 
 class _WhisperBanner(QWidget):
     """Banner shown when a whisper is received — click to open chat.
@@ -599,7 +609,7 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         """Connect application signals."""
         self.app.stream_online.connect(self._on_stream_online)
-        self.app.refresh_complete.connect(self._on_refresh_complete)
+        self.app.refresh_changes.connect(self._on_refresh_changes)
         self.app.refresh_error.connect(self._on_refresh_error)
 
     def _apply_settings(self) -> None:
@@ -900,9 +910,31 @@ class MainWindow(QMainWindow):
         self.set_status(f"{livestream.display_name} is live!")
         self.refresh_stream_list()
 
-    def _on_refresh_complete(self) -> None:
-        """Handle refresh completion."""
-        self.refresh_stream_list()
+    def _on_refresh_changes(self, changes: RefreshChanges) -> None:
+        """Apply a refresh change set, repainting only affected rows when possible.
+
+        Falls back to a full list update when live state or membership changed,
+        or when a changed field affects the current sort order.
+        """
+        if changes.is_empty:
+            return
+        sort_fields = _SORT_FIELDS.get(self.sort_combo.currentData(), set())
+        needs_full_update = (
+            changes.membership_changed
+            or bool(changes.changed_field_names() & sort_fields)
+            or self.stack.currentIndex() != 3
+            or self._refresh_in_progress
+            or self._refresh_pending
+        )
+        if needs_full_update:
+            self.refresh_stream_list()
+            return
+
+        assert self._stream_model is not None
+        updated = self._stream_model.update_stream_rows(changes.changed)
+        logger.debug(f"Delta update: {updated} of {len(changes.changed)} changed streams visible")
+        # Repaint visible rows so uptime/last-seen text stays current
+        self.stream_list.viewport().update()
 
     def _on_refresh_error(self, error_msg: str) -> None:
         """Handle refresh error - show message in status bar."""
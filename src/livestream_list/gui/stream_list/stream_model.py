@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QPersistentModelIndex, Qt
 
 from ...core.models import Livestream
@@ -23,6 +25,7 @@ class StreamListModel(QAbstractListModel):
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._streams: list[Livestream] = []
+        self._row_by_key: dict[str, int] = {}
         self._playing_keys: set[str] = set()
         self._selected_keys: set[str] = set()
         self._selection_mode: bool = False
@@ -66,6 +69,7 @@ class StreamListModel(QAbstractListModel):
         """
         self.beginResetModel()
         self._streams = list(streams)
+        self._row_by_key = {s.stream_key: i for i, s in enumerate(self._streams)}
         # Clean up selected keys that no longer exist
         current_keys = {s.stream_key for s in streams}
         self._selected_keys &= current_keys
@@ -97,6 +101,24 @@ class StreamListModel(QAbstractListModel):
             )
         return True
 
+    def update_stream_rows(self, keys: Iterable[str]) -> int:
+        """Emit dataChanged for the rows showing the given stream keys.
+
+        The model holds the monitor's Livestream objects, which are updated
+        in place, so only a repaint of the affected rows is needed.
+
+        Returns the number of rows that were updated.
+        """
+        updated = 0
+        for key in keys:
+            row = self._row_by_key.get(key)
+            if row is None:
+                continue
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [StreamRole])
+            updated += 1
+        return updated
+
     def update_playing_keys(self, keys: set[str]) -> None:
         """Update the set of currently playing stream keys.
 
@@ -89,6 +89,19 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=False,
         help="Allow multiple instances of the application to run simultaneously",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Run the monitor without a GUI, serving its state on a local socket",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Socket path for --headless (default: $XDG_RUNTIME_DIR/livestream-list-qt.sock)",
+    )
     return parser.parse_args(argv)
 
 
@@ -107,6 +120,11 @@ def main() -> int:
             log_level=settings.logging.log_level,
         )
 
+        if args.headless:
+            from livestream_list.core.daemon import run_daemon
+
+            return run_daemon(settings, socket_path=args.socket)
+
         from livestream_list.gui.app import run
 
         return run(allow_multiple=args.allow_multiple)
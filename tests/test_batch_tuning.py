@@ -0,0 +1,58 @@
+"""Tests for AdaptiveBatchSizer."""
+
+from livestream_list.api.batch_tuning import (
+    GROW_STEP,
+    PARTIAL,
+    THROTTLED,
+    TIMEOUT,
+    AdaptiveBatchSizer,
+)
+
+
+def _sizer(**kwargs) -> AdaptiveBatchSizer:
+    return AdaptiveBatchSizer("test", batch_size=20, parallelism=4, **kwargs)
+
+
+def _round(sizer: AdaptiveBatchSizer, items: int, latency: float = 0.1, error=None) -> bool:
+    for batch in sizer.split(list(range(items))):
+        sizer.record(len(batch), latency)
+    if error:
+        sizer.record(sizer.batch_size, error=error)
+    return sizer.end_round()
+
+
+def test_healthy_full_batches_grow_once_per_round():
+    sizer = _sizer()
+    assert _round(sizer, 200)
+    assert sizer.batch_size == 20 + GROW_STEP
+    # 10 batches but only 4 allowed in flight: parallelism was the bottleneck
+    assert sizer.parallelism == 5
+
+
+def test_partial_batches_do_not_grow():
+    sizer = _sizer()
+    assert not _round(sizer, 7)
+    assert sizer.batch_size == 20
+
+
+def test_errors_and_slowness_shrink():
+    sizer = _sizer(target_latency=1.0)
+    _round(sizer, 40, latency=3.0)
+    assert sizer.batch_size == 16
+
+    _round(sizer, 40, error=TIMEOUT)
+    assert sizer.batch_size == 8
+    _round(sizer, 40, error=PARTIAL)
+    assert sizer.batch_size == 5  # clamped to min
+
+    sizer = _sizer()
+    _round(sizer, 40, error=THROTTLED)
+    assert (sizer.batch_size, sizer.parallelism) == (15, 2)
+
+
+def test_round_trip_clamps_to_limits():
+    sizer = _sizer(max_batch_size=50)
+    sizer.load_dict({"batch_size": 500, "parallelism": 0})
+    assert sizer.to_dict() == {"batch_size": 50, "parallelism": 1}
+    sizer.load_dict({"batch_size": "junk"})
+    assert sizer.batch_size == 50
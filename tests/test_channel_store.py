@@ -0,0 +1,93 @@
+"""Tests for the SQLite channel store."""
+
+import json
+
+from livestream_list.core.channel_store import ChannelStore
+
+
+def _record(channel_id: str, favorite: bool = False) -> dict:
+    return {"channel_id": channel_id, "platform": "twitch", "favorite": favorite}
+
+
+def test_empty_store(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    assert store.load_channels() == []
+    assert store.load_trash() == []
+
+
+def test_upsert_preserves_order_and_updates(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    store.write_channels(upserts=[_record("a"), _record("b"), _record("c")])
+    store.write_channels(upserts=[_record("a", favorite=True)])
+    records = store.load_channels()
+    assert [r["channel_id"] for r in records] == ["a", "b", "c"]
+    assert records[0]["favorite"] is True
+
+
+def test_delete(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    store.write_channels(upserts=[_record("a"), _record("b")])
+    store.write_channels(deletes=["twitch:a"])
+    assert [r["channel_id"] for r in store.load_channels()] == ["b"]
+
+
+def test_persists_across_connections(tmp_path):
+    path = tmp_path / "channels.db"
+    store = ChannelStore(path)
+    store.write_channels(upserts=[_record("a")])
+    store.close()
+    assert [r["channel_id"] for r in ChannelStore(path).load_channels()] == ["a"]
+
+
+def test_trash_ids(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    ids = store.add_trash([_record("a"), _record("b"), _record("c")])
+    assert len(ids) == 3
+    store.delete_trash([ids[1]])
+    assert [r["channel_id"] for _, r in store.load_trash()] == ["a", "c"]
+    store.clear_trash()
+    assert store.load_trash() == []
+
+
+def test_delete_and_trash_in_one_write(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    store.write_channels(upserts=[_record("a"), _record("b")])
+    ids = store.write_channels(deletes=["twitch:a"], trash=[_record("a")])
+    assert [row_id for row_id, _ in store.load_trash()] == ids
+    assert [r["channel_id"] for r in store.load_channels()] == ["b"]
+
+
+def test_migrates_legacy_json(tmp_path):
+    (tmp_path / "channels.json").write_text(json.dumps([_record("a"), _record("b")]))
+    (tmp_path / "trash.json").write_text(json.dumps([_record("old")]))
+    store = ChannelStore(tmp_path / "channels.db")
+    assert [r["channel_id"] for r in store.load_channels()] == ["a", "b"]
+    assert [r["channel_id"] for _, r in store.load_trash()] == ["old"]
+    assert not (tmp_path / "channels.json").exists()
+    assert (tmp_path / "channels.json.migrated").exists()
+
+
+def test_migration_runs_once(tmp_path):
+    (tmp_path / "channels.json").write_text(json.dumps([_record("a")]))
+    path = tmp_path / "channels.db"
+    ChannelStore(path).load_channels()
+    # A stray channels.json appearing later is not re-imported
+    (tmp_path / "channels.json").write_text(json.dumps([_record("z")]))
+    assert [r["channel_id"] for r in ChannelStore(path).load_channels()] == ["a"]
+
+
+def test_live_snapshot_replaced_on_write(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    store.write_live_snapshot({"twitch:a": {"channel": "twitch:a", "viewers": 5}})
+    store.write_live_snapshot({"twitch:b": {"channel": "twitch:b", "viewers": 7}})
+    assert store.load_live_snapshot() == [{"channel": "twitch:b", "viewers": 7}]
+
+
+def test_client_state_upserts(tmp_path):
+    store = ChannelStore(tmp_path / "channels.db")
+    store.write_client_state({"twitch": {"a": 1}, "kick": {"b": 2}})
+    store.write_client_state({"twitch": {"a": 3}})
+    assert ChannelStore(tmp_path / "channels.db").load_client_state() == {
+        "twitch": {"a": 3},
+        "kick": {"b": 2},
+    }
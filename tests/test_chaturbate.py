@@ -0,0 +1,97 @@
+"""Tests for the Chaturbate bulk room-list path."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livestream_list.api import chaturbate
+from livestream_list.api.chaturbate import ChaturbateApiClient
+from livestream_list.core.models import Channel, StreamPlatform
+from livestream_list.core.settings import ChaturbateSettings
+
+
+@pytest.fixture
+async def cb_server():
+    state = {
+        # Online followed rooms, in room-list order
+        "online": [{"username": "alice"}, {"username": "bob", "current_show": "private"}],
+        "fail_offset": None,
+        "context": [],
+    }
+
+    async def room_list(request: web.Request) -> web.Response:
+        offset = int(request.query["offset"])
+        limit = int(request.query["limit"])
+        if offset == state["fail_offset"]:
+            return web.Response(status=502)
+        rooms = state["online"][offset : offset + limit]
+        return web.json_response({"rooms": rooms, "total_count": len(state["online"])})
+
+    async def context(request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        state["context"].append(name)
+        online = any(room["username"] == name for room in state["online"])
+        return web.json_response({"room_status": "public" if online else "offline"})
+
+    app = web.Application()
+    app.router.add_get("/api/ts/roomlist/room-list/", room_list)
+    app.router.add_get("/api/chatvideocontext/{name}/", context)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, state
+    await server.close()
+
+
+@pytest.fixture
+async def client(cb_server, monkeypatch):
+    server, _state = cb_server
+    monkeypatch.setattr(chaturbate, "BASE_URL", str(server.make_url("")).rstrip("/"))
+    client = ChaturbateApiClient(ChaturbateSettings())
+    client._get_cookie_string = lambda: "sessionid=test"
+    retry = client._retry_with_backoff
+    client._retry_with_backoff = lambda operation: retry(operation, max_retries=0)
+    yield client
+    await client.close()
+
+
+def _channels(*names: str) -> list[Channel]:
+    return [Channel(channel_id=name, platform=StreamPlatform.CHATURBATE) for name in names]
+
+
+async def test_room_status_from_list_or_cached_lookup(cb_server, client):
+    _server, state = cb_server
+    channels = _channels("alice", "bob", "carol")
+    for _ in range(2):
+        results = await client.get_livestreams(channels)
+    assert [r.live for r in results] == [True, True, False]
+    assert [r.room_status for r in results[:2]] == ["public", "private"]
+    # bob's show type came with the room list; alice's lookup was cached
+    assert state["context"] == ["alice"]
+
+
+async def test_failed_page_keeps_earlier_pages(cb_server, client, monkeypatch):
+    _server, state = cb_server
+    monkeypatch.setattr(chaturbate, "ROOM_LIST_PAGE_SIZE", 1)
+    channels = _channels("alice", "bob", "carol")
+    await client.get_livestreams(channels)
+
+    state["fail_offset"] = 1
+    state["context"].clear()
+    results = await client.get_livestreams(channels)
+    # Only bob, online before and on the failed page, is checked individually
+    assert state["context"] == ["bob"]
+    assert [r.live for r in results] == [True, True, False]
+
+
+async def test_partial_poll_keeps_unpolled_online_rooms(cb_server, client, monkeypatch):
+    _server, state = cb_server
+    monkeypatch.setattr(chaturbate, "ROOM_LIST_PAGE_SIZE", 1)
+    await client.get_livestreams(_channels("alice", "bob", "carol"))
+    # A scheduled round that only polls alice must not forget bob
+    await client.get_livestreams(_channels("alice"))
+
+    state["fail_offset"] = 1
+    state["context"].clear()
+    results = await client.get_livestreams(_channels("bob"))
+    assert state["context"] == ["bob"]
+    assert [r.live for r in results] == [True]
@@ -0,0 +1,70 @@
+"""Tests for the AIMD concurrency limiter."""
+
+import asyncio
+
+from livestream_list.api.concurrency import AdaptiveConcurrencyLimiter
+
+
+def _saturated(initial: int = 4) -> AdaptiveConcurrencyLimiter:
+    limiter = AdaptiveConcurrencyLimiter("test", initial=initial)
+    limiter.in_flight = limiter.max_limit  # Every slot busy however far it grows
+    return limiter
+
+
+def test_grows_only_while_saturated():
+    limiter = AdaptiveConcurrencyLimiter("test", initial=4)
+    for _ in range(20):
+        limiter.record_latency(0.1)
+    assert limiter.window == 4
+
+    limiter = _saturated()
+    for _ in range(20):
+        limiter.record_latency(0.1)
+    assert limiter.window == 7  # About +1 per window's worth of requests
+
+
+def test_overload_halves_once_per_window():
+    limiter = _saturated(initial=16)
+    for _ in range(20):
+        limiter.record_latency(0.1)
+    assert limiter.window == 17
+    for _ in range(5):
+        limiter.record_overload("HTTP 429")
+    assert limiter.window == 8
+
+
+def test_latency_inflation_backs_off():
+    limiter = _saturated(initial=20)
+    for _ in range(20):
+        limiter.record_latency(0.1)
+    for _ in range(40):
+        limiter.record_latency(1.0)
+    assert limiter.window < 20
+
+
+async def test_waiters_admitted_as_window_grows():
+    limiter = AdaptiveConcurrencyLimiter("test", initial=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.record_latency(0.1)  # Saturated with a waiter queued: 1 -> 2
+    await asyncio.sleep(0)
+    assert waiter.done() and limiter.in_flight == 2
+    assert limiter.metrics()["peak_in_flight"] == 2
+
+
+def test_saved_limit_ignored_after_setting_change():
+    limiter = _saturated(initial=10)
+    for _ in range(30):
+        limiter.record_latency(0.1)
+    saved = limiter.to_dict()
+
+    same = AdaptiveConcurrencyLimiter("test", initial=10)
+    same.load_dict(saved)
+    assert same.window == limiter.window == 12
+
+    changed = AdaptiveConcurrencyLimiter("test", initial=5)
+    changed.load_dict(saved)
+    assert changed.window == 5
@@ -0,0 +1,145 @@
+"""Tests for the headless monitor daemon's query socket."""
+
+import asyncio
+import json
+
+import pytest
+
+from livestream_list.core.channel_store import ChannelStore
+from livestream_list.core.daemon import DaemonAlreadyRunningError, MonitorDaemon
+from livestream_list.core.models import Channel, Livestream, StreamPlatform
+from livestream_list.core.monitor import StreamMonitor
+from livestream_list.core.settings import Settings
+
+
+class _FakeClient:
+    name = "Fake"
+
+    def __init__(self) -> None:
+        self.live: dict[str, int] = {}
+        self.gate: asyncio.Event | None = None  # holds refreshes until set
+
+    async def is_authorized(self) -> bool:
+        return True
+
+    async def get_livestreams(self, channels: list[Channel]) -> list[Livestream]:
+        if self.gate is not None:
+            await self.gate.wait()
+        return [
+            Livestream(
+                channel=ch, live=ch.channel_id in self.live, viewers=self.live.get(ch.channel_id, 0)
+            )
+            for ch in channels
+        ]
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+async def daemon(tmp_path):
+    mon = StreamMonitor(Settings())
+    mon._store = ChannelStore(tmp_path / "channels.db")
+    client = _FakeClient()
+    mon._clients[StreamPlatform.TWITCH] = client
+    for name in ("alpha", "beta"):
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    await mon.refresh()
+
+    daemon = MonitorDaemon(mon, tmp_path / "daemon.sock")
+    await daemon.start()
+    yield daemon, client
+    await daemon.stop()
+
+
+async def _connect(daemon):
+    return await asyncio.open_unix_connection(str(daemon.socket_path))
+
+
+async def _request(reader, writer, cmd: str) -> dict:
+    writer.write(json.dumps({"cmd": cmd}).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await asyncio.wait_for(reader.readline(), 5))
+
+
+async def test_status_and_live_queries(daemon):
+    daemon, client = daemon
+    reader, writer = await _connect(daemon)
+
+    status = await _request(reader, writer, "status")
+    assert status["ok"] and status["result"]["channels"] == 2
+    assert status["result"]["live"] == 0
+
+    client.live = {"beta": 7}
+    refreshed = await _request(reader, writer, "refresh")
+    assert refreshed["result"]["live"] == 1
+
+    live = await _request(reader, writer, "live")
+    assert [(ls["key"], ls["viewers"]) for ls in live["result"]] == [("twitch:beta", 7)]
+    writer.close()
+
+
+async def test_bad_requests_get_errors(daemon):
+    daemon, _client = daemon
+    reader, writer = await _connect(daemon)
+    assert await _request(reader, writer, "nope") == {
+        "ok": False,
+        "error": "unknown command: nope",
+    }
+    writer.write(b"not json\n")
+    await writer.drain()
+    assert not json.loads(await reader.readline())["ok"]
+    writer.close()
+
+
+async def test_refresh_refused_while_one_is_running(daemon):
+    daemon, client = daemon
+    reader, writer = await _connect(daemon)
+    client.gate = asyncio.Event()
+    running = asyncio.create_task(daemon.monitor.refresh(force=True))
+    await asyncio.sleep(0)
+
+    reply = await _request(reader, writer, "refresh")
+    assert not reply["ok"] and reply["error"].startswith("busy")
+
+    client.gate.set()
+    await running
+    assert (await _request(reader, writer, "refresh"))["ok"]
+    writer.close()
+
+
+async def test_subscriber_receives_change_events(daemon):
+    daemon, client = daemon
+    reader, writer = await _connect(daemon)
+    assert (await _request(reader, writer, "subscribe"))["result"] == "subscribed"
+
+    client.live = {"alpha": 3}
+    await daemon.monitor.refresh(force=True)
+    event = json.loads(await asyncio.wait_for(reader.readline(), 5))
+    assert event["event"] == "changes"
+    assert event["went_live"] == ["twitch:alpha"]
+    assert [ls["viewers"] for ls in event["updated"]] == [3]
+    writer.close()
+
+
+async def test_second_daemon_refused_and_stale_socket_replaced(daemon, tmp_path):
+    daemon, _client = daemon
+    with pytest.raises(DaemonAlreadyRunningError):
+        await MonitorDaemon(daemon.monitor, daemon.socket_path).start()
+
+    stale = tmp_path / "stale.sock"
+    stale.touch()
+    other = MonitorDaemon(daemon.monitor, stale)
+    await other.start()
+    await other.stop()
+    assert not stale.exists()
+
+
+async def test_stop_disconnects_clients(daemon):
+    daemon, _client = daemon
+    reader, writer = await _connect(daemon)
+    await _request(reader, writer, "subscribe")
+    await asyncio.wait_for(daemon.stop(), 2)
+    assert await asyncio.wait_for(reader.read(), 2) == b""
+    assert not daemon.socket_path.exists()
+    writer.close()
@@ -0,0 +1,66 @@
+"""Tests for the background asyncio loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from livestream_list.core.event_loop import BackgroundLoop
+
+
+def test_submit_runs_on_one_persistent_loop():
+    bg = BackgroundLoop()
+    bg.start()
+    try:
+
+        async def current() -> tuple[asyncio.AbstractEventLoop, int]:
+            return asyncio.get_running_loop(), threading.get_ident()
+
+        first = bg.submit(current()).result(2)
+        second = bg.submit(current()).result(2)
+        assert first == second
+        assert first[1] != threading.get_ident()
+    finally:
+        bg.stop()
+
+
+def test_submit_propagates_exceptions():
+    bg = BackgroundLoop()
+    bg.start()
+    try:
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            bg.submit(fail()).result(2)
+    finally:
+        bg.stop()
+
+
+def test_stop_runs_shutdown_and_cancels_pending():
+    bg = BackgroundLoop()
+    bg.start()
+    closed = []
+
+    async def forever() -> None:
+        await asyncio.sleep(3600)
+
+    async def shutdown() -> None:
+        closed.append(True)
+
+    pending = bg.submit(forever())
+    bg.stop(shutdown=shutdown)
+    assert closed == [True]
+    assert not bg.is_running
+    assert pending.cancelled()
+
+
+def test_submit_requires_running_loop():
+    bg = BackgroundLoop()
+
+    async def noop() -> None:
+        pass
+
+    with pytest.raises(RuntimeError):
+        bg.submit(noop())
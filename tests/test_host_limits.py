@@ -0,0 +1,193 @@
+"""Tests for per-host rate limiting and circuit breaking."""
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from livestream_list.api import host_limits
+from livestream_list.api.host_limits import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_OPEN_SECONDS,
+    CircuitOpenError,
+    HostRegistry,
+    RateLimitedError,
+    create_trace_config,
+    parse_retry_after,
+)
+
+HOST = "api.example.com"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(host_limits.time, "monotonic", clock)
+    return clock
+
+
+async def _fail(registry: HostRegistry, times: int) -> None:
+    for _ in range(times):
+        probe = await registry.acquire(HOST)
+        registry.release(HOST, probe, status=503, headers={})
+
+
+# --- parse_retry_after ---
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after({"Retry-After": "7"}) == 7.0
+
+
+def test_parse_retry_after_http_date_in_past():
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+
+
+def test_parse_retry_after_missing_or_invalid():
+    assert parse_retry_after({}, default=3.0) == 3.0
+    assert parse_retry_after({"Retry-After": "soon"}, default=3.0) == 3.0
+
+
+# --- Circuit breaker ---
+
+
+async def test_circuit_opens_after_consecutive_failures(clock):
+    registry = HostRegistry()
+    await _fail(registry, CIRCUIT_FAILURE_THRESHOLD)
+    with pytest.raises(CircuitOpenError):
+        await registry.acquire(HOST)
+
+
+async def test_success_resets_failure_count(clock):
+    registry = HostRegistry()
+    await _fail(registry, CIRCUIT_FAILURE_THRESHOLD - 1)
+    probe = await registry.acquire(HOST)
+    registry.release(HOST, probe, status=200, headers={})
+    await _fail(registry, CIRCUIT_FAILURE_THRESHOLD - 1)
+    assert not await registry.acquire(HOST)
+
+
+async def test_half_open_allows_single_probe(clock):
+    registry = HostRegistry()
+    await _fail(registry, CIRCUIT_FAILURE_THRESHOLD)
+    clock.now += CIRCUIT_OPEN_SECONDS + 1
+
+    assert await registry.acquire(HOST) is True
+    with pytest.raises(CircuitOpenError):
+        await registry.acquire(HOST)
+
+    registry.release(HOST, True, status=200, headers={})
+    assert await registry.acquire(HOST) is False
+
+
+async def test_failed_probe_reopens_with_longer_cooldown(clock):
+    registry = HostRegistry()
+    await _fail(registry, CIRCUIT_FAILURE_THRESHOLD)
+    clock.now += CIRCUIT_OPEN_SECONDS + 1
+    probe = await registry.acquire(HOST)
+    registry.release(HOST, probe)  # connection error
+
+    clock.now += CIRCUIT_OPEN_SECONDS + 1
+    with pytest.raises(CircuitOpenError):
+        await registry.acquire(HOST)
+    clock.now += CIRCUIT_OPEN_SECONDS
+    assert await registry.acquire(HOST) is True
+
+
+async def test_client_errors_do_not_trip_circuit(clock):
+    registry = HostRegistry()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD * 2):
+        probe = await registry.acquire(HOST)
+        registry.release(HOST, probe, status=404, headers={})
+    assert not await registry.acquire(HOST)
+
+
+# --- Rate limits ---
+
+
+async def test_long_retry_after_fails_fast(clock):
+    registry = HostRegistry()
+    probe = await registry.acquire(HOST)
+    registry.release(HOST, probe, status=429, headers={"Retry-After": "60"})
+    with pytest.raises(RateLimitedError):
+        await registry.acquire(HOST)
+    clock.now += 61
+    assert not await registry.acquire(HOST)
+
+
+async def test_short_retry_after_waits():
+    registry = HostRegistry()
+    probe = await registry.acquire(HOST)
+    registry.release(HOST, probe, status=429, headers={"Retry-After": "0.05"})
+    assert not await registry.acquire(HOST)
+    assert registry.snapshot()[HOST]["blocked_for"] == 0.0
+
+
+async def test_ratelimit_headers_drive_token_bucket(clock):
+    registry = HostRegistry()
+    probe = await registry.acquire(HOST)
+    registry.release(
+        HOST,
+        probe,
+        status=200,
+        headers={"Ratelimit-Limit": "800", "Ratelimit-Remaining": "2", "Ratelimit-Reset": "60"},
+    )
+    await registry.acquire(HOST)
+    await registry.acquire(HOST)
+    # Bucket empty; refill to 800 over 60s is far faster than the max wait
+    assert registry.snapshot()[HOST]["tokens"] == 0
+    clock.now += 1
+    assert not await registry.acquire(HOST)
+
+
+async def test_exhausted_budget_blocks_until_reset(clock):
+    registry = HostRegistry()
+    probe = await registry.acquire(HOST)
+    registry.release(
+        HOST,
+        probe,
+        status=200,
+        headers={"Ratelimit-Limit": "800", "Ratelimit-Remaining": "0", "Ratelimit-Reset": "30"},
+    )
+    with pytest.raises(RateLimitedError):
+        await registry.acquire(HOST)
+
+
+# --- Session integration ---
+
+
+async def test_trace_config_short_circuits_failing_host():
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        return web.Response(status=503)
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    registry = HostRegistry()
+    try:
+        async with aiohttp.ClientSession(trace_configs=[create_trace_config(registry)]) as session:
+            for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+                async with session.get(f"http://127.0.0.1:{port}/") as resp:
+                    assert resp.status == 503
+            with pytest.raises(CircuitOpenError):
+                await session.get(f"http://127.0.0.1:{port}/")
+    finally:
+        await runner.cleanup()
+
+    assert len(hits) == CIRCUIT_FAILURE_THRESHOLD
+    assert registry.snapshot()["127.0.0.1"]["in_flight"] == 0
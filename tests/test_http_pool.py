@@ -0,0 +1,147 @@
+"""Tests for the shared HTTP connection pool."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livestream_list.api import http_pool
+from livestream_list.api.http_pool import SharedHttpPool
+from livestream_list.api.response_cache import ResponseCache, cache_key
+from livestream_list.api.twitch import TwitchApiClient
+from livestream_list.core.settings import TwitchSettings
+
+
+@pytest.fixture
+async def server():
+    peers: list[tuple[str, int]] = []
+
+    async def data(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    async def slow(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(0.1)
+        return web.json_response(await request.json() if request.can_read_body else {})
+
+    async def emotes(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"emotes": ["Kappa"]}, headers={"ETag": '"v1"'})
+
+    async def big(request: web.Request) -> web.Response:
+        return web.Response(body=b"x" * 100_000)
+
+    app = web.Application()
+    app.router.add_get("/data", data)
+    app.router.add_get("/big", big)
+    app.router.add_get("/emotes", emotes)
+    app.router.add_get("/slow", slow)
+    app.router.add_post("/slow", slow)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, peers
+    await server.close()
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SharedHttpPool(ResponseCache(tmp_path / "http_cache.db"))
+    yield pool
+    pool.shutdown()
+
+
+async def test_connection_reused_across_loops(server, pool):
+    server, peers = server
+    url = str(server.make_url("/data"))
+    resp = await pool.get(url)
+    assert resp.status == 200 and resp.json() == {"ok": True}
+    # A worker thread with its own short-lived loop, like the chat workers
+    resp = await asyncio.to_thread(asyncio.run, pool.get(url))
+    assert resp.json() == {"ok": True}
+    assert len(peers) == 2 and peers[0] == peers[1]
+
+
+async def test_client_sessions_share_the_pool_connector(server, pool):
+    server, peers = server
+    url = str(server.make_url("/data"))
+    await pool.get(url)
+    client = TwitchApiClient(TwitchSettings())
+    client.share_connector(pool.connector)
+
+    async def fetch() -> int:
+        async with client.session.get(url) as resp:
+            await resp.read()
+            return resp.status
+
+    assert await asyncio.wrap_future(pool.loop.submit(fetch())) == 200
+    await asyncio.wrap_future(pool.loop.submit(client.close()))
+    # The client's session used the pool's warm connection and left it open
+    assert len(peers) == 2 and peers[0] == peers[1]
+    assert not pool.connector().closed
+
+
+async def test_max_bytes_truncates_body(server, pool):
+    server, _peers = server
+    resp = await pool.get(str(server.make_url("/big")), max_bytes=1000)
+    assert resp.body == b"x" * 1000
+
+
+async def test_identical_requests_share_one_round_trip(server, pool):
+    server, peers = server
+    url = str(server.make_url("/slow"))
+    gets = [pool.get(url, headers={"Client-Id": "x"}) for _ in range(3)]
+    other = pool.get(url, headers={"Client-Id": "y"})
+    first, *rest, distinct = await asyncio.gather(*gets, other)
+    assert all(resp is first for resp in rest) and distinct is not first
+    assert len(peers) == 2
+    assert pool.metrics()["coalesced"] == 2
+
+    # POSTs are only shared when the caller opts in
+    posts = [pool.post(url, json={"q": 1}) for _ in range(2)]
+    posts += [pool.post(url, json={"q": 1}, coalesce=True) for _ in range(2)]
+    responses = await asyncio.gather(*posts)
+    assert [resp.json() for resp in responses] == [{"q": 1}] * 4
+    assert len(peers) == 5
+
+
+async def test_cancelled_caller_does_not_cancel_shared_request(server, pool):
+    server, _peers = server
+    url = str(server.make_url("/slow"))
+    first = asyncio.ensure_future(pool.get(url))
+    second = asyncio.ensure_future(pool.get(url))
+    await asyncio.sleep(0.02)
+    first.cancel()
+    assert (await second).status == 200
+
+
+async def test_cached_payload_served_then_revalidated(server, pool):
+    server, peers = server
+    url = str(server.make_url("/emotes"))
+    resp = await pool.get_cached(url, params={"set": "global"})
+    assert resp.json() == {"emotes": ["Kappa"]} and not resp.from_cache
+    resp = await pool.get_cached(url, params={"set": "global"})
+    assert resp.from_cache and resp.json() == {"emotes": ["Kappa"]}
+    assert len(peers) == 1
+
+    # Old enough to revalidate: served at once, then confirmed with a 304
+    key = cache_key(url, {"set": "global"})
+    pool.cache.touch(key, pool.cache.get(key).fetched_at - http_pool.REVALIDATE_AFTER)
+    resp = await pool.get_cached(url, params={"set": "global"})
+    assert resp.from_cache
+    for _ in range(100):
+        if pool.metrics()["not_modified"]:
+            break
+        await asyncio.sleep(0.01)
+    assert pool.metrics()["not_modified"] == 1 and len(peers) == 2
+    assert pool.cache.get(key).age() < http_pool.REVALIDATE_AFTER
+
+
+async def test_shutdown_closes_the_response_cache(server, pool):
+    server, _peers = server
+    await pool.get_cached(str(server.make_url("/emotes")))
+    pool.shutdown()
+    assert pool.cache._conn is None
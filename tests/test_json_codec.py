@@ -0,0 +1,51 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+import math
+
+import pytest
+
+from livestream_list.core import json_codec
+
+
+def _installed() -> list[str]:
+    names = []
+    for name in json_codec.BACKENDS:
+        try:
+            json_codec.use_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    json_codec.use_backend()
+    return names
+
+
+@pytest.fixture(params=_installed())
+def codec(request):
+    json_codec.use_backend(request.param)
+    yield json_codec
+    json_codec.use_backend()
+
+
+def test_round_trip_matches_stdlib(codec):
+    value = {"b": [1, 2.5, None, True], "a": "héllo 🔥", "nested": {"x": '"quoted"'}}
+    encoded = codec.dumps(value)
+    assert json.loads(encoded) == value
+    assert codec.loads(encoded) == codec.loads(encoded.encode()) == value
+    assert "🔥" in encoded  # Not \\u-escaped with any backend
+    assert codec.dumps(value, sort_keys=True).index('"a"') < codec.dumps(value).index('"a"')
+
+
+def test_input_fast_backends_reject_falls_back(codec):
+    assert math.isnan(codec.loads("[NaN]")[0])
+    assert codec.loads(str(2**70)) == 2**70
+    assert json.loads(codec.dumps({1: 2**70})) == {"1": 2**70}
+    assert json.loads(codec.dumps({"a": 1}, indent=2)) == {"a": 1}
+
+
+def test_errors_match_stdlib(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("<html>Bad Gateway</html>")
+    with pytest.raises(TypeError):
+        codec.dumps({"a": object()})
+    assert codec.dumps({"a": object()}, default=lambda o: "obj") == '{"a":"obj"}'
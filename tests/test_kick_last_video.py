@@ -0,0 +1,68 @@
+"""Tests for KickApiClient's cached last-video dates."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livestream_list.api.kick import KickApiClient
+from livestream_list.core.settings import KickSettings
+
+
+@pytest.fixture
+async def kick_server():
+    state = {"live": False, "videos": 0, "vod": "2026-01-03 02:44:40"}
+
+    async def channel(request: web.Request) -> web.Response:
+        livestream = {"is_live": True, "start_time": "2026-02-01 10:00:00"}
+        return web.json_response({"livestream": livestream if state["live"] else None})
+
+    async def videos(request: web.Request) -> web.Response:
+        state["videos"] += 1
+        return web.json_response([{"start_time": state["vod"]}])
+
+    app = web.Application()
+    app.router.add_get("/channels/{slug}", channel)
+    app.router.add_get("/channels/{slug}/videos", videos)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, state
+    await server.close()
+
+
+@pytest.fixture
+async def client(kick_server):
+    server, _state = kick_server
+    client = KickApiClient(KickSettings())
+    client.BASE_URL = str(server.make_url("")).rstrip("/")
+    yield client
+    await client.close()
+
+
+async def test_last_video_date_cached_until_channel_streams(kick_server, client, kick_channel):
+    _server, state = kick_server
+    first = await client.get_livestream(kick_channel)
+    await client.get_livestream(kick_channel)
+    assert state["videos"] == 1
+    assert first.last_live_time.isoformat() == "2026-01-03T02:44:40+00:00"
+
+    state["live"] = True
+    await client.get_livestream(kick_channel)
+
+    # Ended stream's VOD not listed yet: its start time is used meanwhile
+    state["live"] = False
+    ended = await client.get_livestream(kick_channel)
+    assert state["videos"] == 2
+    assert ended.last_live_time.isoformat() == "2026-02-01T10:00:00+00:00"
+
+
+async def test_last_video_dates_persisted(kick_server, client, kick_channel):
+    _server, state = kick_server
+    await client.get_livestream(kick_channel)
+
+    restored = KickApiClient(KickSettings())
+    restored.BASE_URL = client.BASE_URL
+    restored.restore_persistent_state(client.get_persistent_state())
+    offline = await restored.get_livestream(kick_channel)
+    await restored.close()
+    assert state["videos"] == 1
+    assert offline.last_live_time == (await client.get_livestream(kick_channel)).last_live_time
@@ -301,3 +301,40 @@ def test_set_offline(twitch_livestream):
     assert twitch_livestream.live is False
     assert twitch_livestream.viewers == 0
     assert twitch_livestream.start_time is None
+
+
+# --- Livestream.changed_fields ---
+
+
+def test_changed_fields_none(twitch_livestream, twitch_channel):
+    same = Livestream(
+        channel=twitch_channel,
+        live=True,
+        title=twitch_livestream.title,
+        game=twitch_livestream.game,
+        viewers=twitch_livestream.viewers,
+        start_time=twitch_livestream.start_time,
+    )
+    assert twitch_livestream.changed_fields(same) == set()
+
+
+def test_changed_fields_viewers_and_title(twitch_livestream, twitch_channel):
+    other = Livestream(
+        channel=twitch_channel,
+        live=True,
+        title="New Title",
+        game=twitch_livestream.game,
+        viewers=99,
+        start_time=twitch_livestream.start_time,
+    )
+    assert twitch_livestream.changed_fields(other) == {"title", "viewers"}
+
+
+def test_changed_fields_last_live_time_only_when_offline(twitch_channel):
+    ls = Livestream(channel=twitch_channel, live=False)
+    seen = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert ls.changed_fields(Livestream(channel=twitch_channel, last_live_time=seen)) == {
+        "last_live_time"
+    }
+    live = Livestream(channel=twitch_channel, live=True, last_live_time=seen)
+    assert "last_live_time" not in ls.changed_fields(live)
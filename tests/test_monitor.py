@@ -0,0 +1,390 @@
+"""Tests for StreamMonitor refresh state handling."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from livestream_list.core.channel_store import ChannelStore
+from livestream_list.core.models import Channel, Livestream, StreamPlatform
+from livestream_list.core.monitor import StreamMonitor
+from livestream_list.core.settings import Settings
+
+
+class _FakeClient:
+    """Stand-in platform client returning scripted live states."""
+
+    name = "Fake"
+
+    def __init__(self) -> None:
+        self.live: dict[str, int] = {}  # channel_id -> viewers for live channels
+        self.calls: list[list[str]] = []
+        self.forgotten: list[str] = []
+        self.missing: set[str] = set()  # channel_ids left out of results
+
+    def forget_channel(self, channel_id: str) -> None:
+        self.forgotten.append(channel_id)
+
+    async def is_authorized(self) -> bool:
+        return True
+
+    async def get_livestreams(self, channels: list[Channel]) -> list[Livestream]:
+        self.calls.append([ch.channel_id for ch in channels])
+        return [
+            Livestream(
+                channel=ch,
+                live=ch.channel_id in self.live,
+                viewers=self.live.get(ch.channel_id, 0),
+            )
+            for ch in channels
+            if ch.channel_id not in self.missing
+        ]
+
+    async def close(self) -> None:
+        pass
+
+
+def _make_monitor(tmp_path) -> StreamMonitor:
+    mon = StreamMonitor(Settings())
+    mon._store = ChannelStore(tmp_path / "channels.db")
+    return mon
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    mon = _make_monitor(tmp_path)
+    client = _FakeClient()
+    mon._clients[StreamPlatform.TWITCH] = client
+    for name in ("alpha", "beta", "gamma"):
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    return mon, client
+
+
+async def test_refresh_reports_added_channels(monitor):
+    mon, _client = monitor
+    received = []
+    mon.on_refresh_changes(received.append)
+    await mon.refresh()
+    assert len(received) == 1
+    assert {ch.channel_id for ch in received[0].added_channels} == {"alpha", "beta", "gamma"}
+
+
+async def test_refresh_changes_went_live_and_fields(monitor):
+    mon, client = monitor
+    await mon.refresh()
+    received = []
+    mon.on_refresh_changes(received.append)
+
+    client.live = {"alpha": 10}
+    await mon.refresh(force=True)
+    changes = received[-1]
+    assert [ls.channel.channel_id for ls in changes.went_live] == ["alpha"]
+    assert changes.changed["twitch:alpha"] >= {"live", "viewers"}
+    assert "twitch:beta" not in changes.changed
+
+    client.live = {"alpha": 25}
+    await mon.refresh(force=True)
+    changes = received[-1]
+    assert not changes.membership_changed
+    assert changes.changed == {"twitch:alpha": {"viewers"}}
+
+
+async def test_channel_left_out_of_results_stays_due(monitor):
+    mon, client = monitor
+    client.missing = {"beta"}
+    await mon.refresh()
+    due = mon._scheduler.due_channels(mon.channels)
+    assert [ch.channel_id for ch in due] == ["beta"]
+    assert "twitch:beta" not in mon._last_checked
+
+
+async def test_refresh_reports_went_offline(monitor):
+    mon, client = monitor
+    client.live = {"beta": 5}
+    await mon.refresh()
+    offline = []
+    received = []
+    mon.on_stream_offline(offline.append)
+    mon.on_refresh_changes(received.append)
+
+    client.live = {}
+    await mon.refresh(force=True)
+    assert [ls.channel.channel_id for ls in received[-1].went_offline] == ["beta"]
+    assert [ls.channel.channel_id for ls in offline] == ["beta"]
+
+
+async def test_unchanged_refresh_fires_no_changes(monitor):
+    mon, _client = monitor
+    await mon.refresh()
+    received = []
+    mon.on_refresh_changes(received.append)
+    await mon.refresh(force=True)
+    assert received == []
+
+
+async def test_removed_channel_reported(monitor):
+    mon, client = monitor
+    await mon.refresh()
+    received = []
+    mon.on_refresh_changes(received.append)
+    mon.remove_channels(["twitch:gamma"])
+    await mon.refresh(force=True)
+    assert [ch.channel_id for ch in received[-1].removed_channels] == ["gamma"]
+    assert client.forgotten == ["gamma"]
+
+
+def test_channel_index_tracks_youtube_concurrent_streams(tmp_path):
+    mon = _make_monitor(tmp_path)
+    ch = Channel(channel_id="UCabc", platform=StreamPlatform.YOUTUBE)
+    other = Channel(channel_id="UCabcdef", platform=StreamPlatform.YOUTUBE)
+    mon.add_channel_direct(ch)
+    mon.add_channel_direct(other)
+    mon._apply_results(
+        [ch],
+        [
+            Livestream(channel=ch, live=True, video_id="vid1"),
+            Livestream(channel=ch, live=True, video_id="vid2"),
+        ],
+    )
+    assert mon._stream_keys_by_channel["youtube:UCabc"] == {
+        "youtube:UCabc",
+        "youtube:UCabc:vid1",
+        "youtube:UCabc:vid2",
+    }
+
+    mon.remove_channels(["youtube:UCabc"])
+    assert "youtube:UCabc" not in mon._stream_keys_by_channel
+    assert {ls.stream_key for ls in mon.livestreams} == {"youtube:UCabcdef"}
+
+
+# --- Persistence ---
+
+
+async def test_channels_persist_incrementally(tmp_path):
+    mon = _make_monitor(tmp_path)
+    for name in ("alpha", "beta"):
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    await mon.save_channels()
+    assert mon._dirty_channel_keys == set()
+
+    beta = next(ch for ch in mon.channels if ch.channel_id == "beta")
+    mon.set_favorite(beta, True)
+    assert mon._dirty_channel_keys == {"twitch:beta"}
+    mon.flush_pending_save()
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    favorites = {ch.channel_id: ch.favorite for ch in reloaded.channels}
+    assert favorites == {"alpha": False, "beta": True}
+
+
+async def test_close_flushes_and_checkpoints_store(tmp_path):
+    mon = _make_monitor(tmp_path)
+    mon.add_channel_direct(Channel(channel_id="alpha", platform=StreamPlatform.TWITCH))
+    mon.close()
+    assert mon._store._conn is None
+    wal = tmp_path / "channels.db-wal"
+    assert not wal.exists() or wal.stat().st_size == 0
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    assert [ch.channel_id for ch in reloaded.channels] == ["alpha"]
+
+
+async def test_trash_round_trip(tmp_path):
+    mon = _make_monitor(tmp_path)
+    for name in ("alpha", "beta", "gamma"):
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    await mon.save_channels()
+    mon.trash_channels(["twitch:alpha", "twitch:beta"])
+    mon.restore_from_trash([0])
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    assert {ch.channel_id for ch in reloaded.channels} == {"alpha", "gamma"}
+    assert [entry["channel_id"] for entry in reloaded.get_trash()] == ["beta"]
+
+    reloaded.empty_trash()
+    assert _make_monitor(tmp_path)._store.load_trash() == []
+
+
+async def test_failed_trash_write_is_retried_whole(tmp_path):
+    mon = _make_monitor(tmp_path)
+    mon.add_channel_direct(Channel(channel_id="alpha", platform=StreamPlatform.TWITCH))
+    await mon.save_channels()
+
+    write = mon._store.write_channels
+
+    def fail(**kwargs):
+        raise OSError("disk full")
+
+    mon._store.write_channels = fail
+    mon.trash_channels(["twitch:alpha"])
+    # Nothing was written, so no trash entry (or made-up row id) is kept
+    assert mon.get_trash() == [] and mon._trash_ids == []
+    stored = _make_monitor(tmp_path)._store
+    assert [r["channel_id"] for r in stored.load_channels()] == ["alpha"]
+    assert stored.load_trash() == []
+
+    mon._store.write_channels = write
+    mon.flush_pending_save()
+    assert [entry["channel_id"] for entry in mon.get_trash()] == ["alpha"]
+    assert mon._trash_ids == [row_id for row_id, _ in stored.load_trash()]
+    assert stored.load_channels() == []
+
+
+async def test_channel_order_preserved_across_save(tmp_path):
+    mon = _make_monitor(tmp_path)
+    names = [f"ch{i:02d}" for i in range(20)]
+    for name in names:
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    await mon.save_channels()
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    assert [ch.channel_id for ch in reloaded.channels] == names
+
+
+# --- Warm-start snapshot ---
+
+
+async def _snapshot_with_gamma_live(tmp_path) -> None:
+    mon = _make_monitor(tmp_path)
+    client = _FakeClient()
+    mon._clients[StreamPlatform.TWITCH] = client
+    for name in ("alpha", "beta", "gamma"):
+        mon.add_channel_direct(Channel(channel_id=name, platform=StreamPlatform.TWITCH))
+    await mon.save_channels()
+    client.live = {"gamma": 42}
+    await mon.refresh()
+
+
+async def test_live_snapshot_restored_as_stale(tmp_path):
+    await _snapshot_with_gamma_live(tmp_path)
+
+    mon = _make_monitor(tmp_path)
+    await mon.load_channels()
+    live = mon.live_streams
+    assert [(ls.channel.channel_id, ls.viewers, ls.stale) for ls in live] == [("gamma", 42, True)]
+
+    client = _FakeClient()
+    client.live = {"gamma": 50}
+    mon._clients[StreamPlatform.TWITCH] = client
+    received = []
+    mon.on_refresh_changes(received.append)
+    await mon.refresh()
+    # Previously live channels are polled first
+    assert client.calls == [["gamma", "alpha", "beta"]]
+    assert received[-1].went_live == []
+    assert received[-1].changed["twitch:gamma"] == {"viewers", "stale"}
+    assert not mon.live_streams[0].stale
+
+
+async def test_stale_snapshot_stream_cleared_when_offline(tmp_path):
+    await _snapshot_with_gamma_live(tmp_path)
+
+    mon = _make_monitor(tmp_path)
+    await mon.load_channels()
+    mon._clients[StreamPlatform.TWITCH] = _FakeClient()
+    received = []
+    mon.on_refresh_changes(received.append)
+    await mon.refresh()
+    assert [ls.channel.channel_id for ls in received[-1].went_offline] == ["gamma"]
+    assert mon.live_streams == []
+    assert mon._store.load_live_snapshot() == []
+
+
+async def test_old_live_snapshot_ignored(tmp_path):
+    await _snapshot_with_gamma_live(tmp_path)
+    store = ChannelStore(tmp_path / "channels.db")
+    records = {"twitch:gamma": store.load_live_snapshot()[0]}
+    records["twitch:gamma"]["checked_at"] = "2020-01-01T00:00:00+00:00"
+    store.write_live_snapshot(records)
+
+    mon = _make_monitor(tmp_path)
+    await mon.load_channels()
+    assert mon.live_streams == []
+
+
+# --- Per-platform publication ---
+
+
+class _BlockedClient(_FakeClient):
+    """Fake client whose queries wait until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def get_livestreams(self, channels: list[Channel]) -> list[Livestream]:
+        await self.release.wait()
+        return await super().get_livestreams(channels)
+
+
+async def test_fast_platform_published_before_slow_one(monitor):
+    mon, client = monitor
+    slow = _BlockedClient()
+    mon._clients[StreamPlatform.YOUTUBE] = slow
+    mon.add_channel_direct(Channel(channel_id="UCslow", platform=StreamPlatform.YOUTUBE))
+    client.live = {"alpha": 3}
+
+    online = []
+    platforms = []
+    mon.on_stream_online(online.append)
+    mon.on_platform_refreshed(lambda platform, elapsed: platforms.append(platform))
+    mon.set_initial_load_complete()
+
+    task = asyncio.create_task(mon.refresh())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert platforms == [StreamPlatform.TWITCH]
+    assert [ls.channel.channel_id for ls in online] == ["alpha"]
+    assert not task.done()
+
+    slow.release.set()
+    await task
+    assert platforms == [StreamPlatform.TWITCH, StreamPlatform.YOUTUBE]
+
+
+async def test_client_state_persists_between_runs(tmp_path):
+    mon = _make_monitor(tmp_path)
+    mon.get_client(StreamPlatform.TWITCH)._sweep_sizer.batch_size = 60
+    mon.flush_pending_save()
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    assert reloaded.get_client(StreamPlatform.TWITCH)._sweep_sizer.batch_size == 60
+
+
+async def test_go_live_history_persists_between_runs(tmp_path):
+    mon = _make_monitor(tmp_path)
+    mon._scheduler.record_went_live("twitch:alpha", datetime(2025, 6, 1, 18, 10))
+    mon.flush_pending_save()
+
+    reloaded = _make_monitor(tmp_path)
+    await reloaded.load_channels()
+    assert reloaded._scheduler._go_live_minutes == {"twitch:alpha": [18 * 60 + 10]}
+
+
+async def test_pushed_stream_event_refreshes_channel_until_confirmed(monitor, monkeypatch):
+    mon, client = monitor
+    monkeypatch.setattr("livestream_list.core.monitor.PUSH_CONFIRM_DELAY", 0)
+    await mon.refresh()
+    online = []
+    mon.on_stream_online(online.append)
+    mon.set_initial_load_complete()
+
+    # The API lags the push: the first poll still reports the channel offline
+    lagging = client.get_livestreams
+
+    async def get_livestreams(channels):
+        client.live = {"beta": 5} if client.calls else {}
+        return await lagging(channels)
+
+    client.get_livestreams = get_livestreams
+    client.calls.clear()
+    mon._on_twitch_stream_event("beta", True)
+    await asyncio.gather(*mon._push_tasks)
+
+    assert client.calls == [["beta"], ["beta"]]
+    assert [ls.channel.channel_id for ls in online] == ["beta"]
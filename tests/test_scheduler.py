@@ -0,0 +1,151 @@
+"""Tests for adaptive per-channel poll scheduling."""
+
+from datetime import datetime, timedelta, timezone
+
+from livestream_list.core.models import Channel, Livestream, StreamPlatform
+from livestream_list.core.scheduler import (
+    DORMANT_MULTIPLIER,
+    UNKNOWN_MULTIPLIER,
+    PollScheduler,
+)
+
+NOW = datetime(2025, 6, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _channel(name: str, favorite: bool = False) -> Channel:
+    return Channel(channel_id=name, platform=StreamPlatform.TWITCH, favorite=favorite)
+
+
+def _offline(channel: Channel, last_live: datetime | None) -> Livestream:
+    return Livestream(channel=channel, live=False, last_live_time=last_live)
+
+
+# --- interval_for ---
+
+
+def test_live_channel_uses_base_interval():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("live")
+    assert sched.interval_for(ch, [Livestream(channel=ch, live=True)], NOW) == 60
+
+
+def test_favorite_uses_base_interval():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("fav", favorite=True)
+    assert sched.interval_for(ch, [_offline(ch, NOW - timedelta(days=90))], NOW) == 60
+
+
+def test_offline_backoff_grows_with_age():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("off")
+    recent = sched.interval_for(ch, [_offline(ch, NOW - timedelta(hours=2))], NOW)
+    week = sched.interval_for(ch, [_offline(ch, NOW - timedelta(days=3))], NOW)
+    month = sched.interval_for(ch, [_offline(ch, NOW - timedelta(days=20))], NOW)
+    dormant = sched.interval_for(ch, [_offline(ch, NOW - timedelta(days=90))], NOW)
+    assert 60 < recent < week < month < dormant
+    assert dormant == 60 * DORMANT_MULTIPLIER
+
+
+def test_never_live_uses_unknown_multiplier():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("new")
+    assert sched.interval_for(ch, [_offline(ch, None)], NOW) == 60 * UNKNOWN_MULTIPLIER
+
+
+def test_interval_capped_at_max():
+    sched = PollScheduler(60, 300)
+    ch = _channel("off")
+    assert sched.interval_for(ch, [_offline(ch, NOW - timedelta(days=90))], NOW) == 300
+
+
+def test_push_covered_channel_polled_at_max_until_live():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("pushed", favorite=True)
+    sched.set_push_covered({ch.unique_key})
+    assert sched.interval_for(ch, [_offline(ch, NOW - timedelta(hours=1))], NOW) == 3600
+    assert sched.interval_for(ch, [Livestream(channel=ch, live=True)], NOW) == 60
+
+    sched.record_checked(ch, [_offline(ch, None)], now=0.0, wall_now=NOW)
+    assert sched.due_channels([ch], now=1.0) == []
+    sched.set_push_covered(set())
+    assert sched.due_channels([ch], now=1.0) == [ch]
+
+
+def test_usual_go_live_window_uses_base_interval():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("regular")
+    sched.record_went_live(ch.unique_key, NOW.replace(hour=18, minute=10) - timedelta(days=1))
+    streams = [_offline(ch, NOW - timedelta(days=20))]
+    # 10 minutes before the usual go-live time
+    assert sched.interval_for(ch, streams, NOW) == 60
+    # Several hours away from it
+    assert sched.interval_for(ch, streams, NOW.replace(hour=9)) > 60
+
+
+def test_go_live_window_wraps_midnight():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("night")
+    sched.record_went_live(ch.unique_key, NOW.replace(hour=0, minute=5))
+    streams = [_offline(ch, NOW - timedelta(days=20))]
+    assert sched.interval_for(ch, streams, NOW.replace(hour=23, minute=55)) == 60
+
+
+def test_go_live_history_round_trip():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("regular")
+    sched.record_went_live(ch.unique_key, NOW.replace(hour=18, minute=10))
+    streams = [_offline(ch, NOW - timedelta(days=20))]
+
+    restored = PollScheduler(60, 3600)
+    restored.load_dict(sched.to_dict())
+    assert restored.interval_for(ch, streams, NOW) == 60
+
+    restored.load_dict({"go_live_minutes": {"twitch:bad": [5000, "x"], "twitch:junk": 3}})
+    assert restored.to_dict() == sched.to_dict()
+
+
+# --- deadlines ---
+
+
+def test_unscheduled_channels_are_due():
+    sched = PollScheduler(60, 3600)
+    channels = [_channel("a"), _channel("b")]
+    assert sched.due_channels(channels, now=0.0) == channels
+
+
+def test_record_checked_defers_offline_channel():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("off")
+    interval = sched.record_checked(
+        ch, [_offline(ch, NOW - timedelta(days=90))], now=1000.0, wall_now=NOW
+    )
+    assert interval > 60
+    assert sched.due_channels([ch], now=1060.0) == []
+    assert sched.due_channels([ch], now=1000.0 + interval) == [ch]
+
+
+def test_live_channel_due_next_tick():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("live")
+    sched.record_checked(ch, [Livestream(channel=ch, live=True)], now=1000.0, wall_now=NOW)
+    assert sched.due_channels([ch], now=1060.0) == [ch]
+
+
+def test_mark_due_and_forget():
+    sched = PollScheduler(60, 3600)
+    ch = _channel("off")
+    sched.record_checked(ch, [_offline(ch, None)], now=1000.0, wall_now=NOW)
+    assert sched.due_channels([ch], now=1001.0) == []
+    sched.mark_due(ch.unique_key)
+    assert sched.due_channels([ch], now=1001.0) == [ch]
+    sched.record_checked(ch, [_offline(ch, None)], now=1000.0, wall_now=NOW)
+    sched.forget(ch.unique_key)
+    assert sched.due_channels([ch], now=1001.0) == [ch]
+
+
+def test_seconds_until_next_due_capped_at_base():
+    sched = PollScheduler(60, 3600)
+    assert sched.seconds_until_next_due(now=0.0) == 60
+    ch = _channel("off")
+    sched.record_checked(ch, [_offline(ch, None)], now=0.0, wall_now=NOW)
+    assert sched.seconds_until_next_due(now=0.0) == 60
@@ -49,6 +49,7 @@ def _make_non_default_settings() -> Settings:
             refresh_token="twitch_rt",
             login_name="twitchuser",
             browser_auth_token="twitch_bat",
+            eventsub_stream_events=True,
         ),
         youtube=YouTubeSettings(
             api_key="yt_api_key",
@@ -185,6 +186,8 @@ def _make_non_default_settings() -> Settings:
         performance=PerformanceSettings(
             youtube_concurrency=5,
             kick_concurrency=20,
+            adaptive_polling=False,
+            max_poll_interval=1800,
         ),
     )
 
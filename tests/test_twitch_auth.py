@@ -0,0 +1,72 @@
+"""Tests for TwitchApiClient's cached token validation."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livestream_list.api import twitch
+from livestream_list.api.twitch import TwitchApiClient
+from livestream_list.api.twitch_users import TwitchUserStore
+from livestream_list.core.settings import TwitchSettings
+
+
+@pytest.fixture
+async def auth_server():
+    state = {"validations": 0, "valid": True}
+
+    async def validate(request: web.Request) -> web.Response:
+        state["validations"] += 1
+        if not state["valid"]:
+            return web.json_response({"status": 401}, status=401)
+        return web.json_response({"user_id": "1", "login": "", "expires_in": 5000})
+
+    async def helix(request: web.Request) -> web.Response:
+        return web.json_response({"status": 401}, status=401)
+
+    app = web.Application()
+    app.router.add_get("/validate", validate)
+    app.router.add_get("/helix", helix)
+    server = TestServer(app)
+    await server.start_server()
+    yield server, state
+    await server.close()
+
+
+@pytest.fixture
+async def client(auth_server, tmp_path):
+    server, _state = auth_server
+    client = TwitchApiClient(
+        TwitchSettings(access_token="token"), TwitchUserStore(tmp_path / "users.db")
+    )
+    client.AUTH_URL = str(server.make_url(""))
+    yield client
+    await client.close()
+
+
+async def test_validation_cached_until_a_401(auth_server, client):
+    server, state = auth_server
+    assert await client.is_authorized()
+    assert await client.is_authorized()
+    assert state["validations"] == 1
+
+    # Any 401 on a request carrying the token drops the cached result
+    async with client.session.get(server.make_url("/helix"), headers=client._get_headers()):
+        pass
+    state["valid"] = False
+    assert not await client.is_authorized()
+    assert not await client.is_authorized()
+    assert state["validations"] == 2
+
+
+async def test_revalidated_in_background_near_expiry(auth_server, client, monkeypatch):
+    _server, state = auth_server
+    assert await client.is_authorized()
+
+    monkeypatch.setattr(twitch, "TOKEN_REVALIDATE_MARGIN", 10_000.0)
+    assert await client.is_authorized()  # Still trusted while revalidating
+    await client._revalidate_task
+    assert state["validations"] == 2
+
+    client.settings.access_token = "other"
+    assert await client.is_authorized()
+    assert state["validations"] == 3
@@ -0,0 +1,159 @@
+"""Tests for Twitch EventSub stream push message handling."""
+
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from livestream_list.api import twitch_eventsub
+from livestream_list.api.twitch import TwitchApiClient
+from livestream_list.api.twitch_eventsub import TwitchStreamEventSub
+from livestream_list.core.settings import TwitchSettings
+
+
+def _notification(sub_type: str, broadcaster_id: str) -> dict:
+    return {
+        "metadata": {"message_type": "notification"},
+        "payload": {
+            "subscription": {"type": sub_type},
+            "event": {"broadcaster_user_id": broadcaster_id},
+        },
+    }
+
+
+def _welcome(session_id: str) -> dict:
+    return {
+        "metadata": {"message_type": "session_welcome"},
+        "payload": {"session": {"id": session_id, "keepalive_timeout_seconds": 10}},
+    }
+
+
+def test_notifications_map_to_logins_and_reconnects_requested():
+    events = []
+    push = TwitchStreamEventSub(
+        TwitchApiClient(TwitchSettings()), lambda login, online: events.append((login, online))
+    )
+    push._login_by_id = {"101": "Alpha"}
+
+    push._handle_message(_notification("stream.online", "101"))
+    push._handle_message(_notification("stream.offline", "101"))
+    push._handle_message(_notification("stream.online", "999"))
+    assert events == [("Alpha", True), ("Alpha", False)]
+
+    push._handle_message(
+        {
+            "metadata": {"message_type": "session_reconnect"},
+            "payload": {"session": {"reconnect_url": "wss://example.test/ws"}},
+        }
+    )
+    assert push._reconnect_url == "wss://example.test/ws"
+
+
+def test_revocation_drops_only_that_subscription():
+    coverage = []
+    push = TwitchStreamEventSub(
+        TwitchApiClient(TwitchSettings()), lambda login, online: None, coverage.append
+    )
+    push._login_by_id = {"101": "Alpha", "102": "Beta"}
+    push._set_covered({"Alpha", "Beta"})
+
+    push._handle_message(
+        {
+            "metadata": {"message_type": "revocation"},
+            "payload": {
+                "subscription": {
+                    "type": "stream.online",
+                    "status": "authorization_revoked",
+                    "condition": {"broadcaster_user_id": "101"},
+                }
+            },
+        }
+    )
+    assert push.covered == {"Beta"}
+    assert coverage[-1] == {"Beta"}
+    assert push._reconnect_url is None and not push._changed.is_set()
+
+
+async def test_session_reconnect_keeps_subscriptions(monkeypatch):
+    subscriptions = []
+    moved = asyncio.Event()
+
+    async def first(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json(_welcome("s1"))
+        while len(subscriptions) < 2:
+            await asyncio.sleep(0.01)
+        await ws.send_json(
+            {
+                "metadata": {"message_type": "session_reconnect"},
+                "payload": {"session": {"reconnect_url": str(server.make_url("/moved"))}},
+            }
+        )
+        # Twitch closes the old socket once the new one is welcomed
+        await moved.wait()
+        await ws.close()
+        return ws
+
+    async def second(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json(_welcome("s1"))
+        moved.set()
+        await ws.send_json(_notification("stream.online", "101"))
+        await ws.receive()
+        return ws
+
+    async def subscribe(request: web.Request) -> web.Response:
+        subscriptions.append(await request.json())
+        return web.json_response({}, status=202)
+
+    app = web.Application()
+    app.router.add_get("/ws", first)
+    app.router.add_get("/moved", second)
+    app.router.add_post("/subscriptions", subscribe)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(twitch_eventsub, "EVENTSUB_WS_URL", str(server.make_url("/ws")))
+    monkeypatch.setattr(
+        twitch_eventsub, "SUBSCRIPTIONS_URL", str(server.make_url("/subscriptions"))
+    )
+
+    client = TwitchApiClient(TwitchSettings())
+
+    async def get_user_ids(logins):
+        return {"alpha": "101"}
+
+    client.get_user_ids = get_user_ids
+    events = []
+    push = TwitchStreamEventSub(client, lambda login, online: events.append((login, online)))
+    push.set_channels(["alpha"])
+    push.start()
+    try:
+        for _ in range(200):
+            if events:
+                break
+            await asyncio.sleep(0.01)
+        assert events == [("alpha", True)]
+        # Subscriptions carried over; nothing was recreated
+        assert len(subscriptions) == 2
+        assert push.covered == {"alpha"}
+    finally:
+        await push.stop()
+        await client.close()
+        await server.close()
+
+
+def test_changes_past_the_subscription_budget_do_not_reconnect():
+    push = TwitchStreamEventSub(TwitchApiClient(TwitchSettings()), lambda login, online: None)
+    push.set_channels(["fav", "a", "b", "c"])
+    push._changed.clear()
+    # The session's limit was hit at "b"
+    push._within_budget = ["fav", "a"]
+
+    push.set_channels(["fav", "a", "c", "b", "d"])
+    assert not push._changed.is_set()
+    assert push._logins == ["fav", "a", "c", "b", "d"]
+
+    push.set_channels(["d", "fav", "a", "c", "b"])
+    assert push._changed.is_set()
@@ -0,0 +1,133 @@
+"""Tests for the two-tier Twitch GraphQL refresh."""
+
+import pytest
+
+from livestream_list.api.twitch import TwitchApiClient
+from livestream_list.core.models import Channel, StreamPlatform
+from livestream_list.core.settings import TwitchSettings
+
+
+class _FakeGql:
+    """Answers batch queries from scripted live state, recording each selection."""
+
+    def __init__(self) -> None:
+        self.live: dict[str, str] = {}  # login -> stream id
+        self.queries: list[dict[str, str]] = []  # login -> selection, per request
+        self.fail_details = False
+        self.sizers: list = []  # sizer reported to, per request
+
+    async def __call__(self, logins, fields=None, fields_by_login=None, sizer=None):
+        self.sizers.append(sizer)
+        selections = {login: (fields_by_login or {}).get(login, fields) for login in logins}
+        self.queries.append(selections)
+        if self.fail_details and all("title" in sel for sel in selections.values()):
+            return {}
+        result = {}
+        for login, selection in selections.items():
+            stream = None
+            if login in self.live:
+                stream = {"id": self.live[login], "type": "live"}
+                if "title" in selection:
+                    stream.update({"title": f"{login} title", "viewersCount": 12})
+            user = {"id": login, "stream": stream}
+            if "lastBroadcast" in selection:
+                user["lastBroadcast"] = {"startedAt": "2024-01-01T00:00:00Z"}
+            result[login] = user
+        return result
+
+
+@pytest.fixture
+def client():
+    client = TwitchApiClient(TwitchSettings())
+    gql = _FakeGql()
+    client._get_streams_gql_batch = gql
+    return client, gql
+
+
+CHANNELS = [Channel(channel_id=name, platform=StreamPlatform.TWITCH) for name in ("a", "b", "c")]
+
+
+async def test_details_fetched_only_for_live_channels(client):
+    client, gql = client
+    gql.live = {"b": "s1"}
+
+    streams = await client.get_livestreams(CHANNELS)
+    sweep, details = gql.queries
+    assert set(sweep) == {"a", "b", "c"}
+    assert all("title" not in sel and "lastBroadcast" in sel for sel in sweep.values())
+    assert list(details) == ["b"]
+
+    by_id = {ls.channel.channel_id: ls for ls in streams}
+    assert by_id["b"].live and by_id["b"].title == "b title" and by_id["b"].viewers == 12
+    assert not by_id["a"].live and by_id["a"].last_live_time.year == 2024
+
+
+async def test_last_broadcast_only_requested_on_first_sweep(client):
+    client, gql = client
+    await client.get_livestreams(CHANNELS)
+    gql.queries.clear()
+
+    streams = await client.get_livestreams(CHANNELS)
+    assert len(gql.queries) == 1  # nobody live, no detail query
+    assert all("lastBroadcast" not in sel for sel in gql.queries[0].values())
+    assert all(not ls.live and ls.last_live_time is None for ls in streams)
+
+
+async def test_failed_detail_query_reuses_details_for_same_stream(client):
+    client, gql = client
+    gql.live = {"a": "s1"}
+    await client.get_livestreams(CHANNELS)
+
+    gql.fail_details = True
+    streams = await client.get_livestreams(CHANNELS)
+    assert streams[0].live and streams[0].title == "a title"
+
+    # A new stream id must not inherit the previous stream's details; the
+    # channel is left out so the caller keeps its previous state
+    gql.live = {"a": "s2"}
+    streams = await client.get_livestreams(CHANNELS)
+    assert [ls.channel.channel_id for ls in streams] == ["b", "c"]
+
+
+async def test_forgotten_channel_gets_first_sweep_again(client):
+    client, gql = client
+    await client.get_livestreams(CHANNELS)
+    client.forget_channel("A")
+    gql.queries.clear()
+
+    await client.get_livestreams(CHANNELS)
+    sweep = gql.queries[0]
+    assert "lastBroadcast" in sweep["a"]
+    assert "lastBroadcast" not in sweep["b"]
+
+
+async def test_small_or_overlapping_lookups_do_not_tune(client):
+    client, gql = client
+    many = [Channel(channel_id=f"ch{i}", platform=StreamPlatform.TWITCH) for i in range(10)]
+
+    await client.get_livestreams(many)
+    assert gql.sizers == [client._sweep_sizer]
+    assert not client._sweep_sizer.in_round
+
+    # A one-channel lookup (e.g. confirming a push event) stays untuned
+    gql.sizers.clear()
+    await client.get_livestreams(many[:1])
+    assert gql.sizers == [None]
+
+    # So does a lookup that overlaps a refresh's round
+    gql.sizers.clear()
+    client._sweep_sizer.split(["x"] * 10)
+    await client.get_livestreams(many)
+    assert gql.sizers == [None]
+    assert client._sweep_sizer.in_round
+
+
+def test_gql_parallelism_can_grow():
+    client = TwitchApiClient(TwitchSettings())
+    for sizer in (client._sweep_sizer, client._detail_sizer):
+        start = sizer.parallelism
+        batches = sizer.split(list(range(sizer.batch_size * (start + 1))))
+        for batch in batches:
+            sizer.record(len(batch), 0.1)
+        sizer.end_round()
+        assert sizer.parallelism == start + 1
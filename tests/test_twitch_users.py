@@ -0,0 +1,133 @@
+"""Tests for the persistent Twitch identity cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from livestream_list.api import twitch
+from livestream_list.api.twitch import TwitchApiClient
+from livestream_list.api.twitch_identity import TwitchIdentityResolver
+from livestream_list.api.twitch_users import USER_TTL, TwitchUser, TwitchUserStore
+from livestream_list.core.settings import TwitchSettings
+
+
+def test_store_persists_and_follows_renames(tmp_path):
+    store = TwitchUserStore(tmp_path / "users.db")
+    store.put([TwitchUser("1", "Old", "Old", "https://img/1.png", verified_at=1.0)])
+    store.put([TwitchUser("1", "new", "New", verified_at=2.0)])
+    store.close()
+
+    reopened = TwitchUserStore(tmp_path / "users.db")
+    assert reopened.get_by_logins(["old"]) == {}
+    user = reopened.get_by_logins(["NEW"])["new"]
+    assert (user.id, user.display_name, user.profile_image_url) == ("1", "New", "https://img/1.png")
+    assert reopened.get_by_ids(["1", "2"]) == {"1": user}
+
+
+class _FakeLookup:
+    """Stands in for the GraphQL user query, recording each batch."""
+
+    def __init__(self, known: list[str]) -> None:
+        self.known = known
+        self.batches: list[list[str]] = []
+        self.fail = False
+
+    async def __call__(self, kind, keys):
+        self.batches.append(keys)
+        if self.fail:
+            return None
+        return {
+            key: TwitchUser(str(self.known.index(key)), key, key.title(), verified_at=time.time())
+            for key in keys
+            if key in self.known
+        }
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = TwitchApiClient(TwitchSettings(), TwitchUserStore(tmp_path / "users.db"))
+    lookup = _FakeLookup([f"user{i}" for i in range(120)])
+    client._fetch_users_gql = lookup
+    return client, lookup
+
+
+async def test_cold_lookups_batched_then_served_from_cache(client, monkeypatch):
+    client, lookup = client
+    monkeypatch.setattr(twitch, "USER_BATCH_SIZE", 50)
+    logins = [f"User{i}" for i in range(120)] + ["missing"]
+
+    users = await client.get_users_by_login(logins)
+    assert len(users) == 120 and users["user7"].display_name == "User7"
+    assert [len(batch) for batch in lookup.batches] == [50, 50, 21]
+
+    lookup.batches.clear()
+    assert (await client.get_user_ids(["user3"])) == {"user3": users["user3"].id}
+    assert lookup.batches == []
+
+
+async def test_expired_record_revalidated_and_kept_when_lookup_fails(client):
+    client, lookup = client
+    client._users.put([TwitchUser("42", "user1", "Stale", verified_at=time.time() - USER_TTL)])
+
+    lookup.fail = True
+    users = await client.get_users_by_login(["user1"])
+    assert lookup.batches == [["user1"]]
+    assert users["user1"].display_name == "Stale"
+
+    lookup.fail = False
+    users = await client.get_users_by_login(["user1"])
+    assert users["user1"].display_name == "User1"
+
+
+def test_resolver_shares_one_client_across_worker_loops(client):
+    client, lookup = client
+    client.settings.access_token = "token"
+    resolver = TwitchIdentityResolver()
+    resolver._clients[("", True)] = client
+    try:
+        # Each call runs on its own short-lived loop, like a chat worker
+        for _ in range(2):
+            users = asyncio.run(resolver.get_users_by_login(["User5"], access_token="token"))
+            assert users["user5"].id == "5"
+        assert lookup.batches == [["user5"]]
+        assert list(resolver._clients.values()) == [client]
+    finally:
+        resolver.shutdown()
+
+
+def test_resolver_replaces_client_when_token_changes(client):
+    client, _lookup = client
+    client.settings.access_token = "old"
+    resolver = TwitchIdentityResolver()
+    resolver._clients[("", True)] = client
+    closed = []
+
+    async def close() -> None:
+        closed.append(client)
+
+    async def current(shared: TwitchApiClient) -> TwitchApiClient:
+        return shared
+
+    client.close = close
+    try:
+        replacement = asyncio.run(resolver._run(current, "new", ""))
+        assert closed == [client]
+        assert replacement.settings.access_token == "new"
+        assert list(resolver._clients.values()) == [replacement]
+    finally:
+        resolver.shutdown()
+
+
+
+async def test_authenticated_user_falls_back_to_validated_login(client):
+    client, _lookup = client
+
+    async def authorized() -> bool:
+        client._current_user_id = "777"
+        return True
+
+    client.is_authorized = authorized
+    client.settings.login_name = "Someone"
+    user = await client.get_authenticated_user()
+    assert (user.id, user.login, user.display_name) == ("777", "someone", "Someone")
@@ -1,9 +1,11 @@
 """Tests for YouTube chat parsing functions."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from livestream_list.api.youtube import PageDataScanner
 from livestream_list.chat.connections.youtube import (
     _get_superchat_tier,
     parse_cookie_string,
@@ -125,6 +127,70 @@ def test_superchat_tier_negative():
     assert _get_superchat_tier(-1) == "BLUE"
 
 
+# --- PageDataScanner ---
+
+
+def _scan(
+    html: str, chunk_size: int = 7, wanted: set[str] | None = None
+) -> tuple[PageDataScanner, int]:
+    """Feed a page in small chunks; returns the scanner and bytes consumed."""
+    data = html.encode()
+    scanner = PageDataScanner(wanted)
+    consumed = 0
+    while consumed < len(data):
+        chunk = data[consumed : consumed + chunk_size]
+        consumed += len(chunk)
+        if scanner.feed(chunk):
+            break
+    scanner.close()
+    return scanner, consumed
+
+
+PLAYER = {"videoDetails": {"isLive": True, "title": "Braces } and </script> – ünï"}}
+# YouTube escapes "<" inside its inline JSON
+PLAYER_JSON = json.dumps(PLAYER, ensure_ascii=False).replace("<", "\\u003c")
+
+
+def test_scanner_stops_after_player_response():
+    tail = "<script>var ytInitialData = {};</script>" + "x" * 10_000
+    html = f"<html><script>var ytInitialPlayerResponse = {PLAYER_JSON};</script>{tail}"
+    scanner, consumed = _scan(html)
+    assert scanner.player_response == PLAYER
+    assert scanner.initial_data is None
+    assert consumed < len(html) - 9_000
+
+
+def test_scanner_falls_back_to_initial_data():
+    html = (
+        "<script>var ytInitialPlayerResponse = {broken</script>"
+        '<script>var ytInitialData = {"contents": {}};</script>'
+    )
+    scanner, _ = _scan(html)
+    assert scanner.player_response is None
+    assert scanner.initial_data == {"contents": {}}
+
+
+def test_scanner_wanted_initial_data_after_player_response():
+    html = (
+        f"<script>var ytInitialPlayerResponse = {PLAYER_JSON};</script>"
+        '<script>var ytInitialData = {"contents": {}};</script>' + "x" * 10_000
+    )
+    assert _scan(html)[0].initial_data is None
+
+    scanner, consumed = _scan(html, wanted={"ytInitialData"})
+    assert scanner.initial_data == {"contents": {}}
+    # The unwanted player response is skipped, not decoded
+    assert scanner.player_response is None
+    assert consumed < len(html) - 9_000
+
+
+def test_scanner_live_indicator_across_chunks():
+    scanner, _ = _scan('<meta itemprop="isLiveBroadcast" content="True">', chunk_size=5)
+    assert scanner.live_indicator
+    assert scanner.player_response is None and scanner.initial_data is None
+    assert not _scan("<html>offline</html>")[0].live_indicator
+
+
 # --- _get_all_concurrent_streams ---
 
 
@@ -261,3 +327,49 @@ class TestGetAllConcurrentStreams:
         assert len(result) == 1
         assert result[0].video_id == "fb1"
         await client.close()
+
+
+# --- get_livestreams yt-dlp second pass ---
+
+
+async def test_second_pass_reused_for_same_broadcast(yt_channel: Channel) -> None:
+    """yt-dlp runs once per video_id; later refreshes keep fresh scrape fields."""
+    from datetime import datetime, timezone
+
+    from livestream_list.api.youtube import YouTubeApiClient
+
+    settings = MagicMock()
+    settings.use_ytdlp_fallback = False
+    client = YouTubeApiClient(settings)
+    client._ytdlp_path = "/usr/bin/yt-dlp"
+
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    full = Livestream(
+        channel=yt_channel,
+        live=True,
+        video_id="vid1",
+        title="Old",
+        game="Chess",
+        viewers=10,
+        start_time=started,
+        thumbnail_url="https://i.ytimg.com/vi/vid1/maxresdefault_live.jpg",
+    )
+    scrapes = [
+        Livestream(channel=yt_channel, live=True, video_id="vid1", title=title, viewers=viewers)
+        for title, viewers in (("Old", 10), ("New", 99))
+    ]
+    ytdlp = MagicMock(return_value=full)
+
+    async def get_livestream_ytdlp(channel, video_id=None):
+        return ytdlp(video_id)
+
+    with patch.object(client, "_get_livestream_ytdlp", get_livestream_ytdlp):
+        for scrape in scrapes:
+            with patch.object(client, "_get_all_concurrent_streams", return_value=[scrape]):
+                result = await client.get_livestreams([yt_channel])
+
+    ytdlp.assert_called_once_with("vid1")
+    assert (result[0].title, result[0].viewers) == ("New", 99)
+    assert (result[0].start_time, result[0].game) == (started, "Chess")
+    assert result[0].thumbnail_url == full.thumbnail_url
+    await client.close()
@@ -0,0 +1,64 @@
+"""Tests for the persistent yt-dlp worker pool."""
+
+import sys
+
+import pytest
+
+from livestream_list.api.ytdlp_pool import YtDlpPool, YtDlpPoolUnavailableError, options_from_args
+
+# Speaks the ytdlp_worker.py protocol: "slow" URLs hang, "error" URLs fail,
+# anything else echoes the URL, options and worker pid.
+FAKE_WORKER = """
+import json, os, sys, time
+for line in sys.stdin:
+    request = json.loads(line)
+    if "slow" in request["url"]:
+        time.sleep(60)
+    if "error" in request["url"]:
+        reply = {"error": "DownloadError: unavailable"}
+    else:
+        reply = {"data": {**request, "pid": os.getpid()}}
+    print(json.dumps(reply), flush=True)
+"""
+
+
+@pytest.fixture
+async def pool():
+    pool = YtDlpPool(size=1, job_timeout=1.0, command=[sys.executable, "-c", FAKE_WORKER])
+    yield pool
+    await pool.close()
+
+
+def test_options_from_args():
+    assert options_from_args(None) == {}
+    assert options_from_args(["--flat-playlist", "--playlist-items", "1"]) == {
+        "extract_flat": "in_playlist",
+        "playlist_items": "1",
+    }
+    assert options_from_args(["--cookies", "jar.txt"]) is None
+
+
+async def test_worker_reused_across_jobs(pool):
+    first = await pool.extract("https://example/1", {"playlist_items": "1"})
+    assert first["url"] == "https://example/1"
+    assert first["options"] == {"playlist_items": "1"}
+    second = await pool.extract("https://example/2", {})
+    assert second["pid"] == first["pid"]
+
+    # A per-job yt-dlp error leaves the worker in place
+    assert await pool.extract("https://example/error", {}) is None
+    assert (await pool.extract("https://example/3", {}))["pid"] == first["pid"]
+
+
+async def test_timed_out_worker_replaced(pool):
+    first = await pool.extract("https://example/1", {})
+    assert await pool.extract("https://example/slow", {}) is None
+    after = await pool.extract("https://example/2", {})
+    assert after["url"] == "https://example/2"
+    assert after["pid"] != first["pid"]
+
+
+async def test_unavailable_after_close(pool):
+    await pool.close()
+    with pytest.raises(YtDlpPoolUnavailableError):
+        await pool.extract("https://example/1", {})